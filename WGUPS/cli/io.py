@@ -4,7 +4,7 @@ from pathlib import Path
 # Project Imports
 from WGUPS.core import Ruler
 from WGUPS.models import Address, Coordinate, Package
-from WGUPS.structures import Graph, HashTable
+from WGUPS.structures import CondensedGraph, DenseGraph, Graph, HashTable, LazyGraph, Precision
 # Package Imports
 from .environment import cls
 from .style import Style
@@ -189,8 +189,8 @@ def build_packages(path: Path, addresses: list[Address]) -> HashTable[int, Packa
             # TODO: implement way for user to correct & retry or else skip for junk data
         return None
 
-    packages: HashTable[int, Package] = HashTable()
     lines = _parse_csv(path)[1:]
+    packages: HashTable[int, Package] = HashTable(expected=len(lines))
     print(f'Building{Style.END} {Style.RED1}{Style.UNDERLINE}Packages{Style.END}')
     from WGUPS.cli.environment import progress
     for row in progress(lines):
@@ -206,14 +206,15 @@ def build_packages(path: Path, addresses: list[Address]) -> HashTable[int, Packa
         package_mass = int(package_data[1])
         package_notes = package_data[2]
 
-        from WGUPS.models import PackageStatus
+        from WGUPS.models import PackageStatus, parse_notes
         new_package = Package(id=package_id,
                               address=package_address,
                               mass=package_mass,
                               notes=package_notes,
                               status=PackageStatus.Hub,
                               _deadline=package_deadline,
-                              _delivered=None
+                              _delivered=None,
+                              constraints=parse_notes(package_notes, package_deadline)
                               )
         # TODO: implement safe hashing for packages, so handling for updating package data can be implemented
         #       note: this may not be needed if the id is placed in the hashtable as the key
@@ -227,8 +228,22 @@ def build_packages(path: Path, addresses: list[Address]) -> HashTable[int, Packa
     return packages
 
 
-def build_graph(path: Path) -> tuple[Graph[Address], list[Address]]:
-    """Reads in distance data and performs setup on the graph data structure"""
+def build_graph(path: Path, use_cache: bool = True, precision: Precision | None = None, workers: int = 1,
+                block_rows: int = 256, lazy_rows: int | None = None) -> tuple[Graph[Address], list[Address]]:
+    """
+    Reads in distance data and performs setup on the graph data structure
+
+    Distances are cached on disk in a '.cache' folder beside the data file,
+    an unchanged data file maps its distances back in rather than recomputing them
+
+    By default a DenseGraph is built, holding every distance in one 2D array.
+    If a precision is given, a CondensedGraph is built instead, storing each distance once at that precision
+
+    With more than one worker, distances are computed in a process pool, block_rows rows at a time
+
+    If lazy_rows is given, nothing is computed up front. A LazyGraph computes each row of distances
+    the first time it is read, and keeps at most lazy_rows of them
+    """
     #
     # Helper methods
     #
@@ -257,23 +272,46 @@ def build_graph(path: Path) -> tuple[Graph[Address], list[Address]]:
     # Data Processing
     #
     addresses = parse_gps_data(path)
-    new_graph: Graph[Address] = Graph()
     new_ruler = Ruler(unit=Ruler.Units.Miles, calc_method=Ruler.calc_method.Vincenty)
 
-    from WGUPS.cli.environment import progress
     print(f'Processing{Style.END} {Style.RED1}{Style.UNDERLINE}Locations{Style.END}\n')
-    # add all vertices
-    print('Computing addresses')
-    for address in progress(addresses):
-        new_graph.add_vertex(address)
-    print(f'{Style.GREEN1}  {new_graph.vertex_sum()} addresses.{Style.END}\n')
-
-    # add all edges
-    print('Computing connections')
-    for source in progress(it=addresses, steps=len(addresses) ** 2):
-        for destination in addresses:
-            distance = new_ruler.compute_distance(source.coordinate, destination.coordinate)
-            new_graph.add_edge(source, destination, distance)
+
+    if lazy_rows is not None:
+        # distances are computed a row at a time, the first time they are read
+        print('Deferring connections')
+        new_graph = LazyGraph(new_ruler, max_rows=lazy_rows)
+        for address in addresses:
+            new_graph.add_vertex(address)
+    else:
+        # compute every distance at once
+        print('Computing connections')
+        coordinates = [address.coordinate for address in addresses]
+        distances = None
+        if use_cache:
+            # the cached matrix is memory-mapped, on a miss it is computed a block of rows at a time into the file,
+            # so it is never held in memory as a whole, and either graph copies its edges straight out of it
+            from WGUPS.core.cache import DistanceCache
+            cache = DistanceCache(directory=Path(path).parent / '.cache')
+            distances = cache.matrix(coordinates, new_ruler, name=Path(path).stem,
+                                     workers=workers, block_rows=block_rows)
+            if cache.hits:
+                print(f'{Style.GREEN1}  Loaded cached distances.{Style.END}')
+        elif precision is None:
+            distances = new_ruler.compute_matrix(coordinates, workers=workers, block_rows=block_rows)
+
+        if distances is None:
+            # without a cache, only the upper triangle is computed, a block at a time into the condensed storage
+            blocks = new_ruler.compute_row_blocks(coordinates, upper=True, workers=workers, block_rows=block_rows)
+            new_graph = CondensedGraph.from_upper_blocks(addresses, blocks, precision)
+        elif precision is not None:
+            # the condensed graph copies the upper triangle straight out of the matrix
+            new_graph = CondensedGraph.from_matrix(addresses, distances, precision)
+        else:
+            # every address gets an integer id, and the matrix is copied in as the edges
+            new_graph = DenseGraph.from_matrix(addresses, distances)
+        if new_ruler.fallbacks:
+            print(f'{Style.YELLOW2}  {new_ruler.fallbacks} distances fell back to Haversine.{Style.END}')
+    print(f'{Style.GREEN1}  {new_graph.vertex_sum()} addresses.{Style.END}')
     print(f'{Style.GREEN1}  {new_graph.edge_sum()} connections.{Style.END}\n')
     input(f"Done.\n"
           f"Press <{Style.RED1}Enter{Style.END}> to continue ..."
@@ -1,2 +1,6 @@
 from .ruler import *
 from .tsp import *
+from .cache import *
+from .paths import *
+from .travel import *
+from .hierarchy import *
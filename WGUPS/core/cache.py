@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+# STL Imports
+import hashlib
+import os
+from pathlib import Path
+
+# Project Imports
+from WGUPS.core.ruler import Ruler
+
+# bump whenever the layout of cached files, or the math that produces them, changes
+_CACHE_VERSION = 1
+
+
+class DistanceCache:
+    """
+    On-disk store for distance matrices computed by a Ruler.
+
+    Matrices are saved as .npy files, and mapped back into memory on later runs rather than recomputed.
+    Each file is keyed by a hash of the coordinates and the Ruler settings that produced it,
+    so a changed address book or Ruler is a cache miss, and the stale file is replaced.
+    A .sha256 sidecar holds a digest of the matrix itself, so a corrupted or tampered file is a miss as well.
+
+    Big-O Analysis:
+        Hit:  O(n^2) to verify the digest, a sequential read of the memory-mapped file
+        Miss: the cost of Ruler.compute_matrix(), plus O(n^2) to write the file and its digest.
+              Rows are computed a block at a time straight into the file, so the matrix is never held in memory
+    """
+
+    def __init__(self, directory: Path | str):
+        self._directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def matrix(self, coords, ruler: Ruler, name: str = 'distances', precision: int = 1,
+               workers: int = 1, block_rows: int = 256):
+        """
+        Retrieves the distance matrix for the given coordinates from disk, computing and storing it on a miss
+
+        Args:
+            coords: Sequence[Coordinate] | array-like of shape (n, 2)
+            ruler: Ruler, the method and units used to compute distances
+            name: str, prefix for the cache file, typically the stem of the source data file
+            precision: int, number of decimal places distances are rounded to
+            workers: int, processes used to compute the matrix on a miss, see Ruler.compute_row_blocks()
+            block_rows: int, rows computed at a time on a miss
+
+        Returns: numpy.ndarray of shape (n, n), read-only and memory-mapped
+
+        """
+        key = self.key(coords, ruler, precision)
+        path = self._directory / f'{name}-{key[:32]}.npy'
+
+        cached = self._load(path, len(coords))
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        blocks = ruler.compute_row_blocks(coords, precision=precision, workers=workers, block_rows=block_rows)
+        computed = self._store(path, len(coords), blocks)
+        self._remove_stale(name, path)
+        return computed
+
+    @staticmethod
+    def key(coords, ruler: Ruler, precision: int = 1) -> str:
+        """
+        Hashes the parsed coordinates together with everything that affects the computed distances
+
+        Returns: str, a hex digest
+
+        """
+        import numpy as np
+
+        ϕ, λ = Ruler._to_radians(coords)
+        digest = hashlib.sha256()
+        digest.update(f'v{_CACHE_VERSION}:{ruler.calc_method.name}:{ruler.unit.value}:'
+                      f'{ruler.max_iterations}:{precision}:{ϕ.size}:'.encode())
+        digest.update(np.ascontiguousarray(ϕ).tobytes())
+        digest.update(np.ascontiguousarray(λ).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _load(path: Path, n: int):
+        """
+        Memory-maps a cached matrix, validating it against its digest first
+
+        Returns: numpy.ndarray | None, None if the file or its digest is missing, or the file is corrupt
+
+        """
+        import numpy as np
+
+        sidecar = DistanceCache._sidecar(path)
+        if not path.is_file():
+            return None
+        try:
+            expected = sidecar.read_text(encoding='ascii').strip()
+        except (OSError, UnicodeDecodeError):
+            # written before digests were kept, or the write was interrupted
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            matrix = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError, EOFError):
+            # unreadable header, or the file is shorter than its header claims
+            path.unlink(missing_ok=True)
+            sidecar.unlink(missing_ok=True)
+            return None
+
+        # the shape and type must match before the contents are worth hashing
+        if matrix.shape != (n, n) or matrix.dtype != np.float64 \
+                or not matrix.flags.c_contiguous or DistanceCache._digest(matrix) != expected:
+            del matrix
+            path.unlink(missing_ok=True)
+            sidecar.unlink(missing_ok=True)
+            return None
+        return matrix
+
+    def _store(self, path: Path, n: int, blocks):
+        """
+        Writes blocks of rows, from Ruler.compute_row_blocks(), into a memory-mapped temporary file,
+        so a partially written cache is never picked up
+
+        Returns: numpy.ndarray of shape (n, n), the stored matrix, read-only and memory-mapped
+
+        """
+        import numpy as np
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix('.tmp')
+        try:
+            out = np.lib.format.open_memmap(temp, mode='w+', dtype=np.float64, shape=(n, n))
+            for start, block in blocks:
+                out[start:start + len(block)] = block
+            out.flush()
+            digest = self._digest(out)
+            del out
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        # the matrix lands before its digest, an interruption in between leaves a mismatch, which is a miss
+        sidecar = self._sidecar(path)
+        temp_sidecar = sidecar.with_suffix('.sha256.tmp')
+        temp_sidecar.write_text(digest, encoding='ascii')
+        os.replace(temp, path)
+        os.replace(temp_sidecar, sidecar)
+        return np.load(path, mmap_mode='r', allow_pickle=False)
+
+    @staticmethod
+    def _sidecar(path: Path) -> Path:
+        return path.with_suffix('.sha256')
+
+    @staticmethod
+    def _digest(matrix) -> str:
+        """Hashes the raw bytes of a C-contiguous float64 matrix"""
+        return hashlib.sha256(memoryview(matrix).cast('B')).hexdigest()
+
+    def _remove_stale(self, name: str, current: Path) -> None:
+        """Removes caches built from previous versions of the same source"""
+        for stale in self._directory.glob(f'{name}-*.npy'):
+            if stale != current:
+                stale.unlink(missing_ok=True)
+                self._sidecar(stale).unlink(missing_ok=True)
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+# Standard Library
+import heapq
+import inspect
+from math import inf
+from pathlib import Path
+from typing import Generic, TypeVar
+
+# Project Imports
+from WGUPS.util import debug
+
+T = TypeVar('T')
+
+# bump whenever the layout of saved hierarchies changes
+_FORMAT_VERSION = 2
+
+# how the vertex table is stored, vertices must all be of one of these kinds
+_ADDRESS_VERTICES = 0   # an interned address table, see graphfile.pack_addresses()
+_INT_VERTICES = 1       # an int64 array
+_STR_VERTICES = 2       # utf-8 strings, as offsets into one blob
+
+
+class ContractionHierarchy(Generic[T]):
+    """
+    Contraction hierarchy over a road network, for fast repeated point-to-point queries.
+
+    Preprocessing contracts vertices one at a time, least important first, adding shortcut edges wherever a
+    shortest path ran through the contracted vertex. A query then runs a bidirectional Dijkstra that only ever
+    moves 'up' the hierarchy, which settles a tiny fraction of the vertices a plain Dijkstra would.
+
+    Shortcuts remember the vertex they bypass, so full paths can be unpacked back into network vertices.
+    The hierarchy can be saved and loaded, so it is built once per network.
+
+    Big-O Analysis:
+        Build: roughly O(V•(d^2)•w), for average degree d and witness search size w
+        Query: O(k•logk), for the k vertices in the upward search spaces (typically hundreds, even for large V)
+    """
+
+    def __init__(self, vertices: list[T], rank: list[int],
+                 up_out: list[dict[int, tuple[float, int]]], up_in: list[dict[int, tuple[float, int]]]):
+        self._vertices = vertices
+        self._ids: dict[T, int] = {vert: i for i, vert in enumerate(vertices)}
+        self._rank = rank
+        # up_out[v]: edges v -> w with rank[w] > rank[v], as w: (distance, bypassed vertex or -1)
+        # up_in[v]:  edges u -> v with rank[u] > rank[v], as u: (distance, bypassed vertex or -1)
+        self._up_out = up_out
+        self._up_in = up_in
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def __repr__(self):
+        shortcuts = sum(1 for edges in (self._up_out, self._up_in) for row in edges for _, m in row.values() if m >= 0)
+        return f'ContractionHierarchy(vertices={len(self._vertices)}, shortcuts={shortcuts})'
+
+    #
+    # Preprocessing
+    #
+    @classmethod
+    def build(cls, graph, settle_limit: int = 64) -> ContractionHierarchy[T]:
+        """
+        Contracts every vertex of a graph, where graph[v].items() yields (neighbor, distance) pairs
+
+        Args:
+            graph: Graph[T] | DenseGraph[T] | GraphOverlay[T], typically a sparse road network
+            settle_limit: int, vertices a witness search may settle before giving up and adding the shortcut.
+                          Lower is faster to build, at the cost of a few unnecessary shortcuts
+
+        Returns: ContractionHierarchy[T]
+
+        """
+        vertices = list(graph.vertices)
+        ids = {vert: i for i, vert in enumerate(vertices)}
+        n = len(vertices)
+
+        # working copy of the network, shortcuts are added as vertices are contracted
+        out: list[dict[int, tuple[float, int]]] = [{} for _ in range(n)]
+        inn: list[dict[int, tuple[float, int]]] = [{} for _ in range(n)]
+        for v, vert in enumerate(vertices):
+            neighbors = graph[vert]
+            if neighbors is None:
+                continue
+            for neighbor, dist in neighbors.items():
+                w = ids.get(neighbor)
+                if dist is None or w is None or w == v:
+                    continue
+                if dist < out[v].get(w, (inf, -1))[0]:
+                    out[v][w] = (dist, -1)
+                    inn[w][v] = (dist, -1)
+
+        contracted = [False] * n
+        deleted_neighbors = [0] * n
+        rank = [0] * n
+
+        def _witness(source: int, skip: int, limit: float) -> dict[int, float]:
+            """Local Dijkstra from source, avoiding skip and contracted vertices, up to limit"""
+            dist = {source: 0.0}
+            heap = [(0.0, source)]
+            settled = 0
+            while heap and settled < settle_limit:
+                d, x = heapq.heappop(heap)
+                if d > dist[x]:
+                    continue
+                if d > limit:
+                    break
+                settled += 1
+                for y, (w, _) in out[x].items():
+                    if y == skip or contracted[y]:
+                        continue
+                    if d + w < dist.get(y, inf):
+                        dist[y] = d + w
+                        heapq.heappush(heap, (d + w, y))
+            return dist
+
+        def _shortcuts(v: int) -> list[tuple[int, int, float]]:
+            """Shortcuts needed to contract v, i.e. u -> v -> w paths with no witness path as short"""
+            needed = []
+            outgoing = [(w, d) for w, (d, _) in out[v].items() if not contracted[w]]
+            for u, (du, _) in inn[v].items():
+                if contracted[u]:
+                    continue
+                targets = [(w, du + dw) for w, dw in outgoing if w != u]
+                if not targets:
+                    continue
+                witness = _witness(u, v, max(d for _, d in targets))
+                for w, d in targets:
+                    if witness.get(w, inf) > d:
+                        needed.append((u, w, d))
+            return needed
+
+        def _priority(v: int) -> int:
+            """Edge difference, plus the number of contracted neighbors to spread contraction evenly"""
+            removed = sum(1 for u in inn[v] if not contracted[u]) + sum(1 for w in out[v] if not contracted[w])
+            return len(_shortcuts(v)) - removed + deleted_neighbors[v]
+
+        # lazy updates: a popped vertex is re-evaluated, and pushed back if it is no longer the least important
+        queue = [(_priority(v), v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            if contracted[v]:
+                continue
+            current = _priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, d in _shortcuts(v):
+                if d < out[u].get(w, (inf, -1))[0]:
+                    out[u][w] = (d, v)
+                    inn[w][u] = (d, v)
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+            for x in set(inn[v]) | set(out[v]):
+                deleted_neighbors[x] += 1
+
+        up_out = [{w: e for w, e in out[v].items() if rank[w] > rank[v]} for v in range(n)]
+        up_in = [{u: e for u, e in inn[v].items() if rank[u] > rank[v]} for v in range(n)]
+        return cls(vertices, rank, up_out, up_in)
+
+    #
+    # Queries
+    #
+    def distance(self, source: T, target: T) -> float | None:
+        """
+        Shortest path distance between two network vertices
+
+        Returns: float | None, None if the target is unreachable
+
+        """
+        d, _ = self._query(source, target)
+        return d
+
+    def path(self, source: T, target: T) -> list[T] | None:
+        """
+        Shortest path between two network vertices, with shortcuts unpacked
+
+        Returns: list[T] | None, source first and target last, None if the target is unreachable
+
+        """
+        d, ids = self._query(source, target, want_path=True)
+        if d is None:
+            return None
+        return [self._vertices[i] for i in ids]
+
+    def _query(self, source: T, target: T, want_path: bool = False) -> tuple[float | None, list[int]]:
+        """Bidirectional Dijkstra over the upward edges, stopping once neither side can beat the best meeting"""
+        s, t = self._ids.get(source), self._ids.get(target)
+        if s is None or t is None:
+            return None, []
+        if s == t:
+            return 0.0, [s]
+
+        dist = ({s: 0.0}, {t: 0.0})
+        pred: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        heaps = ([(0.0, s)], [(0.0, t)])
+        edges = (self._up_out, self._up_in)
+        best, meet = inf, -1
+
+        while heaps[0] or heaps[1]:
+            # expand whichever side has the smaller tentative distance
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            d, v = heapq.heappop(heaps[side])
+            if d >= best:
+                # nothing left on this side can improve on the best meeting point
+                heaps[side].clear()
+                continue
+            if d > dist[side][v]:
+                continue
+            other = dist[1 - side].get(v)
+            if other is not None and d + other < best:
+                best, meet = d + other, v
+            for w, (weight, _) in edges[side][v].items():
+                if d + weight < dist[side].get(w, inf):
+                    dist[side][w] = d + weight
+                    pred[side][w] = v
+                    heapq.heappush(heaps[side], (d + weight, w))
+
+        if meet < 0:
+            return None, []
+        if not want_path:
+            return best, []
+
+        # rebuild the up-then-down path through the meeting vertex, then unpack each shortcut
+        forward = [meet]
+        while forward[-1] != s:
+            forward.append(pred[0][forward[-1]])
+        forward.reverse()
+        backward = [meet]
+        while backward[-1] != t:
+            backward.append(pred[1][backward[-1]])
+        hops = forward + backward[1:]
+
+        path = [s]
+        for a, b in zip(hops, hops[1:]):
+            path.extend(self._unpack(a, b)[1:])
+        return best, path
+
+    def _unpack(self, u: int, w: int) -> list[int]:
+        """Expands the edge u -> w into the original network vertices it stands for"""
+        edge = self._edge(u, w)
+        if edge[1] < 0:
+            return [u, w]
+        middle = edge[1]
+        return self._unpack(u, middle) + self._unpack(middle, w)[1:]
+
+    def _edge(self, u: int, w: int) -> tuple[float, int]:
+        """Finds edge u -> w, stored on whichever end ranks lower"""
+        if self._rank[u] < self._rank[w]:
+            return self._up_out[u][w]
+        return self._up_in[w][u]
+
+    #
+    # Serialization
+    #
+    def save(self, path: Path | str) -> None:
+        """
+        Saves the hierarchy as a compressed .npz file, edges in compressed sparse row form.
+        Everything is stored as plain arrays, vertices must be all addresses, all ints, or all strings,
+        so loading a file never unpickles anything.
+        """
+        import numpy as np
+
+        arrays = {'version': np.array([_FORMAT_VERSION], dtype=np.int64),
+                  'rank': np.array(self._rank, dtype=np.int64)}
+        arrays.update(_pack_vertices(self._vertices))
+        for name, edges in (('out', self._up_out), ('in', self._up_in)):
+            offsets = np.zeros(len(edges) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(row) for row in edges])
+            arrays[f'{name}_offsets'] = offsets
+            arrays[f'{name}_targets'] = np.array([w for row in edges for w in row], dtype=np.int64)
+            arrays[f'{name}_weights'] = np.array([e[0] for row in edges for e in row.values()], dtype=np.float64)
+            arrays[f'{name}_middles'] = np.array([e[1] for row in edges for e in row.values()], dtype=np.int64)
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+
+    @classmethod
+    def load(cls, path: Path | str) -> ContractionHierarchy:
+        """
+        Loads a hierarchy saved with save(), checking the shape and range of every array before it is used
+
+        Returns: ContractionHierarchy
+
+        """
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            version = _array(data, 'version', np.int64)
+            if version.shape != (1,) or int(version[0]) != _FORMAT_VERSION:
+                raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+            rank = _array(data, 'rank', np.int64)
+            n = len(rank)
+            if rank.ndim != 1 or sorted(rank.tolist()) != list(range(n)):
+                raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+            vertices = _unpack_vertices(data, n)
+            edges = []
+            for name in ('out', 'in'):
+                offsets = _array(data, f'{name}_offsets', np.int64)
+                targets = _array(data, f'{name}_targets', np.int64)
+                weights = _array(data, f'{name}_weights', np.float64)
+                middles = _array(data, f'{name}_middles', np.int64)
+                m = len(targets)
+                if offsets.shape != (n + 1,) or weights.shape != (m,) or middles.shape != (m,) \
+                        or (n and (offsets[0] != 0 or offsets[-1] != m or np.any(np.diff(offsets) < 0))) \
+                        or (m and (targets.min() < 0 or targets.max() >= n
+                                   or middles.min() < -1 or middles.max() >= n)):
+                    raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+                offsets, targets = offsets.tolist(), targets.tolist()
+                weights, middles = weights.tolist(), middles.tolist()
+                edges.append([{targets[k]: (weights[k], middles[k]) for k in range(offsets[v], offsets[v + 1])}
+                              for v in range(n)])
+        return cls(vertices, rank.tolist(), edges[0], edges[1])
+
+
+def _array(data, name: str, dtype):
+    """Reads one array from a loaded .npz file, it must be present, one dimensional, and of the expected type"""
+    import numpy as np
+    if name not in data.files:
+        raise ValueError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+    array = data[name]
+    if array.ndim != 1 or array.dtype != np.dtype(dtype):
+        raise ValueError(debug.debug_msg(debug.Error.TYPE, inspect.currentframe()))
+    return array
+
+
+def _pack_vertices(vertices: list) -> dict:
+    """Encodes the vertex table as plain arrays, see the vertex kinds above"""
+    import numpy as np
+    from WGUPS.models.address import Address
+    from WGUPS.structures.graphfile import pack_addresses
+
+    if all(isinstance(v, Address) for v in vertices):
+        table, offsets, blob = pack_addresses(vertices)
+        return {'vertex_kind': np.array([_ADDRESS_VERTICES], dtype=np.int64),
+                'vertex_table': table,
+                'vertex_offsets': offsets.astype(np.int64),
+                'vertex_blob': np.frombuffer(blob, dtype=np.uint8)}
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in vertices):
+        return {'vertex_kind': np.array([_INT_VERTICES], dtype=np.int64),
+                'vertex_ids': np.array(vertices, dtype=np.int64)}
+    if all(isinstance(v, str) for v in vertices):
+        encoded = [v.encode('utf-8') for v in vertices]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+        return {'vertex_kind': np.array([_STR_VERTICES], dtype=np.int64),
+                'vertex_offsets': offsets,
+                'vertex_blob': np.frombuffer(b''.join(encoded), dtype=np.uint8)}
+    raise TypeError(debug.debug_msg(debug.Error.TYPE, inspect.currentframe()))
+
+
+def _unpack_vertices(data, n: int) -> list:
+    """Decodes the vertex table written by _pack_vertices(), which must hold n vertices"""
+    import numpy as np
+    from WGUPS.structures.graphfile import unpack_addresses, vertex_dtype
+
+    kind = _array(data, 'vertex_kind', np.int64)
+    if kind.shape != (1,):
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    kind = int(kind[0])
+    if kind == _INT_VERTICES:
+        ids = _array(data, 'vertex_ids', np.int64)
+        if ids.shape != (n,):
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        return ids.tolist()
+
+    offsets = _array(data, 'vertex_offsets', np.int64)
+    blob = _array(data, 'vertex_blob', np.uint8).tobytes()
+    if len(offsets) == 0 or offsets[0] != 0 or np.any(np.diff(offsets) < 0) or offsets[-1] > len(blob):
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    if kind == _STR_VERTICES:
+        if offsets.shape != (n + 1,):
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        offsets = offsets.tolist()
+        return [blob[offsets[k]:offsets[k + 1]].decode('utf-8') for k in range(n)]
+    if kind == _ADDRESS_VERTICES:
+        if 'vertex_table' not in data.files:
+            raise ValueError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        table = data['vertex_table']
+        if table.dtype != vertex_dtype() or table.shape != (n,):
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        return unpack_addresses(table, offsets, blob)
+    raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
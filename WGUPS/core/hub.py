@@ -3,19 +3,37 @@ from __future__ import annotations
 # STL
 import math
 import operator
-import time
-from copy import copy, deepcopy
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from copy import copy
+from datetime import datetime
+from enum import IntEnum
+from typing import Iterator
 
 # Project Imports
 from WGUPS.cli.style import Style
+from WGUPS.structures.disjointset import DisjointSet
 from WGUPS.structures.graph import Graph
 from WGUPS.structures.hashtable import HashTable
+from WGUPS.structures.heap import HeapHandle, IndexedHeap
+from WGUPS.structures.index import HashIndex, SortedIndex
+from WGUPS.structures.skiplist import SkipList
+from WGUPS.structures.textindex import TextIndex
 from WGUPS.models.address import Address
 from WGUPS.models.package import Package, PackageStatus
 from WGUPS.models.truck import Truck
 
 
+class DispatchEvent(IntEnum):
+    """Moments when the packages a truck can load may change, events at the same time are handled in this order"""
+    Release = 0         # a late package arrives, or an address correction is received
+    TruckReturn = 1     # a truck is back at the hub, ready for its next trip
+
+
+def _load_priority(package: Package) -> tuple[datetime, int]:
+    """Earliest deadline first, and of equal deadlines the higher id, the order packages have always been loaded in"""
+    return package.deadline, -int(package.id)
+
+
 class Hub:
     # primary data structures
     _addresses: list[Address]
@@ -23,6 +41,14 @@ class Hub:
     _packages: HashTable[int, Package]
     _trucks: list[Truck]
 
+    # secondary indexes over the package store, kept in step with it by _update_master
+    _by_city: HashIndex[str]
+    _by_zip: HashIndex[str]
+    _by_weight: HashIndex[float]
+    _by_deadline: SortedIndex[datetime]
+    _by_street: TextIndex
+    _indexed: HashTable[int, tuple[str, str, str, float, datetime, datetime]]
+
     # various package 'views'
     _delayed: set[Package]
     _dependencies: set[Package]
@@ -31,14 +57,26 @@ class Hub:
     _priority: set[Package]
     _standard: set[Package]
 
-    # package 'views' by state
-    _delivered: list[Package]
+    # package 'views' by state, delivered packages ordered by (delivery time, -id)
+    _deliveries: SkipList[tuple[datetime, int], int]
+
+    # for separating packages with dependencies into their resolved groupings, chain id -> packages
+    _dependency_chains: HashTable[int, list[Package]]
+    _chain_ids: HashTable[int, int]     # package id -> chain id
 
-    # for separating packages with dependencies into their resolved groupings
-    _dependency_chains: list[list[Package]]
+    # packages that can't be loaded from the start of the day, ordered by the time they become loadable
+    _release_times: list[datetime]
+    _release_ids: list[int]
+    _released: int                  # held packages before this position have been moved into the queue
+
+    # loading queues, every package that can be loaded and isn't on a truck yet, earliest deadline first,
+    # one queue per truck mask, so a truck only ever looks at the packages it is allowed to carry
+    _queues: HashTable[int, IndexedHeap[Package]]   # truck mask -> packages with that mask
+    _queued: HashTable[int, HeapHandle[Package]]    # package id -> its place in its queue
+    _unloaded: int                  # packages not yet loaded, queued or held
 
     # additional data structures for data related to delivery trips
-    _trips: dict[datetime, tuple[int, list[int]]]
+    _trips: SkipList[tuple[datetime, int], tuple[int, list[int]]]     # (departure, truck id) -> trip
     _trip_distances: list[list[float]]
     _departure_times: list[datetime]
 
@@ -48,6 +86,7 @@ class Hub:
         self._graph = graph
         self._packages = packages
         self._trucks = [Truck(i) for i in range(num_trucks)]
+        self._build_indexes()
         # END Initialize primary data structures
 
         # BEGIN Initialization of Package Categories
@@ -62,23 +101,33 @@ class Hub:
         # A variable containing the hub address, so it can be retrieved easily
         self.HUB = self._addresses[0]
 
-        # A variable for tracking remaining packages
-        self._remaining = [package for package in self._packages]
-
         # generates a few statistics about the dataset and displays to the user
         self._generate_views()
 
         # BEGIN Dependency Computations
-        self._dependency_chains = list()
+        self._dependency_chains = HashTable()
+        self._chain_ids = HashTable()
         # Compute Dependency Chains,
         # mostly a lot of set math occurring here i.e. intersection, union.
         self._compute_dependency_chains()
         # END Dependency Computations
 
+        self._schedule_releases()
+
+        # BEGIN Initialization of the Loading Queues
+        self._queues = HashTable()
+        self._queued = HashTable(expected=len(self._packages))
+        self._released = 0
+        self._unloaded = len(self._packages)
+        for package in self._packages:
+            if package.constraints.earliest is None:
+                self._enqueue(package)
+        # END Initialization of the Loading Queues
+
         # BEGIN Initialization of Truck Related Data Structures
 
-        # a default dict for holding trips by truck
-        self._trips = {}
+        # trips of every truck, ordered by departure time
+        self._trips = SkipList()
 
         # some oddball math for determining how many trips each truck may take, this should be reworked
         # as it relies on a hard-coded truck capacity
@@ -93,16 +142,9 @@ class Hub:
         self._trip_distances = [copy(dummy) for _ in range(len(self._trucks))]
 
         today = datetime.today()
-        # initialize all departure time 1 microsecond apart to keep keys unique
-        # this is required for all trucks to appear at the beginning of the day, so the trips dictionary
-        # otherwise, the trips dict will overwrite one trip with another truck's trip data
-        # a better solution should be implemented, but it works for the purposes of the task
-        #
-        # Note: This is just bad. Trucks should have unique IDs implemented.
-        self._departure_times = [datetime(today.year,
-                                          today.month,
-                                          today.day,
-                                          8, 0, 0, x) for x in range(len(self._trucks))]
+        # every truck departs at the start of the day, trips are keyed by (departure, truck id),
+        # so trucks leaving at the same moment don't overwrite each other's trip data
+        self._departure_times = [datetime(today.year, today.month, today.day, 8) for _ in self._trucks]
 
         # END Initialization of Truck Related Data Structures
 
@@ -134,8 +176,52 @@ class Hub:
         self._standard.clear()
 
     def _update_master(self, package: Package) -> None:
-        """Update a package in the master HashTable"""
+        """Update a package in the master HashTable, and in the secondary indexes"""
         self._packages[int(package.id)] = package
+        self._index_package(package)
+
+    def _build_indexes(self) -> None:
+        """Builds the secondary indexes used by the lookup methods"""
+        self._by_city = HashIndex()
+        self._by_zip = HashIndex()
+        self._by_weight = HashIndex()
+        self._by_deadline = SortedIndex()
+        self._by_street = TextIndex(expected=len(self._packages))
+        self._indexed = HashTable(expected=len(self._packages))
+        self._deliveries = SkipList()
+        for package in self._packages:
+            self._index_package(package)
+
+    def _index_package(self, package: Package) -> None:
+        """
+        Adds a package to the secondary indexes.
+        The indexed fields are remembered per package, so a package whose address was updated, even in place,
+        is moved out of its old entries rather than left behind in them.
+        """
+        pid = int(package.id)
+        fields = (package.address.street, package.address.city, package.address.postal, package.mass, package.deadline,
+                  package.delivered)
+        previous = self._indexed[pid]
+        if previous == fields:
+            return
+        if previous is not None:
+            _, city, postal, mass, deadline, delivered = previous
+            self._by_city.discard(city, pid)
+            self._by_zip.discard(postal, pid)
+            self._by_weight.discard(mass, pid)
+            self._by_deadline.discard(deadline, pid)
+            if delivered is not None:
+                del self._deliveries[(delivered, -pid)]
+        street, city, postal, mass, deadline, delivered = fields
+        self._by_street.add(street, pid)
+        self._by_city.add(city, pid)
+        self._by_zip.add(postal, pid)
+        self._by_weight.add(mass, pid)
+        self._by_deadline.add(deadline, pid)
+        if delivered is not None:
+            # ids are negated so, read from the latest delivery back, ties come out in ascending id order
+            self._deliveries[(delivered, -pid)] = pid
+        self._indexed[pid] = fields
 
     #
     # End Helper Methods
@@ -145,16 +231,13 @@ class Hub:
     def _compute_dependency_chains(self) -> None:
         """
         Builds package dependency chains i.e. groups of packages that must be delivered together.
-        Once dependencies are resolved, the self._dependency_chain member is updated
+        Once dependencies are resolved, the self._dependency_chains and self._chain_ids members are updated
 
         Big-O Analysis:
-          O(N^2): Expansion/Resolution increases the search space to n * n
-                  Every n item, must be compared to every n other item.
-                  The worst case considers that every package is a dependency of every other.
-          Average case is O(n•k):
-            This considers that the number of dependencies is likely a lot smaller than the total search space, and
-            the total package data set need only be iterated for the number of packages with dependencies or
-            depended on by another.
+          O(n•α(n)): Each package with dependencies is unioned with each of its dependencies in a disjoint set,
+                     so overlapping groups merge as they are found, rather than by repeatedly comparing whole groups.
+                     α is the inverse Ackermann function, which never exceeds 4 in practice,
+                     so resolution is effectively linear in the number of dependency links.
 
         Example:
             Say we have the following subsets,
@@ -171,85 +254,22 @@ class Hub:
         Returns: None
 
         """
-
-        def _build_dependency_chains(f: list[set]) -> list[list[Package]]:
-            """
-            Turns all resolved dependencies sets into their package equivalents
-
-            Args:
-                f: list[set]
-
-            Returns:
-
-            """
-            package_chain = []
-            for subset in f:
-                dep_ids = list(subset)
-                to_add = [self._packages[int(pid)] for pid in dep_ids]
-                for p in self._packages:
-                    if p.id in dep_ids:
-                        p.in_dependency_chain = True
-                package_chain.append(to_add)
-            return package_chain
-
-        def _resolve(s: set, f: list[set]) -> None:
-            """
-            Given an expanded set,
-            all sets in the forest fully included in the expanded set are removed from the forest
-
-            Args:
-                s: set
-                f: list[set]
-
-            Returns: None
-
-            """
-            to_remove = list()
-            for subset in f:
-                if subset & s == subset:
-                    to_remove.append(subset)
-            for item in to_remove:
-                f.remove(item)
-
-        def _expand(a: set, f: list[set]) -> set:
-            """
-            Unions the provided set with any other sets in the forest it has an intersection with
-            This process is performed recursively
-
-            Args:
-                a: set
-                f: list[set]
-
-            Returns: set
-
-            """
-            if len(f) > 0:
-                b = f.pop()
-                if a.isdisjoint(b):
-                    return _expand(a, f)
-                else:
-                    a = a | b
-                    return _expand(a, f)
-            return a
-
         if self._having_dependency is None:
             return
 
-        forest = []
+        chains: DisjointSet[int] = DisjointSet(expected=len(self._having_dependency))
         for package in self._having_dependency:
-            deps = package.has_dependency()
-            new_set = set()
-            new_set.add(package.id)
-            for dep in deps:
-                new_set.add(dep)
-            forest.append(new_set)
-
-        dependencies = list()
-        while forest:
-            current = _expand(forest.pop(), deepcopy(forest))
-            _resolve(current, forest)
-            dependencies.append(current)
-        self._dependency_chains = _build_dependency_chains(dependencies)
+            chains.add(package.id)
+            for dep in package.constraints.dependencies:
+                chains.union(package.id, dep)
+
+        # number the resolved chains, and map every package in one to its chain
+        for chain_id, pids in enumerate(chains.groups()):
+            chain = [self._packages[int(pid)] for pid in sorted(pids)]
+            for p in chain:
+                p.in_dependency_chain = True
+                self._chain_ids[int(p.id)] = chain_id
+            self._dependency_chains[chain_id] = chain
 
     def _find_dependencies(self, p: Package) -> list[Package] | None:
         """
@@ -266,15 +286,68 @@ class Hub:
             return [copy(self._packages[pid]) for pid in deps]
 
     def _get_dependency_chain(self, p: Package) -> list[Package] | None:
-        """Get the dependency chain provided a package"""
-        for chain in self._dependency_chains:
-            if p in chain:
-                return chain
+        """Get the dependency chain provided a package, None once the chain has been loaded"""
+        chain_id = self._chain_ids[int(p.id)]
+        return self._dependency_chains[chain_id] if chain_id is not None else None
 
     #
     # END Dependency Chain Methods
     #
 
+    def _schedule_releases(self) -> None:
+        """
+        Orders the packages held back by a late arrival or an address correction by the time they become loadable,
+        so the packages loadable at a given time are found with one binary search
+        """
+        releases = sorted((package.constraints.earliest, int(package.id)) for package in self._packages
+                          if package.constraints.earliest is not None)
+        self._release_times = [earliest for earliest, _ in releases]
+        self._release_ids = [pid for _, pid in releases]
+
+    def _release(self, until: datetime) -> None:
+        """Moves every held package that is loadable by the given time into the loading queue"""
+        end = bisect_right(self._release_times, until, lo=self._released)
+        for pid in self._release_ids[self._released:end]:
+            package = self._packages[pid]
+            # a package may already be on a truck, loaded along with the rest of its dependency chain
+            if package.status == PackageStatus.Hub:
+                self._enqueue(package)
+        self._released = max(self._released, end)
+
+    def _enqueue(self, package: Package) -> None:
+        """Pushes a package into the loading queue for its truck mask, its priority is recomputed on every push"""
+        mask = package.constraints.trucks
+        queue = self._queues[mask]
+        if queue is None:
+            self._queues[mask] = queue = IndexedHeap(key=_load_priority)
+        self._queued[int(package.id)] = queue.push(package)
+
+    def _withdraw(self, package: Package) -> None:
+        """Accounts for a package that was just loaded, taking it out of its loading queue if it is still queued"""
+        handle = self._queued[int(package.id)]
+        if handle is not None:
+            self._queues[package.constraints.trucks].remove(handle)
+            del self._queued[int(package.id)]
+        self._unloaded -= 1
+
+    def _next_queue(self, eligible: int) -> IndexedHeap[Package] | None:
+        """
+        Finds the queue holding the most urgent package the truck with the given bit may carry
+
+        Big-O Analysis:
+          O(q), where q is the number of distinct truck masks, at most one per truck plus one for any truck
+
+        Returns: IndexedHeap[Package] | None, None if every queue the truck may load from is empty
+
+        """
+        best: IndexedHeap[Package] | None = None
+        for mask, queue in self._queues.items():
+            if not mask & eligible or not queue:
+                continue
+            if best is None or queue.peek_handle().priority < best.peek_handle().priority:
+                best = queue
+        return best
+
     #
     # BEGIN Package Categorization Methods
     #
@@ -314,7 +387,7 @@ class Hub:
 
         from WGUPS.cli.environment import progress, cls
         print(f'Computing special handling for: {len(self._packages)} packages')
-        for package in progress(self._remaining):
+        for package in progress(self._packages):
             _add_special_handling(package)
 
         _print_stats()
@@ -328,31 +401,27 @@ class Hub:
     #
     # Begin Truck Loading and Delivery Methods
     #
-    def _load_remaining(self) -> None:
+    def _load_remaining(self, trucks: list[Truck] = None) -> None:
         """
         Core algorithm, which performs sorting packages onto trucks for the current set of trips.
         A priority queue is used to load packages with the earliest deadline first.
 
         Big-O Analysis:
         Worst Case:
-          O(m•n•logn):
+          O((m + d + k)•logn) per call, O(n•logn) over the whole day:
                 Factors:
-                    n items (packages) are iterated for updating the remaining queue
-                    n items (packages) are sorted in the remaining queue to perform a priority queue
-                    m items (loaded packages) per truck are iterated for updating the remaining queue
-                Each item in the complete package data set is iterated by the number of trucks to build our list of
-                remaining package. Since, m has some appropriate real world limit, and is guaranteed to include only
-                some subset of n it should be negligible, but we include it anyways.
-                (i.e. something like 1 truck per 1 package is insane, or 1 truck with all the packages is also insane).
-                Once the list of remaining packages is formed, it gets sorted (nlogn) to form a priority queue.
-
-                Since, we iterate our list twice (once with sort operations) this gives us O(n * logn).
-                We don't perform any additional iterations for any item in n, so it doesn't grow exponentially.
-                So, instead of 2n, for iterating it twice, we drop the constant.
-
-                This leaves us with O(m•n•logn).
-
-        On function call, if no packages remain, terminates immediately
+                    The queue is owned by the hub and persists between calls, it is never rebuilt.
+                    k packages that became loadable by the departure time are pushed into it, each O(logn).
+                    There is one queue per truck mask, and a truck only pops from the queues it may carry,
+                    so packages that require another truck are never touched.
+                    m packages are popped and loaded, each O(logn), and leave the queue for good.
+                    d packages are popped, but can't go on this truck yet, e.g. their dependency chain doesn't fit,
+                    so are deferred, and pushed back once the truck is loaded, each O(logn).
+                Every package is pushed once when it becomes loadable, and popped once when it is loaded,
+                so unless many packages are deferred over and over, the day costs O(n•logn) in total.
+
+        Loads the given trucks in turn, or every truck when none are given, each at its own departure time.
+        On function call, if no packages remain to be loaded, terminates immediately
         Load order:
             Priority packages (including late arrivals, or any included dependencies)
               Note: All below check described in Standard additionally occur on all priority packages
@@ -387,147 +456,92 @@ class Hub:
                 _to_update.address = to_address.pop()
 
         # sequence of constant time operations, ignored in the Big-O analysis
-        def is_loadable(_id: int, _to_load: Package, _current: Truck) -> bool:
-            """If even one check fails the package won't be loaded"""
-            if _to_load.has_truck_requirement():
-                if _to_load.has_truck_requirement() != _id + 1:
-                    return False
-            if _to_load.has_delay():
-                if _to_load.has_delay() >= self._departure_times[_id].time():
-                    return False
+        def is_loadable(_to_load: Package, _current: Truck) -> bool:
+            """
+            If even one check fails the package won't be loaded
+            Truck requirements, arrivals and address corrections are checked against the precomputed constraints
+            """
             if _to_load.in_dependency_chain:
                 if self._dependency_chains:
                     if _current.capacity_remaining() < len(self._get_dependency_chain(_to_load)):
                         return False
                 else:
                     return False
-            if _to_load.has_invalid_flag():
-                if update_time > self._departure_times[_id]:
-                    return False
             return True
 
         def load(_next: Package, _current: Truck) -> None:
             """Load the next package onto the current truck, including any dependencies"""
-            # Big-O(n + k):
-            #   Only when a package is in a dependency chain, requires checking n dependency chains with k items
-            #   in each. Each chain will be a subset of the complete package data set, unless there is one dependency
-            #   chain containing all packages, where it becomes O(n).
+            # Big-O(k):
+            #   Only when a package is in a dependency chain, the chain is found by id in constant time,
+            #   then each of its k packages is loaded.
             #   If there are no dependencies then this method runs in constant time.
-            if _next.has_invalid_flag():
+            if _next.constraints.invalid_until is not None:
                 receive_update(_to_update=_next)
                 _current.load_package(_next)
+                self._withdraw(package=_next)
                 self._update_master(package=_next)
             if not _next.in_dependency_chain:
                 _current.load_package(_next)
+                self._withdraw(package=_next)
                 self._update_master(package=_next)
             else:
                 if self._dependency_chains is not None:
                     deps = self._get_dependency_chain(_next)
                     for dep in deps:
                         _current.load_package(dep)
+                        self._withdraw(package=dep)
                         self._update_master(package=dep)
-                    self._dependency_chains.remove(deps)
-
-        def update_remaining() -> None:
-            """
-            Forcibly update the list of remaining packages
-            Big-O Analysis:
-                O(m•n):
-                        Data Set Operations (partial):
-                        We consider getting the list of loaded package ids as O(m + k).
-                        Each truck must be iterated and an empty list extended by a factor of k per truck,
-                        so is influenced linearly by O(k), for k items added the number of packages loaded per truck,
-                        which can vary in size, but artificially limited by truck capacity (16 in our case). So, k
-                        drops out to be a sequence of constant time operations. When the number of trucks becomes
-                        very large, we are performing this operation on each truck.
-
-                        Consider in the real world, there will be a maximum number of trucks we have.
-                        Also, m is guaranteed to be less the number of delivered packages due to the truck capacity.
-
-                        It makes sense to characterize this operation separately as m is therefore a tunable parameter,
-                        and guaranteed to be less than n in our use case i.e. we can't have more packages loaded
-                        than total packages than we have.
-                        Thus, the worst case of this operation is O(m), where m is the number of trucks iterated.
+                    del self._dependency_chains[self._chain_ids[int(_next.id)]]
 
-                        Data Set Operations (complete):
-                        Additionally, we consider building the list of remaining packages to be O(n).
-                        Each package in the complete data set must be compared to the smaller subset of package ids
-                        per loaded truck, by calling the 'in' operator ...
-
-                        Therefore, in the worst case we are performing 16 comparisons per package in complete
-                        list of all packages multiplied by the number of trucks.
-
-                        Combining the worst case of each we end up with O(m•n).
-
-            Returns: None
-
-            """
-            # Remaining = (Total - currently loaded - delivered)
-            _loaded: list[int] = []
-            for _truck in self._trucks:
-                _loaded.extend(_truck.pids)
-            for _p in self._packages:
-                if _p.id not in _loaded:
-                    if _p.status != PackageStatus.Delivered:
-                        self._remaining.append(deepcopy(_p))
-
-        if self._remaining is None:
+        if not self._unloaded:
             return
 
-        today = datetime.today()  # time of day package updates are received
-        update_time = datetime(today.year, today.month, today.day, 10, 20, 0, 0)
-
-        # A dummy queue we'll turn into a Priority Queue
-        queue = []
-        for i, truck in enumerate(self._trucks):
-            # Clear of any previous iteration
-            # ( guarding against loading the same items more than once )
-            queue.clear()
-            self._remaining.clear()
-            update_remaining()
-
-            # Discontinue if no packages remain to load
-            if not self._remaining:
-                return
-            if len(self._remaining) == 1:
-                queue = [self._remaining[-1]]
-            else:
-                # Transform remaining items into a priority queue
-                # O(nlogh), the complexity of python's internal timsort
-                queue = sorted(self._remaining, key=operator.attrgetter('deadline'), reverse=True)
+        from WGUPS.models.truck import AlreadyOnTruckError
+        for truck in trucks if trucks is not None else self._trucks:
+            i = truck.truck_id
+            departure = self._departure_times[i]
+            # Packages that have arrived, or had their address corrected, by departure join the queue
+            self._release(until=departure)
 
-            # while truck has capacity remaining
+            # bit i of a package's truck mask is set if this truck may carry it
+            eligible = 1 << i
+            deferred: list[Package] = []
+
+            # while truck has capacity remaining, and a queue it may load from still has items
             while not truck.is_full():
-                if queue:  # still has items,
-                    # continue loading
-                    to_load = queue.pop()
-
-                    if is_loadable(_id=i, _to_load=to_load, _current=truck):
-                        from WGUPS.models.truck import AlreadyOnTruckError
-                        try:
-                            # O(n * m)
-                            load(_next=to_load, _current=truck)
-                        except AlreadyOnTruckError:
-                            # package is already on the truck,
-                            # proper guarding is in place to simply consume the Error
-                            pass
-                else:
-                    # stop loading
+                queue = self._next_queue(eligible)
+                if queue is None:
                     break
-        # Note: This section needs reworked, it's computationally expensive to recompute remaining packages
-        #       on each iteration, requiring O(n) additional complexity each time
-        # Finished loading trucks,
-        # Clear the remaining package list
-        self._remaining.clear()
+                to_load = queue.pop()
+                del self._queued[int(to_load.id)]
+
+                # trucks depart out of order, a package may have been released for a later departure than this one
+                earliest = to_load.constraints.earliest
+                if (earliest is None or earliest <= departure) and is_loadable(_to_load=to_load, _current=truck):
+                    try:
+                        # O(k) for a dependency chain of k packages
+                        load(_next=to_load, _current=truck)
+                    except AlreadyOnTruckError:
+                        # package is already on the truck,
+                        # proper guarding is in place to simply consume the Error
+                        pass
+                else:
+                    deferred.append(to_load)
 
-        # Create a new list of remaining items,
-        # one that won't include what was loaded
-        update_remaining()
+            # packages this truck couldn't take wait in the queue for the next truck, or the next trip,
+            # unless they were loaded meanwhile, along with the rest of a dependency chain
+            for package in deferred:
+                if package.status == PackageStatus.Hub:
+                    self._enqueue(package)
 
     def _dispatch_trucks(self) -> None:
         """
         Core algorithm for controlling both loading and delivery of packages onboard trucks.
 
+        Dispatch is simulated event by event, truck returns and package releases are taken from a time-ordered queue,
+        so the clock jumps straight to the next moment a truck could load something. A truck with nothing to load
+        waits for the next release, rather than polling forward one second at a time.
+
         Big-O Analysis:
           O(m•n^2•logn):
             The combination of the runtime complexity of the load optimization algorithm,
@@ -559,47 +573,63 @@ class Hub:
 
         """
         # inform the user of what we're currently processing
-        from WGUPS.cli.environment import progress
         print(f'Processing Delivery {Style.RED1}{Style.UNDERLINE}Routes:{Style.END}\n')
 
         # use a list for storing # of trips per truck, as it may vary
         trip_counts = [0] * len(self._trucks)
-        while self._remaining:  # while packages still remain to be delivered
-            # Load packages onto trucks
-            self._load_remaining()
-
-            # For each truck, perform with progress indication
-            print('Computing optimal trips: ', trip_counts)
-            for i, truck in enumerate(progress(self._trucks)):
-                time.sleep(sum(trip_counts) * 0.1)
-                if truck.packages is not None:
-                    # Truck has packages to deliver,
-                    # Optimize the route plan ( O(nlogh) runtime for convex hull, output sensitive )
-                    path = truck.optimize_delivery(_graph=self._graph, _hub=self.HUB)
-
-                    # Check path length, note: the path includes the hub twice to explain the condition check
-                    if len(path) > 2:
-                        # at least one package is on the truck
-
-                        # Perform package delivery
-                        self._deliver_packages_in_truck(trip_id=trip_counts[i], truck=truck, path=path)
-
-                        for package in truck.packages:
-                            self._update_master(package)
-
-                        # reset the truck for next iteration of load/delivery
-                        truck.clear()
-                    trip_counts[i] += 1
-                else:
-                    # No packages are on the truck,
-                    # We must be careful to guard against deadlock here (infinite looping)
 
-                    # If we are here, packages remain, but require an update, haven't arrived, yet, etc.
-                    # in that case, the current departure time needs to incremented until the departure time
-                    # has progressed far enough for those issues to resolve the checks in the loading routine
-                    self._departure_times[i] += timedelta(seconds=1)
-                    continue  # proceed with an updated departure time
-            print()  # print empty line
+        # time-ordered queue of the moments anything can change, each event is (time, kind, truck id),
+        # the IndexedHeap breaks any remaining ties in the order events were scheduled
+        events: IndexedHeap[tuple[datetime, DispatchEvent, int]] = IndexedHeap()
+        for i, departure in enumerate(self._departure_times):
+            events.push((departure, DispatchEvent.TruckReturn, i))
+        for release in sorted(set(self._release_times)):
+            events.push((release, DispatchEvent.Release, -1))
+
+        # trucks at the hub with nothing they can load, until the next package is released
+        waiting: list[int] = []
+        while self._unloaded and events:  # while packages still remain to be delivered
+            at, kind, truck_id = events.pop()
+            if kind == DispatchEvent.Release:
+                # waiting trucks jump straight to the release, nothing they could load changes before then
+                ready, waiting = waiting, []
+                for i in ready:
+                    self._departure_times[i] = at
+            else:
+                ready = [truck_id]
+
+            for i in ready:
+                truck = self._trucks[i]
+                # Load packages onto the truck
+                self._load_remaining(trucks=[truck])
+                if not truck.packages:
+                    waiting.append(i)
+                    continue
+
+                # Truck has packages to deliver,
+                # Optimize the route plan ( O(nlogh) runtime for convex hull, output sensitive )
+                path = truck.optimize_delivery(_graph=self._graph, _hub=self.HUB)
+
+                # Perform package delivery
+                if trip_counts[i] == len(self._trip_distances[i]):
+                    self._trip_distances[i].append(0.0)
+                self._deliver_packages_in_truck(trip_id=trip_counts[i], truck=truck, path=path)
+
+                for package in truck.packages:
+                    self._update_master(package)
+
+                # reset the truck for next iteration of load/delivery
+                truck.clear()
+                trip_counts[i] += 1
+
+                # delivery moved the truck's departure time on to its return to the hub
+                events.push((self._departure_times[i], DispatchEvent.TruckReturn, i))
+
+        print('Computing optimal trips: ', trip_counts)
+        if self._unloaded:
+            # no truck can ever take these, e.g. a dependency chain larger than any truck's capacity
+            print(f'{Style.RED1}{self._unloaded} packages could not be loaded onto any truck.{Style.END}')
+        print()  # print empty line
 
     def _deliver_packages_in_truck(self, trip_id: int, truck: Truck, path: list[Address]) -> None:
         """
@@ -662,10 +692,10 @@ class Hub:
             self._trip_distances[truck.truck_id][trip_id] += _total
             return _total, _seen
 
-        # store a copy of package ids in the trip, in a dict searchable by a datetime key
+        # store a copy of package ids in the trip, in an ordered map searchable by a datetime key
         clock = self._departure_times[truck.truck_id]
         pids = copy(truck.pids)
-        self._trips[clock] = (truck.truck_id, pids)
+        self._trips[(clock, truck.truck_id)] = (truck.truck_id, pids)
 
         # call subroutine to calculate distances
         total_distance, edges = _calc_distances(_path=path)
@@ -724,12 +754,8 @@ class Hub:
         """Retrieve the route plans for a given truck"""
         stats = f'Route plans for {Style.YELLOW2}Truck {Style.UNDERLINE}#00{key + 1}:{Style.END}\n' \
                 f'{Style.YELLOW2}(Note: Packages are in sorted delivery order.){Style.END}\n\n'
-        trips = []
-        for trip in self._trips.values():
-            trips.append(trip)
-
         i = 0
-        for trip in self._trips.values():
+        for trip in self._trips:
             if trip[0] != key:
                 continue
 
@@ -757,15 +783,13 @@ class Hub:
     #
     def find_delivered_at_time(self, _time) -> list[Package]:
         """Finds all delivered packages at the provided time"""
-        _all_delivered = []
-        for _i, _package in self._packages.items():
-            if _package.delivered and _package.delivered <= _time:
-                _all_delivered.append(copy(_package))
-        return sorted(_all_delivered, key=operator.attrgetter('delivered'), reverse=True)
+        # only the deliveries up to _time are visited, most recent first
+        _all_delivered = [copy(self._packages[_pid]) for _, _pid in self._deliveries.range(high=(_time, math.inf))]
+        _all_delivered.reverse()
+        return _all_delivered
 
     def find_enroute_at_time(self, _time) -> list[list[Package]]:
         """Finds all enroute packages loaded on a truck at the provided time, separated by truck"""
-        # microseconds are used to differentiate 'unique' initial departure times
         _all_enroute = [list() for _ in range(len(self._trucks))]
         _trucks = self._retrieve_trip_window(_time)
         if not _trucks:
@@ -798,70 +822,69 @@ class Hub:
             for _pid in _pids:
                 if self._packages[_pid].delivered > _time:
                     enroute_ids.append(_pid)
-        for _package in self._packages:
-            if _package.delivered and _package.delivered > _time:
-                if _package.id not in enroute_ids:
-                    copy_of = copy(_package)
-                    copy_of.set_status(PackageStatus.Hub)
-                    all_delivered.append(copy_of)
-        return sorted(all_delivered, key=operator.attrgetter('delivered'), reverse=True)
+        for _, _pid in self._deliveries.range(low=(_time, math.inf)):
+            if _pid not in enroute_ids:
+                copy_of = copy(self._packages[_pid])
+                copy_of.set_status(PackageStatus.Hub)
+                all_delivered.append(copy_of)
+        all_delivered.reverse()
+        return all_delivered
 
     def _retrieve_trip_window(self, _time: datetime) -> list[tuple[int, list[int]]]:
         """Finds the trip data in the time window of a searched time and returns truck trips occurring at that time"""
-        _time += timedelta(microseconds=len(self._trucks))
         _time_windows: list[tuple[int, list[int]]] = [tuple() for _ in range(len(self._trucks))]
-        _i = 0
-        for _departure, _pids in self._trips.items():
-            if _departure <= _time:
-                # storing the most recent trip at the given time for each truck
-                # the current iteration mod len(trucks) will always give the correct truck
-                _time_windows[_pids[0]] = _pids
-            _i += 1
+        # every trip departing up to and including _time, whichever truck it belongs to
+        for _departure, _pids in self._trips.range(high=(_time, math.inf)):
+            # trips are in departure order, so the last one seen for each truck is its most recent trip
+            _time_windows[_pids[0]] = _pids
         return _time_windows
 
     def lookup_by_id(self, key: int) -> Package:
         """Search for a package by its ID"""
         return copy(self._packages[int(key)])
 
-    def lookup_by_address(self, street: str) -> list[Package]:
-        """Search package(s) by address"""
-        found = []
-        for package in self._packages:
-            if street in package.address.street:
-                found.append(copy(package))
-        return sorted(found, key=operator.attrgetter('id'))
+    def lookup_by_address(self, street: str, limit: int = None, prefix: bool = False) -> list[Package]:
+        """
+        Search package(s) by address, ignoring case and extra whitespace
 
-    def lookup_by_deadline(self, search: datetime) -> list[Package]:
-        """Search for package(s) by deadline"""
-        found = []
-        for package in self._packages:
-            if package.deadline == search:
-                found.append(copy(package))
-        return sorted(found, key=operator.attrgetter('deadline'))
+        Args:
+            street: str, part of a street, or its beginning when prefix is set
+            limit: int, the most packages to return, the lowest ids first
+            prefix: bool, match only streets starting with the search
+
+        Returns: list[Package], in id order
+
+        """
+        return [copy(self._packages[pid]) for pid in self.iter_by_address(street, limit, prefix)]
+
+    def iter_by_address(self, street: str, limit: int = None, prefix: bool = False) -> Iterator[int]:
+        """Streams the ids of package(s) by address from the street index, see lookup_by_address()"""
+        if prefix:
+            return self._by_street.prefix(street, limit)
+        return self._by_street.contains(street, limit)
+
+    def lookup_by_deadline(self, search: datetime, until: datetime = None) -> list[Package]:
+        """
+        Search for package(s) by deadline, or by a range of deadlines when until is given
+
+        Big-O Analysis:
+            O(logn + k), a binary search of the deadline index, for k matches
+        """
+        if until is None:
+            return [copy(self._packages[pid]) for pid in self._by_deadline.lookup(search)]
+        return [copy(self._packages[pid]) for pid in self._by_deadline.between(search, until)]
 
     def lookup_by_city(self, city: str) -> list[Package]:
-        """Search for package(s) by city"""
-        found = []
-        for package in self._packages:
-            if package.address.city == city:
-                found.append(copy(package))
-        return sorted(found, key=operator.attrgetter('id'))
+        """Search for package(s) by city, O(1 + k) from the city index"""
+        return [copy(self._packages[pid]) for pid in self._by_city.lookup(city)]
 
     def lookup_by_zip(self, postal: str) -> list[Package]:
-        """Search for package(s) by zip"""
-        found = []
-        for package in self._packages:
-            if package.address.postal == postal:
-                found.append(copy(package))
-        return sorted(found, key=operator.attrgetter('id'))
+        """Search for package(s) by zip, O(1 + k) from the zip index"""
+        return [copy(self._packages[pid]) for pid in self._by_zip.lookup(postal)]
 
     def lookup_by_weight(self, mass: str) -> list[Package]:
-        """Search for package(s) by weight"""
-        found = []
-        for package in self._packages:
-            if package.mass == int(mass):
-                found.append(copy(package))
-        return sorted(found, key=operator.attrgetter('id'))
+        """Search for package(s) by weight, O(1 + k) from the weight index"""
+        return [copy(self._packages[pid]) for pid in self._by_weight.lookup(int(mass))]
 
     #
     # END Search/Lookup Methods
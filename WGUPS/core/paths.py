@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+# Standard Library
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Iterable, TypeVar
+
+# Project Imports
+from WGUPS.core.ruler import Ruler, _EARTH_SEMI_MAJOR, _EARTH_SEMI_MINOR
+from WGUPS.structures.heap import HeapHandle, IndexedHeap
+
+T = TypeVar('T')
+
+# Haversine measures arcs on a sphere of the mean radius R = (a + b) / 2, but no stretch of a geodesic on the
+# ellipsoid is shorter than its smallest radius of curvature times the same arc, the meridional radius at the
+# equator, a(1 - e²) = b² / a. So Haversine scaled by b² / (a•R) ≈ 0.99497 never overshoots Vincenty,
+# and the extra 0.2% covers Vincenty's convergence tolerance and floating point error.
+_MIN_RADIUS_RATIO = _EARTH_SEMI_MINOR ** 2 / _EARTH_SEMI_MAJOR / (0.5 * (_EARTH_SEMI_MAJOR + _EARTH_SEMI_MINOR))
+_HEURISTIC_SLACK = _MIN_RADIUS_RATIO * 0.998
+
+
+@dataclass()
+class ShortestPaths(Generic[T]):
+    """
+    Result of a single-source search: distances to every settled vertex, and the predecessor tree to rebuild paths
+    """
+    source: T
+    distances: dict[T, float] = field(default_factory=dict)
+    predecessors: dict[T, T] = field(default_factory=dict)
+
+    def distance_to(self, target: T) -> float | None:
+        return self.distances.get(target)
+
+    def path_to(self, target: T) -> list[T] | None:
+        """
+        Walks the predecessor tree back from the target
+
+        Returns: list[T] | None, source first and target last, None if the target was not reached
+
+        """
+        if target not in self.distances:
+            return None
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.predecessors[path[-1]])
+        path.reverse()
+        return path
+
+
+def dijkstra(graph, source: T, targets: Iterable[T] | None = None) -> ShortestPaths[T]:
+    """
+    Dijkstra's algorithm with an indexed binary heap, over any graph where graph[v].items() yields
+    (neighbor, distance) pairs, such as the sparse adjacency HashTables of a Graph.
+
+    With targets, the search stops as soon as every target is settled (one-to-many), otherwise every
+    reachable vertex is settled (one-to-all).
+
+    Big-O Analysis:
+        O((V + E)•logV), an improved vertex has its key decreased in place through its IndexedHeap handle,
+        so the queue holds at most one entry per vertex and never more than V
+
+    Args:
+        graph: Graph[T] | DenseGraph[T] | GraphOverlay[T]
+        source: T
+        targets: Iterable[T] | None
+
+    Returns: ShortestPaths[T]
+
+    """
+    return _search(graph, source, targets, None)
+
+
+def astar(graph, source: T, targets: Iterable[T], heuristic: Callable[[T, T], float] = None,
+          unit: Ruler.Units = Ruler.Units.Miles) -> ShortestPaths[T]:
+    """
+    A* search towards one or more targets, stopping once all of them are settled.
+
+    The default heuristic is the Haversine distance between the vertices' coordinates, in the same unit as the
+    edge distances, scaled down so it never exceeds the ellipsoidal distance between two points. A road is never
+    shorter than that, so the heuristic is admissible and the distances found to the targets are exact, as long as
+    the edge distances are not rounded below the true distances.
+    With several targets, the nearest remaining target guides the search.
+
+    Big-O Analysis:
+        O((V + E)•logV) in the worst case, typically far fewer vertices are settled than Dijkstra
+
+    Args:
+        graph: Graph[T] | DenseGraph[T] | GraphOverlay[T]
+        source: T
+        targets: Iterable[T], the vertices to settle, a single target still goes in an iterable, like dijkstra
+        heuristic: Callable[[T, T], float], a lower bound on the distance between two vertices
+        unit: Ruler.Units, the unit of the edge distances, used by the default heuristic
+
+    Returns: ShortestPaths[T]
+
+    """
+    if heuristic is None:
+        heuristic = haversine_heuristic(unit)
+    return _search(graph, source, targets, heuristic)
+
+
+def haversine_heuristic(unit: Ruler.Units = Ruler.Units.Miles) -> Callable[[T, T], float]:
+    """
+    Builds an admissible A* heuristic for vertices with a coordinate attribute, such as an Address
+
+    Returns: Callable[[T, T], float]
+
+    """
+    factor = Ruler(unit=unit)._unit_factor() * _HEURISTIC_SLACK
+
+    def _heuristic(a, b) -> float:
+        return Ruler._haversine(a.coordinate, b.coordinate) * factor
+
+    return _heuristic
+
+
+def _search(graph, source: T, targets: Iterable[T] | None, heuristic: Callable[[T, T], float] | None) \
+        -> ShortestPaths[T]:
+    """Shared body of Dijkstra and A*, Dijkstra is A* with a zero heuristic"""
+    result = ShortestPaths(source=source)
+    remaining = set(targets) if targets is not None else None
+
+    def _estimate(_v: T) -> float:
+        if heuristic is None or not remaining:
+            return 0.0
+        return min(heuristic(_v, _t) for _t in remaining)
+
+    # tentative distances, and the place of every open vertex in the queue,
+    # an improved vertex has its priority lowered in place, so the queue never holds stale entries
+    best: dict[T, float] = {source: 0.0}
+    heap: IndexedHeap[T] = IndexedHeap()
+    handles: dict[T, HeapHandle[T]] = {source: heap.push(source, _estimate(source))}
+
+    while heap:
+        vertex = heap.pop()
+        del handles[vertex]
+        d = best[vertex]
+        result.distances[vertex] = d
+
+        # early exit, once every target is settled
+        if remaining is not None:
+            remaining.discard(vertex)
+            if not remaining:
+                break
+
+        neighbors = graph[vertex]
+        if neighbors is None:
+            continue
+        for neighbor, weight in neighbors.items():
+            if weight is None:
+                continue
+            candidate = d + weight
+            # a settled vertex is only ever improved upon when several A* targets shift the heuristic,
+            # in which case it is reopened, with a single target or none this never happens
+            if candidate < best.get(neighbor, float('inf')):
+                best[neighbor] = candidate
+                result.predecessors[neighbor] = vertex
+                handle = handles.get(neighbor)
+                if handle is not None:
+                    heap.update(handle, candidate + _estimate(neighbor))
+                else:
+                    handles[neighbor] = heap.push(neighbor, candidate + _estimate(neighbor))
+
+    return result
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 # Standard Library
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 # Project Imports
@@ -28,6 +28,8 @@ class Ruler:
 
     calc_method: Method = Method.Haversine
     unit: Units = Units.Meters
+    max_iterations: int = 200   # cap on Vincenty's Newton iterations before falling back to Haversine
+    fallbacks: int = field(default=0, compare=False)   # pairs that fell back to Haversine on the last computation
 
     def units(self, new: Ruler.Units = None) -> Ruler.Units:
         if new:
@@ -39,6 +41,53 @@ class Ruler:
             self.calc_method = new
         return self.calc_method
 
+    def compute_matrix(self, coords_a, coords_b=None, precision: int = 1, workers: int = 1, block_rows: int = 256):
+        """
+        Computes every pairwise distance between two sets of coordinates in a single NumPy broadcast.
+
+        Coordinates may be given as a sequence of Coordinate objects, or as an (n, 2) array of lat/long degrees.
+        Radians and cos(lat) are computed once per coordinate, rather than once per pair.
+        If coords_b is omitted, the distances of coords_a to itself are computed (a square matrix).
+        The number of Vincenty pairs that failed to converge, and fell back to Haversine, is stored in self.fallbacks
+
+        With more than one worker, the rows are split into blocks of block_rows and computed in a process pool.
+        Each worker writes its rows straight into shared memory, the result is identical to the serial one.
+
+        Big-O Analysis:
+            O(n•m) arithmetic, but performed in vectorized native loops rather than n•m Python calls
+
+        Args:
+            coords_a: Sequence[Coordinate] | array-like of shape (n, 2)
+            coords_b: Sequence[Coordinate] | array-like of shape (m, 2) | None
+            precision: int, number of decimal places to round to
+            workers: int, number of processes to compute with
+            block_rows: int, number of rows each process computes at a time
+
+        Returns: numpy.ndarray of shape (n, m)
+
+        """
+        import numpy as np
+
+        if workers > 1:
+            return self._compute_matrix_parallel(coords_a, coords_b, precision, workers, block_rows)
+
+        ϕa, λa = self._to_radians(coords_a)
+        ϕb, λb = (ϕa, λa) if coords_b is None else self._to_radians(coords_b)
+
+        self.fallbacks = 0
+        match self.calc_method:
+            case Ruler.Method.Haversine:
+                meters = self._haversine_matrix(ϕa, λa, ϕb, λb)
+            case Ruler.Method.Euclidean:
+                meters = self._euclidean_matrix(ϕa, λa, ϕb, λb)
+            case Ruler.Method.Vincenty:
+                meters, self.fallbacks = self._vincenty_matrix(ϕa, λa, ϕb, λb, self.max_iterations)
+            case _:
+                meters = self._haversine_matrix(ϕa, λa, ϕb, λb)
+
+        meters *= self._unit_factor()
+        return np.round(meters, precision)
+
     def compute_distance(self, c1: Coordinate, c2: Coordinate, precision: int = 1, as_str: bool = False):
         match self.calc_method:
             case Ruler.Method.Haversine:
@@ -46,7 +95,7 @@ class Ruler:
             case Ruler.Method.Euclidean:
                 meters = self._euclidean(c1, c2)
             case Ruler.Method.Vincenty:
-                meters = self._vincenty(c1, c2)
+                meters = self._vincenty(c1, c2, self.max_iterations)
             case _:
                 meters = self._haversine(c1, c2)
 
@@ -59,19 +108,163 @@ class Ruler:
         return f'{d} {self.unit.value}'
 
     def _convert_units(self, d: float, precision: int):
+        d *= self._unit_factor()
+        d = round(d, precision)
+        return d
+
+    def _unit_factor(self) -> float:
+        """Conversion factor from meters to the current unit"""
         match self.unit:
             case Ruler.Units.Kilometers:
-                d *= 0.001
+                return 0.001
             case Ruler.Units.Miles:
-                d *= 0.000621371
+                return 0.000621371
             case Ruler.Units.Feet:
-                d *= 3.28084
+                return 3.28084
             case Ruler.Units.Yards:
-                d *= 1.09361
-            case _, Ruler.Units.Meters:
-                pass
-        d = round(d, precision)
-        return d
+                return 1.09361
+            case _:
+                return 1.0
+
+    def _compute_matrix_parallel(self, coords_a, coords_b, precision: int, workers: int, block_rows: int):
+        """
+        Splits the matrix into blocks of rows, and computes them in a process pool.
+
+        Workers attach to one shared memory buffer by name and write their rows in place,
+        so only coordinates and row ranges are pickled, never distances.
+
+        Returns: numpy.ndarray of shape (n, m)
+
+        """
+        import numpy as np
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        degrees_a = self._to_degrees(coords_a)
+        degrees_b = degrees_a if coords_b is None else self._to_degrees(coords_b)
+        shape = (len(degrees_a), len(degrees_b))
+
+        self.fallbacks = 0
+        shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+        try:
+            blocks = [(start, min(start + block_rows, shape[0])) for start in range(0, shape[0], max(1, block_rows))]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_compute_block, self, shm.name, shape, degrees_a, degrees_b,
+                                       start, stop, precision) for start, stop in blocks]
+                for future in futures:
+                    self.fallbacks += future.result()
+            # copy out of the shared buffer, so it can be released
+            return np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def compute_row_blocks(self, coords, upper: bool = False, precision: int = 1, workers: int = 1,
+                           block_rows: int = 256):
+        """
+        Computes a square distance matrix one block of rows at a time, so only one block is held in memory at a time.
+
+        Each block holds rows [start, start + k) of the matrix, every column of them, or with upper set,
+        only the upper triangle: the columns from start onwards, so nearly half of the pairs are never computed.
+        The values are identical to the same rows of compute_matrix().
+        With more than one worker, blocks are computed in a process pool by _compute_block, a few blocks ahead
+        of the consumer. self.fallbacks is the running count of Vincenty fallbacks over the blocks so far.
+
+        Big-O Analysis:
+            O(n^2) arithmetic, halved with upper, O(block_rows•n) memory per block in flight
+
+        Args:
+            coords: Sequence[Coordinate] | array-like of shape (n, 2)
+            upper: bool, computes only the upper triangle
+            precision: int, number of decimal places to round to
+            workers: int, number of processes to compute with
+            block_rows: int, number of rows in each block
+
+        Yields: tuple[int, numpy.ndarray], the first row of the block,
+                and the block of shape (k, n), or (k, n - start) with upper
+
+        """
+        import numpy as np
+
+        degrees = self._to_degrees(coords)
+        n = len(degrees)
+        blocks = [(start, min(start + block_rows, n)) for start in range(0, n, max(1, block_rows))]
+
+        if workers <= 1:
+            fallbacks = 0
+            for start, stop in blocks:
+                block = self.compute_matrix(degrees[start:stop], degrees[start if upper else 0:], precision)
+                fallbacks += self.fallbacks
+                self.fallbacks = fallbacks
+                yield start, block
+            return
+
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        self.fallbacks = 0
+        pending = deque()
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                submitted = iter(blocks)
+                while True:
+                    # keep every worker busy, without holding more than twice as many blocks as workers
+                    for start, stop in submitted:
+                        first = start if upper else 0
+                        shape = (stop - start, n - first)
+                        shm = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+                        future = pool.submit(_compute_block, self, shm.name, shape, degrees[start:stop],
+                                             degrees[first:], 0, shape[0], precision)
+                        pending.append((start, shape, shm, future))
+                        if len(pending) >= 2 * workers:
+                            break
+                    if not pending:
+                        return
+                    start, shape, shm, future = pending.popleft()
+                    try:
+                        self.fallbacks += future.result()
+                        yield start, np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+                    finally:
+                        shm.close()
+                        shm.unlink()
+        finally:
+            for _, _, shm, _ in pending:
+                shm.close()
+                shm.unlink()
+
+    @staticmethod
+    def _to_degrees(coords):
+        """
+        Converts a coordinate collection into an (n, 2) array of lat/long degrees
+
+        Args:
+            coords: Sequence[Coordinate] | array-like of shape (n, 2)
+
+        Returns: numpy.ndarray
+
+        """
+        import numpy as np
+
+        if len(coords) and isinstance(coords[0], Coordinate):
+            coords = [(c.lat, c.long) for c in coords]
+        return np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def _to_radians(coords):
+        """
+        Converts a coordinate collection into separate arrays of latitudes and longitudes in radians
+
+        Args:
+            coords: Sequence[Coordinate] | array-like of shape (n, 2)
+
+        Returns: tuple[numpy.ndarray, numpy.ndarray]
+
+        """
+        import numpy as np
+
+        radians = np.radians(Ruler._to_degrees(coords))
+        return radians[:, 0], radians[:, 1]
 
     @staticmethod
     def orientation(p: Coordinate, q: Coordinate, r: Coordinate):
@@ -98,7 +291,7 @@ class Ruler:
         import math
 
         def distance_long(lat_a, long_a, long_b):
-            return (long_b - long_a) * math.cos(lat_a)
+            return (long_b - long_a) * math.cos(math.radians(lat_a))
 
         def distance_lat(lat_a, lat_b):
             return lat_b - lat_a
@@ -111,13 +304,46 @@ class Ruler:
 
         # calculate pythagorean distance between the two points
         d = math.sqrt(
-            distance_long(c1.lat, c2.long, c2.long) ** 2
+            distance_long(c1.lat, c1.long, c2.long) ** 2
             + distance_lat(c1.lat, c2.lat) ** 2
         )
         # apply the unit conversion
         d *= meters
         return d
 
+    # vectorized form of _euclidean, expects radians as produced by _to_radians()
+    @staticmethod
+    def _euclidean_matrix(ϕa, λa, ϕb, λb):
+        import numpy as np
+
+        R = 0.5 * (_EARTH_SEMI_MAJOR + _EARTH_SEMI_MINOR)
+
+        # the planar approximation works in degrees, only cos(lat) needs radians
+        cos_ϕa = np.cos(ϕa)[:, None]
+        Δx = np.degrees(λb[None, :] - λa[:, None]) * cos_ϕa
+        Δy = np.degrees(ϕb[None, :] - ϕa[:, None])
+        return np.sqrt(Δx ** 2 + Δy ** 2) * ((2 * np.pi * R) / 360)
+
+    # vectorized form of _haversine, expects radians as produced by _to_radians()
+    @staticmethod
+    def _haversine_matrix(ϕa, λa, ϕb, λb):
+        import numpy as np
+
+        R = 0.5 * (_EARTH_SEMI_MAJOR + _EARTH_SEMI_MINOR)
+
+        # cos(ϕ) is computed once per coordinate, then broadcast across every pair
+        cos_ϕa, cos_ϕb = np.cos(ϕa), np.cos(ϕb)
+
+        # rows are indexed by coords_a, columns by coords_b
+        Δϕ = ϕb[None, :] - ϕa[:, None]
+        Δλ = λb[None, :] - λa[:, None]
+
+        t = np.sin(Δϕ * 0.5) ** 2
+        t += np.outer(cos_ϕa, cos_ϕb) * (np.sin(Δλ * 0.5) ** 2)
+        # guard against rounding pushing t slightly outside of asin's domain
+        np.clip(t, 0.0, 1.0, out=t)
+        return 2 * R * np.arcsin(np.sqrt(t))
+
     # adaptation of spherical law of cosines for distance of spherical triangles (more accurate)
     @staticmethod
     def _haversine(c1: Coordinate, c2: Coordinate):
@@ -140,8 +366,9 @@ class Ruler:
 
     # improvements upon haversine that accounts for Earth's 'flattening' i.e. it's equatorial bulge (most accurate)
     # the Newtonian approximation may fail to converge if λ is initially greater than π in absolute value
+    # after max_iterations without converging, the Haversine distance is returned instead
     @staticmethod
-    def _vincenty(c1: Coordinate, c2: Coordinate):
+    def _vincenty(c1: Coordinate, c2: Coordinate, max_iterations: int = 200):
         import math
 
         # Earth Major/Minor axis (in meters), and 'flattening' ratio
@@ -165,7 +392,7 @@ class Ruler:
 
         λ = Δλ + 0
 
-        while True:
+        for _ in range(max_iterations):
             t = (math.cos(U2) * math.sin(λ)) ** 2
             t += (math.cos(U1) * math.sin(U2) - math.sin(U1) * math.cos(U2) * math.cos(λ)) ** 2
             sinσ = t ** 0.5
@@ -176,7 +403,8 @@ class Ruler:
                 return 0.0
             sinα = (math.cos(U1) * math.cos(U2) * math.sin(λ)) / sinσ
             cos_sq_α = 1 - sinα ** 2
-            cos2σm = cosσ - 2 * math.sin(U1) * math.sin(U2) / cos_sq_α
+            # both points on the equator, cos2σm is defined as 0 there
+            cos2σm = cosσ - 2 * math.sin(U1) * math.sin(U2) / cos_sq_α if cos_sq_α != 0 else 0.0
             C = ƒ * cos_sq_α * (4 + ƒ * (4 - 3 * cos_sq_α)) * 0.0625
 
             t = σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm ** 2))
@@ -186,6 +414,9 @@ class Ruler:
                 break
             else:
                 λ = L
+        else:
+            # failed to converge, likely near-antipodal points
+            return Ruler._haversine(c1, c2)
 
         # performed once lambda is within the desired degree of accuracy
         u_sq = cos_sq_α * ((a ** 2 - b ** 2) / b ** 2)
@@ -198,3 +429,140 @@ class Ruler:
         s = b * A * (σ - Δσ)
 
         return s
+
+    # vectorized form of _vincenty, expects radians as produced by _to_radians()
+    # every pair iterates at once, pairs are frozen as they converge so only the unconverged pairs are recomputed
+    @staticmethod
+    def _vincenty_matrix(ϕa, λa, ϕb, λb, max_iterations: int = 200, block: int = 1 << 14):
+        """
+        Solves the Vincenty inverse problem for every pair of coordinates at once.
+
+        Pairs are solved in blocks of rows, which keeps the working arrays small enough to stay in cache.
+        Pairs that have not converged after max_iterations fall back to the Haversine distance.
+
+        Returns: tuple[numpy.ndarray, int], the distance matrix in meters, and the number of fallbacks
+
+        """
+        import numpy as np
+
+        ƒ = 1 / 298.257223563
+
+        # reduced latitudes, computed once per coordinate
+        U1, U2 = np.arctan((1 - ƒ) * np.tan(ϕa)), np.arctan((1 - ƒ) * np.tan(ϕb))
+        sinU1, cosU1 = np.sin(U1), np.cos(U1)
+        sinU2, cosU2 = np.sin(U2), np.cos(U2)
+
+        meters = np.empty((ϕa.size, ϕb.size))
+        fallbacks = 0
+        rows = max(1, block // max(1, ϕb.size))
+        for start in range(0, ϕa.size, rows):
+            stop = min(start + rows, ϕa.size)
+            n = stop - start
+
+            # flatten the block out to one entry per pair
+            s, unconverged = Ruler._vincenty_pairs(np.repeat(sinU1[start:stop], ϕb.size),
+                                                   np.repeat(cosU1[start:stop], ϕb.size),
+                                                   np.tile(sinU2, n),
+                                                   np.tile(cosU2, n),
+                                                   (λb[None, :] - λa[start:stop, None]).ravel(),
+                                                   max_iterations)
+
+            # pairs which never converged are replaced with their Haversine distance
+            if unconverged.size:
+                s[unconverged] = Ruler._haversine_matrix(ϕa[start:stop], λa[start:stop], ϕb, λb).ravel()[unconverged]
+                fallbacks += unconverged.size
+            meters[start:stop] = s.reshape(n, ϕb.size)
+
+        return meters, fallbacks
+
+    @staticmethod
+    def _vincenty_pairs(sinU1, cosU1, sinU2, cosU2, Δλ, max_iterations: int):
+        """
+        Iterates Vincenty's formula over flat arrays of pairs.
+
+        Returns: tuple[numpy.ndarray, numpy.ndarray], distances in meters, and the indices of unconverged pairs
+
+        """
+        import numpy as np
+
+        a = _EARTH_SEMI_MAJOR
+        b = _EARTH_SEMI_MINOR
+        ƒ = 1 / 298.257223563
+        ε = 1e-12
+
+        # per-pair state, the values of the converging iteration are kept for the final step
+        sinσ = np.zeros(Δλ.size)
+        cosσ = np.ones(Δλ.size)
+        σ = np.zeros(Δλ.size)
+        cos_sq_α = np.ones(Δλ.size)
+        cos2σm = np.zeros(Δλ.size)
+
+        # working set of pairs still iterating, compacted whenever some of them converge
+        active = np.arange(Δλ.size)
+        s1, c1, s2, c2, L0 = sinU1, cosU1, sinU2, cosU2, Δλ
+        λ = Δλ.copy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(max_iterations):
+                if active.size == 0:
+                    break
+                sinλ, cosλ = np.sin(λ), np.cos(λ)
+
+                t = (c2 * sinλ) ** 2
+                t += (c1 * s2 - s1 * c2 * cosλ) ** 2
+                _sinσ = np.sqrt(t)
+                _cosσ = s1 * s2 + c1 * c2 * cosλ
+                _σ = np.arctan2(_sinσ, _cosσ)
+
+                sinα = np.where(_sinσ != 0, (c1 * c2 * sinλ) / _sinσ, 0.0)
+                _cos_sq_α = 1 - sinα ** 2
+                _cos2σm = np.where(_cos_sq_α != 0, _cosσ - 2 * s1 * s2 / _cos_sq_α, 0.0)
+                C = ƒ * _cos_sq_α * (4 + ƒ * (4 - 3 * _cos_sq_α)) * 0.0625
+
+                t = _σ + C * _sinσ * (_cos2σm + C * _cosσ * (-1 + 2 * _cos2σm ** 2))
+                L = L0 + (1 - C) * ƒ * sinα * t
+
+                # coincident points are done, their distance is 0
+                done = (np.abs(L - λ) <= ε) | (_sinσ == 0)
+                if not done.any():
+                    λ = L
+                    continue
+
+                # freeze converged pairs
+                idx = active[done]
+                sinσ[idx], cosσ[idx], σ[idx] = _sinσ[done], _cosσ[done], _σ[done]
+                cos_sq_α[idx], cos2σm[idx] = _cos_sq_α[done], _cos2σm[done]
+
+                keep = ~done
+                active = active[keep]
+                s1, c1, s2, c2, L0, λ = s1[keep], c1[keep], s2[keep], c2[keep], L0[keep], L[keep]
+
+        u_sq = cos_sq_α * ((a ** 2 - b ** 2) / b ** 2)
+        A = 1 + (u_sq * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))) / 16384
+        B = u_sq * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq))) / 1024
+
+        t = cos2σm + 0.25 * B * (cosσ * (-1 + 2 * cos2σm ** 2))
+        t -= (B * cos2σm / 6) * (-3 + 4 * np.sin(σ) ** 2) * (-3 + 4 * cos2σm ** 2)
+        Δσ = B * sinσ * t
+        return b * A * (σ - Δσ), active
+
+
+def _compute_block(ruler: Ruler, name: str, shape: tuple[int, int], degrees_a, degrees_b,
+                   start: int, stop: int, precision: int) -> int:
+    """
+    Process pool worker, computes rows [start, stop) of a distance matrix into the named shared memory buffer
+
+    Returns: int, the number of Vincenty fallbacks in the block
+
+    """
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        out[start:stop] = ruler.compute_matrix(degrees_a[start:stop], degrees_b, precision)
+        del out
+        return ruler.fallbacks
+    finally:
+        shm.close()
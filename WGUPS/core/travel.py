@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+# Standard Library
+from typing import Generic, TypeVar
+
+# Project Imports
+from WGUPS.core.paths import dijkstra
+from WGUPS.structures.graph import DenseGraph
+
+T = TypeVar('T')
+
+# road network and stops shared with each pool worker once, when the worker starts, rather than once per task
+_network = None
+_network_ids: dict = {}
+_stops: list = []
+
+
+class TravelMatrix(DenseGraph[T]):
+    """
+    Stop-to-stop shortest path distances over a sparse road network
+
+    Reads work exactly like a DenseGraph, graph[a][b] is the road distance from stop a to stop b,
+    so tsp.Solver and Hub can route on it unchanged. Unreachable stops read back as None.
+    The predecessor tree of each stop's search is kept, so the street-level path of any leg can be rebuilt.
+    """
+
+    def __init__(self, capacity: int = 16):
+        super().__init__(capacity)
+        self._network_vertices: list = []
+        self._network_ids: dict = {}
+        self._trees: list = []   # per stop id, an array of predecessor ids into self._network_vertices
+
+    def __repr__(self):
+        return f'TravelMatrix(stops={len(self)}, network vertices={len(self._network_vertices)})'
+
+    def leg(self, stop_a: T, stop_b: T) -> list | None:
+        """
+        Rebuilds the street path between two stops from stop_a's predecessor tree
+
+        Big-O Analysis:
+            O(k), for the k network vertices on the path
+
+        Returns: list | None, network vertices from stop_a to stop_b, None if stop_b is unreachable
+
+        """
+        a, b = self.id_of(stop_a), self.id_of(stop_b)
+        if a is None or b is None or self.distance(a, b) is None:
+            return None
+        tree = self._trees[a]
+        source, current = self._network_ids[stop_a], self._network_ids[stop_b]
+        path = [current]
+        while current != source:
+            current = int(tree[current])
+            path.append(current)
+        path.reverse()
+        return [self._network_vertices[i] for i in path]
+
+
+def build_travel_matrix(network, stops: list[T], workers: int = 1) -> TravelMatrix[T]:
+    """
+    Runs a single-source search from every stop, and collects the results into a dense stop x stop matrix.
+
+    Each search stops once every stop is settled. With more than one worker, searches run in a process pool.
+    The network and the stops are handed to each worker once at start up, each task only sends one stop,
+    and returns a row of distances and a compact array of predecessor ids.
+
+    Big-O Analysis:
+        O(s•(V + E)•logV) for s stops, split across the workers
+
+    Args:
+        network: Graph[T], or any graph where graph[v].items() yields (neighbor, distance) pairs
+        stops: list[T], vertices of the network
+        workers: int
+
+    Returns: TravelMatrix[T]
+
+    """
+    import numpy as np
+
+    vertices = list(network.vertices)
+    ids = {vert: i for i, vert in enumerate(vertices)}
+
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(network, ids, stops)) as pool:
+            chunk = max(1, len(stops) // (4 * workers))
+            results = list(pool.map(_solve_from, stops, chunksize=chunk))
+    else:
+        _init_worker(network, ids, stops)
+        try:
+            results = [_solve_from(stop) for stop in stops]
+        finally:
+            # don't keep the network alive in this process once the matrix is built
+            _init_worker(None, {}, [])
+
+    matrix = TravelMatrix.from_matrix(stops, np.vstack([row for row, _ in results]) if stops else np.zeros((0, 0)))
+    matrix._network_vertices = vertices
+    matrix._network_ids = ids
+    matrix._trees = [tree for _, tree in results]
+    return matrix
+
+
+def _init_worker(network, ids: dict, stops: list) -> None:
+    global _network, _network_ids, _stops
+    _network = network
+    _network_ids = ids
+    _stops = stops
+
+
+def _solve_from(source: T):
+    """
+    Process pool task, searches from one stop until every stop is settled
+
+    Returns: tuple of the distances to each stop (inf if unreachable), and the predecessor ids (-1 for none)
+
+    """
+    import numpy as np
+
+    result = dijkstra(_network, source, _stops)
+    row = np.array([result.distances.get(stop, np.inf) for stop in _stops], dtype=np.float64)
+    tree = np.full(len(_network_ids), -1, dtype=np.int32)
+    for vertex, predecessor in result.predecessors.items():
+        tree[_network_ids[vertex]] = _network_ids[predecessor]
+    return row, tree
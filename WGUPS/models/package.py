@@ -2,13 +2,75 @@ from __future__ import annotations
 
 # STL Imports
 import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Project Imports
 from WGUPS.models.address import Address
 from WGUPS.util.strings import tokenize, find_token, unpack_token
 
+# corrections for addresses flagged as invalid are received at this time of day
+ADDRESS_UPDATE_TIME = datetime.time(10, 20)
+
+
+@dataclass(frozen=True)
+class PackageConstraints:
+    """Delivery constraints of a package, parsed from its notes once, when the package is built"""
+    arrival: datetime.datetime | None = None            # arrives at the hub late, and can't be loaded before then
+    dependencies: tuple[int, ...] = ()                  # ids of the packages it must be delivered together with
+    truck: int | None = None                            # the truck it must be loaded on, numbered from 1
+    invalid_until: datetime.datetime | None = None      # its address is wrong until a correction is received
+    priority: bool = False                              # its deadline is before the end of the day
+    # derived from the above, so loading checks a package with a bitwise and, and a comparison
+    trucks: int = -1                                    # bit i is set if truck i + 1 may carry it, -1 for any truck
+    earliest: datetime.datetime | None = None           # loadable from this time on, the later of the two above
+
+
+def parse_notes(notes: str, deadline: datetime.datetime) -> PackageConstraints:
+    """
+    Parses the tokens in a package's notes, e.g. 'truck=2' or 'dep=13,15', into its delivery constraints
+
+    Args:
+        notes: str, the notes column of the package data
+        deadline: datetime, the package's deadline, which decides its priority
+
+    Returns: PackageConstraints
+
+    """
+    from WGUPS.util.time import datetime_from_string
+    notes = notes or ''
+
+    arrival = None
+    token = find_token(string=notes, key='arrival')
+    if token is not None:
+        arrival = datetime_from_string(unpack_token(token=token, delimited=True))
+
+    dependencies = ()
+    truck = None
+    for token in tokenize(notes):
+        if 'dep=' in token and not dependencies:
+            values = unpack_token(token)
+            if len(values) > 0:
+                dependencies = tuple(int(value) for value in values.split(sep=','))
+        elif 'truck=' in token and truck is None:
+            truck = int(unpack_token(token))
+
+    invalid_until = None
+    if find_token(string=notes, key='ADDRESS_INVALID') is not None:
+        invalid_until = datetime.datetime.combine(deadline.date(), ADDRESS_UPDATE_TIME)
+
+    # anything due before 23:59:59 is a priority, EOD deadlines are not
+    priority = deadline.hour < 23 and deadline.minute < 59 and deadline.second < 59
+
+    releases = [t for t in (arrival, invalid_until) if t is not None]
+    return PackageConstraints(arrival=arrival,
+                              dependencies=dependencies,
+                              truck=truck,
+                              invalid_until=invalid_until,
+                              priority=priority,
+                              trucks=1 << (truck - 1) if truck is not None else -1,
+                              earliest=max(releases) if releases else None)
+
 
 @dataclass(eq=True, order=True)
 class Package:
@@ -24,6 +86,13 @@ class Package:
     has_update: bool = False
     _in_dependency_chain: bool = False   # set True for all items linked in a dependency chain
     arrival: datetime = None
+    constraints: PackageConstraints = field(default=None, compare=False, repr=False)  # parsed from the notes when not given
+
+    def __post_init__(self) -> None:
+        if self.constraints is None:
+            self.constraints = parse_notes(self.notes, self._deadline)
+        if self.arrival is None:
+            self.arrival = self.constraints.arrival
 
     def __hash__(self) -> int:
         """
@@ -79,20 +148,11 @@ class Package:
         """
         Checks if a package is a late arrival.
 
-        Tokenizes data held in notes,
-        then parses out arrival time if the 'arrival=' key is present
-
-        Returns: time | None
+        Returns: time | None, the time it arrives at the hub
 
         """
-        token = find_token(string=self.notes, key='arrival')
-        if token is None:
-            return None
-        else:
-            value = unpack_token(token=token, delimited=True)
-            from WGUPS.util.time import time_from_string, datetime_from_string
-            self.arrival = datetime_from_string(value)
-            return time_from_string(value)
+        arrival = self.constraints.arrival
+        return arrival.time() if arrival is not None else None
 
     def has_dependency(self) -> list[int] | None:
         """
@@ -102,48 +162,25 @@ class Package:
         Returns: list[int] or None
 
         """
-        from WGUPS.util.strings import tokenize
-        if len(self.notes) > 0:
-            tokens = tokenize(self.notes)
-            for token in tokens:
-                key = 'dep='
-                if key in token:
-                    values = unpack_token(token)
-                    if len(values) == 0:
-                        return None
-                    elif len(values) == 1:
-                        return [int(values)]
-                    else:
-                        return [int(value) for value in values.split(sep=',')]
-        return None
+        dependencies = self.constraints.dependencies
+        return list(dependencies) if dependencies else None
 
-    def has_invalid_flag(self) -> bool | None:
+    def has_invalid_flag(self) -> bool:
         """
         Determines if a package has its address indicated as invalid by its notes
-        Returns: bool or None
+        Returns: bool
 
         """
-        token = find_token(string=self.notes, key='ADDRESS_INVALID')
-        if token is None:
-            return False
-        else:
-            return True
+        return self.constraints.invalid_until is not None
 
     def has_priority(self) -> bool:
         """
         Determines if a package has a priority requirement
 
-        Returns:
+        Returns: bool
 
         """
-        today = datetime.datetime.today()
-
-        day_ends = datetime.datetime(today.year, today.month, today.day, 23, 59, 59, 999999)
-        if self._deadline.hour < day_ends.hour \
-                and (self._deadline.minute < day_ends.minute) \
-                and (self._deadline.second < day_ends.second):
-            return True
-        return False
+        return self.constraints.priority
 
     def printable(self) -> str:
         """
@@ -205,14 +242,7 @@ class Package:
         Returns: int or None
 
         """
-
-        if len(self.notes) > 0:
-            tokens = tokenize(self.notes)
-            for token in tokens:
-                if 'truck=' in token:
-                    truck = unpack_token(token)
-                    return int(truck)
-        return None
+        return self.constraints.truck
 
 
 class PackageStatus(Enum):
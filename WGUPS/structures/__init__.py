@@ -1,3 +1,11 @@
+from .condensed import *
+from .disjointset import *
 from .graph import *
+from .graphfile import *
 from .hashtable import *
+from .index import *
+from .textindex import *
+from .kdtree import *
 from .linkedlist import *
+from .skiplist import *
+from .heap import *
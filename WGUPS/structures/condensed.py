@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+# STL Imports
+import inspect
+from enum import Enum
+
+# Project Imports
+from ..util import debug
+
+
+class Precision(Enum):
+    """Storage types available to a CondensedMatrix, valued by their NumPy dtype"""
+    Float64 = 'float64'
+    Float32 = 'float32'
+    Tenths = 'uint16'   # distances quantized to integer tenths, i.e. 0.0 to 6553.5
+
+
+class CondensedMatrix:
+    """
+    Symmetric matrix with a zero diagonal, stored as only its upper triangle in one flat array.
+
+    An n x n matrix keeps n(n-1)/2 values, rather than n^2, and (i, j) maps to its offset in constant time.
+    For 10,000 addresses that is ~400MB as Float64, ~200MB as Float32, or ~100MB as Tenths.
+
+    Big-O for Operations:
+    -----------------------------------------------
+    | Access | Update | from_square | Memory      |
+    | O(1)   | O(1)   | O(n^2)      | O(n(n-1)/2) |
+    -----------------------------------------------
+    """
+
+    def __init__(self, n: int, precision: Precision = Precision.Float64):
+        import numpy as np
+        self._n = n
+        self._precision = precision
+        self._data = np.zeros(n * (n - 1) // 2, dtype=precision.value)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, ij: tuple[int, int]) -> float:
+        i, j = ij
+        if i == j:
+            return 0.0
+        value = self._data[self._offset(i, j)]
+        if self._precision is Precision.Tenths:
+            return int(value) / 10
+        return float(value)
+
+    def __setitem__(self, ij: tuple[int, int], value: float) -> None:
+        i, j = ij
+        if i == j:
+            return
+        self._data[self._offset(i, j)] = self._quantize(value)
+
+    def __repr__(self):
+        return f'CondensedMatrix(n={self._n}, precision={self._precision.name})'
+
+    @property
+    def precision(self) -> Precision:
+        return self._precision
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    @classmethod
+    def from_square(cls, square, precision: Precision = Precision.Float64) -> CondensedMatrix:
+        """
+        Builds a condensed matrix from the upper triangle of a square matrix, one row slice at a time
+
+        Args:
+            square: array-like of shape (n, n)
+            precision: Precision
+
+        Returns: CondensedMatrix
+
+        """
+        import numpy as np
+        square = np.asarray(square)
+        condensed = cls(square.shape[0], precision)
+        condensed.set_upper_block(0, square)
+        return condensed
+
+    def set_upper_block(self, start: int, block) -> None:
+        """
+        Writes a block of rows from the upper triangle, such as one yielded by Ruler.compute_row_blocks(upper=True)
+
+        Args:
+            start: int, the row and column the block begins at
+            block: array-like of shape (k, n - start), rows [start, start + k) from column start onwards
+
+        """
+        import numpy as np
+        block = np.asarray(block)
+        n = self._n
+        if start < 0 or block.ndim != 2 or block.shape[1] != n - start or start + block.shape[0] > n:
+            raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
+        for r in range(block.shape[0]):
+            i = start + r
+            if i < n - 1:
+                offset = self._offset(i, i + 1)
+                self._data[offset:offset + (n - i - 1)] = self._quantize(block[r, r + 1:])
+
+    def row(self, i: int):
+        """
+        Gathers every distance from i into a full row
+
+        Returns: numpy.ndarray of shape (n,), as float64
+
+        """
+        import numpy as np
+        n = self._n
+        out = np.zeros(n, dtype=np.float64)
+        if i > 0:
+            # column i of the rows above: offset(j, i) for every j < i
+            above = np.arange(i)
+            out[:i] = self._data[above * n - above * (above + 1) // 2 + (i - above - 1)]
+        if i < n - 1:
+            start = self._offset(i, i + 1)
+            out[i + 1:] = self._data[start:start + (n - i - 1)]
+        if self._precision is Precision.Tenths:
+            out /= 10
+        return out
+
+    def to_square(self):
+        """Expands back into a full n x n float64 matrix"""
+        import numpy as np
+        return np.vstack([self.row(i) for i in range(self._n)]) if self._n else np.zeros((0, 0))
+
+    def resized(self, n: int) -> CondensedMatrix:
+        """
+        Copies into a larger matrix, existing distances keep their (i, j) positions
+
+        Returns: CondensedMatrix
+
+        """
+        grown = CondensedMatrix(n, self._precision)
+        old = self._n
+        for i in range(old - 1):
+            src, dst = self._offset(i, i + 1), grown._offset(i, i + 1)
+            grown._data[dst:dst + (old - i - 1)] = self._data[src:src + (old - i - 1)]
+        return grown
+
+    def _offset(self, i: int, j: int) -> int:
+        """Maps (i, j) to its position in the flat upper triangle"""
+        if i > j:
+            i, j = j, i
+        if i < 0 or j >= self._n:
+            raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
+        return i * self._n - i * (i + 1) // 2 + (j - i - 1)
+
+    def _quantize(self, value):
+        """Converts distances into the stored representation"""
+        import numpy as np
+        if self._precision is not Precision.Tenths:
+            return value
+        tenths = np.rint(np.asarray(value, dtype=np.float64) * 10)
+        # a missing or failed distance, NaN or infinity, would otherwise be cast to a 0.0 edge
+        if np.any(~np.isfinite(tenths)) or np.any(tenths < 0) or np.any(tenths > np.iinfo(np.uint16).max):
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        return tenths.astype(np.uint16)
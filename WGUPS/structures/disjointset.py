@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+# STL Imports
+import inspect
+from typing import Generic, Iterator, TypeVar
+
+# Project Imports
+from ..util import debug
+from .hashtable import HashTable
+
+T = TypeVar('T')
+
+
+class DisjointSet(Generic[T]):
+    """
+    Union-find over hashable elements, e.g. package ids, partitioned into disjoint sets
+
+    Every set is a tree of parent pointers, named by the element at its root. A union hangs the shallower tree
+    under the deeper one, union by rank, and every find points the elements it walks past straight at the root,
+    path compression. Together they keep trees so flat that each operation is effectively constant time.
+
+    Big-O for Operations:
+    -----------------------------------------
+    | Add  | Find    | Union   | Groups    |
+    | O(1) | O(α(n)) | O(α(n)) | O(n•α(n)) |
+    -----------------------------------------
+    amortized, α is the inverse Ackermann function, at most 4 for any practical n
+    """
+
+    def __init__(self, expected: int = 0):
+        self._parent: HashTable[T, T] = HashTable(expected=expected)
+        self._rank: HashTable[T, int] = HashTable(expected=expected)   # upper bound on a root's tree height
+        self._sets = 0
+
+    def __len__(self):
+        """The number of elements, across every set"""
+        return len(self._parent)
+
+    def __contains__(self, element: T) -> bool:
+        return self._parent.search(element)
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Allows iterating through elements, in the order they were added
+        Yields elements
+        """
+        for element, _ in self._parent.items():
+            yield element
+
+    def __repr__(self):
+        return f'DisjointSet(elements={len(self._parent)}, sets={self._sets})'
+
+    @property
+    def sets(self) -> int:
+        """The number of disjoint sets"""
+        return self._sets
+
+    def add(self, element: T) -> None:
+        """Adds an element in a set of its own, if it is not already present"""
+        if not self._parent.search(element):
+            self._parent[element] = element
+            self._rank[element] = 0
+            self._sets += 1
+
+    def find(self, element: T) -> T:
+        """
+        Finds the root naming the element's set, compressing the path walked
+
+        Returns: T, equal for any two elements in the same set
+
+        """
+        parent = self._parent
+        root = parent[element]
+        if root is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        while parent[root] != root:
+            root = parent[root]
+        # second pass, point every element on the path straight at the root
+        while element != root:
+            following = parent[element]
+            parent[element] = root
+            element = following
+        return root
+
+    def union(self, a: T, b: T) -> T:
+        """
+        Merges the sets holding a and b, adding either element if it is not yet present
+
+        Returns: T, the root of the merged set
+
+        """
+        self.add(a)
+        self.add(b)
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        rank_a, rank_b = self._rank[a], self._rank[b]
+        if rank_a < rank_b:
+            a, b = b, a
+        elif rank_a == rank_b:
+            self._rank[a] = rank_a + 1
+        self._parent[b] = a
+        self._sets -= 1
+        return a
+
+    def connected(self, a: T, b: T) -> bool:
+        """Checks whether two elements are in the same set"""
+        return a in self and b in self and self.find(a) == self.find(b)
+
+    def groups(self) -> list[list[T]]:
+        """
+        Lists the members of every set
+
+        Returns: list[list[T]], sets ordered by their first added element, members in the order they were added
+
+        """
+        groups: HashTable[T, list[T]] = HashTable(expected=self._sets)
+        # find rewrites parent pointers, so walk a snapshot of the elements rather than the table itself
+        for element in list(self):
+            root = self.find(element)
+            members = groups[root]
+            if members is None:
+                groups[root] = members = []
+            members.append(element)
+        return list(groups)
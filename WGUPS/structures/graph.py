@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 # STL Imports
-from typing import Generic, TypeVar
+import inspect
+from collections import OrderedDict
+from math import inf
+from typing import Generic, TYPE_CHECKING, TypeVar
 
 # Project Imports
+from .condensed import CondensedMatrix, Precision
+from .graphfile import read_graph, write_graph
 from .hashtable import HashTable
+from ..util import debug
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from WGUPS.core.ruler import Ruler
 
 T = TypeVar('T')
 
 
 class Graph(Generic[T]):
-    _edges: HashTable[T, HashTable[T, float]] = HashTable()  # Store Graph edges using our HashTable class
+    _edges: HashTable[T, HashTable[T, float]]  # Store Graph edges using our HashTable class
+
+    def __init__(self):
+        # each graph owns its edges, so several graphs can exist side by side
+        self._edges = HashTable()
 
     def __getitem__(self, item):
         return self._edges[item]
@@ -28,6 +42,50 @@ class Graph(Generic[T]):
     def __repr__(self):
         return 'Graph('.join([''.join(f'{i}: {edge})\n') for i, edge in enumerate(self._edges)]) + ')'
 
+    @property
+    def vertices(self) -> list[T]:
+        """Every vertex in the graph"""
+        return [vert for vert, _ in self._edges.items()]
+
+    def save(self, path: Path | str) -> None:
+        """
+        Saves the graph as a binary graph file, see graphfile.write_graph()
+        Vertices must be Addresses, missing edges are stored as infinity
+        """
+        import numpy as np
+        vertices = self.vertices
+        ids = {vert: i for i, vert in enumerate(vertices)}
+        distances = np.full((len(vertices), len(vertices)), np.inf)
+        np.fill_diagonal(distances, 0.0)
+        for i, vert in enumerate(vertices):
+            for neighbor, dist in self._edges[vert].items():
+                distances[i, ids[neighbor]] = dist
+        write_graph(path, vertices, distances)
+
+    @classmethod
+    def load(cls, path: Path | str, verify: bool = True) -> Graph:
+        """
+        Rebuilds a graph from a binary graph file, one directed edge per finite distance.
+        DenseGraph.load() maps the distances without copying them, and is the faster of the two.
+
+        Args:
+            path: Path | str
+            verify: bool, checks the file's checksum first
+
+        Returns: Graph[Address]
+
+        """
+        import numpy as np
+        vertices, distances = read_graph(path, verify)
+        graph = cls()
+        for vert in vertices:
+            graph.add_vertex(vert)
+        for i, vert in enumerate(vertices):
+            row = distances[i]
+            for j in np.flatnonzero(np.isfinite(row)).tolist():
+                graph.add_edge(vert, vertices[j], float(row[j]), is_directed=True)
+        return graph
+
     def add_vertex(self, vert: T) -> None:
         """
         Adds a vertex to the graph
@@ -123,3 +181,769 @@ class Graph(Generic[T]):
         for vertex in self._edges:
             d += len(vertex)
         return d // 2
+
+
+class DenseGraph(Generic[T]):
+    """
+    Graph backed by a contiguous 2D distance array
+
+    Each vertex is assigned an integer id once, when it is added. graph[a][b] maps both vertices to their ids
+    and reads one array cell. Ids are looked up by object identity first, which skips hashing the vertex when
+    the caller holds the same object that was added, and falls back to an equality lookup otherwise.
+    Missing edges are stored as infinity, and read back as None, like the HashTable Graph.
+
+    Big-O for Operations:
+    -------------------------------------------
+    | Access | Add Edge | Add Vertex | Memory |
+    | O(1)   | O(1)     | O(1)*      | O(n^2) |
+    -------------------------------------------
+    * amortized, storage doubles when it runs out of room
+    """
+
+    def __init__(self, capacity: int = 16):
+        import numpy as np
+        self._vertices: list[T] = []
+        self._ids: dict[int, int] = {}     # id(vertex) -> vertex id
+        self._index: dict[T, int] = {}     # vertex -> vertex id
+        self._matrix = np.full((capacity, capacity), np.inf)
+        self._shared = False               # set once a DistanceStore references the storage
+
+    def __getitem__(self, item: T) -> _DenseRow[T] | None:
+        i = self.id_of(item)
+        if i is None:
+            return None
+        return _DenseRow(self, i)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def __iter__(self):
+        for i in range(len(self._vertices)):
+            yield _DenseRow(self, i)
+
+    def __repr__(self):
+        return f'DenseGraph(vertices={len(self._vertices)}, edges={self.edge_sum()})'
+
+    @classmethod
+    def from_matrix(cls, vertices: list[T], distances) -> DenseGraph[T]:
+        """
+        Builds a complete graph in one step from a square distance matrix, such as the one from Ruler.compute_matrix()
+
+        Args:
+            vertices: list[T], in the same order as the matrix rows
+            distances: array-like of shape (n, n)
+
+        Returns: DenseGraph[T]
+
+        """
+        import numpy as np
+        graph = cls(capacity=len(vertices))
+        for vert in vertices:
+            graph.add_vertex(vert)
+        n = len(vertices)
+        graph._matrix[:n, :n] = np.asarray(distances, dtype=np.float64)
+        np.fill_diagonal(graph._matrix, 0.0)
+        return graph
+
+    def save(self, path: Path | str) -> None:
+        """
+        Saves the graph as a binary graph file, see graphfile.write_graph()
+        Vertices must be Addresses
+        """
+        n = len(self._vertices)
+        write_graph(path, self._vertices, self._matrix[:n, :n])
+
+    @classmethod
+    def load(cls, path: Path | str, verify: bool = True) -> DenseGraph:
+        """
+        Maps a binary graph file as the graph's storage, without reading the distances into memory.
+        The mapping is read-only, and is copied the first time the graph is edited.
+
+        Args:
+            path: Path | str
+            verify: bool, checks the file's checksum first, skip it for the fastest cold start
+
+        Returns: DenseGraph[Address]
+
+        """
+        vertices, distances = read_graph(path, verify)
+        graph = cls(capacity=0)
+        graph._vertices = vertices
+        graph._ids = {id(vert): i for i, vert in enumerate(vertices)}
+        graph._index = {vert: i for i, vert in enumerate(vertices)}
+        graph._matrix = distances
+        graph._shared = True
+        return graph
+
+    @property
+    def vertices(self) -> list[T]:
+        """Vertices in id order"""
+        return self._vertices
+
+    def id_of(self, vert: T) -> int | None:
+        """Retrieves the integer id assigned to a vertex"""
+        i = self._ids.get(id(vert))
+        if i is None:
+            i = self._index.get(vert)
+        return i
+
+    def distance(self, i: int, j: int) -> float | None:
+        """Reads a distance by vertex ids, skipping the vertex lookups entirely"""
+        d = self._matrix[i, j]
+        return None if d == inf else float(d)
+
+    def freeze(self) -> DistanceStore[T]:
+        """
+        Publishes the current distances as a read-only DistanceStore, without copying them.
+        Later edits to this graph copy the storage first, so the store never changes underneath its readers.
+
+        Returns: DistanceStore[T]
+
+        """
+        n = len(self._vertices)
+        self._shared = True
+        return DistanceStore(self._vertices[:], self._matrix[:n, :n])
+
+    def add_vertex(self, vert: T) -> None:
+        """
+        Adds a vertex to the graph, assigning it the next integer id
+        """
+        if self.id_of(vert) is not None:
+            return
+        i = len(self._vertices)
+        if i == self._matrix.shape[0]:
+            self._grow(max(16, 2 * i))
+        self._detach()
+        self._vertices.append(vert)
+        self._ids[id(vert)] = i
+        self._index[vert] = i
+        self._matrix[i, i] = 0.0
+
+    def add_edge(self, vert_a: T, vert_b: T, dist: float, is_directed: bool = False) -> None:
+        """
+        Adds a directed or undirected edge accordingly
+        """
+        a, b = self.id_of(vert_a), self.id_of(vert_b)
+        if a is None or b is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        if a == b:
+            return
+        self._detach()
+        self._matrix[a, b] = dist
+        if not is_directed:
+            self._matrix[b, a] = dist
+
+    def remove_edge(self, vert_a: T, vert_b: T, is_directed: bool = False) -> None:
+        """
+        Removes a directed or undirected edge accordingly
+        """
+        a, b = self.id_of(vert_a), self.id_of(vert_b)
+        if a is None or b is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        if a == b:
+            return
+        self._detach()
+        self._matrix[a, b] = inf
+        if not is_directed:
+            self._matrix[b, a] = inf
+
+    def degree(self, vert_a: T) -> int:
+        """
+        Finds the degree of a vertex
+        Args:
+            vert_a: T
+
+        Returns: int
+
+        """
+        import numpy as np
+        i = self.id_of(vert_a)
+        if i is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        n = len(self._vertices)
+        return int(np.count_nonzero(np.isfinite(self._matrix[i, :n]))) - 1
+
+    def vertex_sum(self) -> int:
+        return len(self._vertices)
+
+    def edge_sum(self) -> int:
+        """
+        Finds the number of edges in the graph.
+        Assumes the graph is undirected at the moment.
+
+        Returns: int
+
+        """
+        import numpy as np
+        n = len(self._vertices)
+        return (int(np.count_nonzero(np.isfinite(self._matrix[:n, :n]))) - n) // 2
+
+    def _grow(self, capacity: int) -> None:
+        """Copies the distances into a larger array"""
+        import numpy as np
+        n = len(self._vertices)
+        grown = np.full((capacity, capacity), np.inf)
+        grown[:n, :n] = self._matrix[:n, :n]
+        self._matrix = grown
+        self._shared = False
+
+    def _detach(self) -> None:
+        """Copy-on-write, takes a private copy of storage that a DistanceStore still references"""
+        if self._shared:
+            self._matrix = self._matrix.copy()
+            self._shared = False
+
+
+class _DenseRow(Generic[T]):
+    """
+    A view of a single vertex's distances in a DenseGraph
+    The graph's storage is looked up on every read, since growing or copy-on-write replaces it
+    """
+    __slots__ = ('_graph', '_i')
+
+    def __init__(self, graph: DenseGraph[T], i: int):
+        self._graph = graph
+        self._i = i
+
+    def __getitem__(self, item: T) -> float | None:
+        j = self._graph.id_of(item)
+        if j is None:
+            return None
+        d = self._graph._matrix[self._i, j]
+        return None if d == inf else float(d)
+
+    def __len__(self):
+        return self._graph.degree(self._graph.vertices[self._i])
+
+    def __iter__(self):
+        for _, dist in self.items():
+            yield dist
+
+    def items(self):
+        """Yields neighbor, distance pairs as tuples"""
+        for j, vert in enumerate(self._graph.vertices):
+            d = self._graph._matrix[self._i, j]
+            if j != self._i and d != inf:
+                yield vert, float(d)
+
+
+class DistanceStore(Generic[T]):
+    """
+    Read-only distances, shared by reference between any number of graphs and hubs
+
+    The store never changes once built, so it is safe to hand the same one to several planning scenarios.
+    Wrap it in a GraphOverlay to change edges for a single scenario, such as a closed road, without copying it.
+    Reads work the same as a DenseGraph: graph[a][b], or distance(i, j) by vertex id.
+    """
+
+    def __init__(self, vertices: list[T], distances):
+        import numpy as np
+        self._vertices: list[T] = list(vertices)
+        self._ids: dict[int, int] = {id(vert): i for i, vert in enumerate(self._vertices)}
+        self._index: dict[T, int] = {vert: i for i, vert in enumerate(self._vertices)}
+
+        # a read-only view, no copy is made of arrays that are already float64, e.g. a memory-mapped cache
+        self._matrix = np.asarray(distances, dtype=np.float64).view()
+        self._matrix.flags.writeable = False
+
+    def __getitem__(self, item: T) -> _DenseRow[T] | None:
+        i = self.id_of(item)
+        if i is None:
+            return None
+        return _DenseRow(self, i)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def __iter__(self):
+        for i in range(len(self._vertices)):
+            yield _DenseRow(self, i)
+
+    def __repr__(self):
+        return f'DistanceStore(vertices={len(self._vertices)})'
+
+    @property
+    def vertices(self) -> list[T]:
+        """Vertices in id order"""
+        return self._vertices
+
+    def id_of(self, vert: T) -> int | None:
+        """Retrieves the integer id assigned to a vertex"""
+        i = self._ids.get(id(vert))
+        if i is None:
+            i = self._index.get(vert)
+        return i
+
+    def distance(self, i: int, j: int) -> float | None:
+        """Reads a distance by vertex ids, skipping the vertex lookups entirely"""
+        d = self._matrix[i, j]
+        return None if d == inf else float(d)
+
+    def degree(self, vert_a: T) -> int:
+        """
+        Finds the degree of a vertex
+
+        Returns: int
+
+        """
+        import numpy as np
+        i = self.id_of(vert_a)
+        if i is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        return int(np.count_nonzero(np.isfinite(self._matrix[i]))) - 1
+
+    def vertex_sum(self) -> int:
+        return len(self._vertices)
+
+    def edge_sum(self) -> int:
+        """
+        Finds the number of edges, assuming they are undirected
+
+        Returns: int
+
+        """
+        import numpy as np
+        return (int(np.count_nonzero(np.isfinite(self._matrix))) - len(self._vertices)) // 2
+
+
+class GraphOverlay(Generic[T]):
+    """
+    Local edge overrides on top of a DistanceStore or DenseGraph, which is never modified
+
+    Only the overridden edges are stored, so each scenario costs memory for its changes, not another O(n^2) matrix.
+    Removing an edge, e.g. a closed road, makes it read back as None. Overlays can be stacked on other overlays.
+
+    Big-O Analysis:
+        Access: O(1), a dict check on the overridden row, then the base lookup
+        Memory: O(k), for k overridden edges
+    """
+
+    def __init__(self, base: DistanceStore[T] | DenseGraph[T] | GraphOverlay[T]):
+        self._base = base
+        self._overrides: dict[int, dict[int, float | None]] = {}   # vertex id -> vertex id -> distance
+
+    def __getitem__(self, item: T) -> _OverlayRow[T] | None:
+        i = self.id_of(item)
+        if i is None:
+            return None
+        return _OverlayRow(self, i)
+
+    def __len__(self):
+        return len(self._base)
+
+    def __iter__(self):
+        for i in range(len(self._base)):
+            yield _OverlayRow(self, i)
+
+    def __repr__(self):
+        return f'GraphOverlay(base={self._base!r}, overrides={sum(len(row) for row in self._overrides.values())})'
+
+    @property
+    def base(self) -> DistanceStore[T] | DenseGraph[T] | GraphOverlay[T]:
+        return self._base
+
+    @property
+    def vertices(self) -> list[T]:
+        return self._base.vertices
+
+    def id_of(self, vert: T) -> int | None:
+        return self._base.id_of(vert)
+
+    def distance(self, i: int, j: int) -> float | None:
+        """Reads a distance by vertex ids, overrides first"""
+        row = self._overrides.get(i)
+        if row is not None and j in row:
+            return row[j]
+        return self._base.distance(i, j)
+
+    def add_edge(self, vert_a: T, vert_b: T, dist: float, is_directed: bool = False) -> None:
+        """
+        Overrides a directed or undirected edge accordingly
+        """
+        self._override(vert_a, vert_b, dist, is_directed)
+
+    def remove_edge(self, vert_a: T, vert_b: T, is_directed: bool = False) -> None:
+        """
+        Hides a directed or undirected edge accordingly, e.g. for a closed road
+        """
+        self._override(vert_a, vert_b, None, is_directed)
+
+    def reset(self) -> None:
+        """Drops every override, reverting to the base distances"""
+        self._overrides.clear()
+
+    def degree(self, vert_a: T) -> int:
+        """
+        Finds the degree of a vertex, with overrides applied
+
+        Returns: int
+
+        """
+        degree = self._base.degree(vert_a)
+        i = self.id_of(vert_a)
+        for j, dist in self._overrides.get(i, {}).items():
+            degree += (dist is not None) - (self._base.distance(i, j) is not None)
+        return degree
+
+    def vertex_sum(self) -> int:
+        return self._base.vertex_sum()
+
+    def edge_sum(self) -> int:
+        """
+        Finds the number of edges, with overrides applied, assuming they are undirected
+
+        Returns: int
+
+        """
+        change = 0
+        for i, row in self._overrides.items():
+            for j, dist in row.items():
+                change += (dist is not None) - (self._base.distance(i, j) is not None)
+        return self._base.edge_sum() + change // 2
+
+    def _override(self, vert_a: T, vert_b: T, dist: float | None, is_directed: bool) -> None:
+        a, b = self.id_of(vert_a), self.id_of(vert_b)
+        if a is None or b is None:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        if a == b:
+            return
+        self._overrides.setdefault(a, {})[b] = dist
+        if not is_directed:
+            self._overrides.setdefault(b, {})[a] = dist
+
+
+class _OverlayRow(Generic[T]):
+    """
+    A view of a single vertex's distances in a GraphOverlay
+    Overrides are looked up on every read, so edits and resets made after the view was handed out are seen
+    """
+    __slots__ = ('_graph', '_i')
+
+    def __init__(self, graph: GraphOverlay[T], i: int):
+        self._graph = graph
+        self._i = i
+
+    def __getitem__(self, item: T) -> float | None:
+        j = self._graph.id_of(item)
+        if j is None:
+            return None
+        overrides = self._graph._overrides.get(self._i)
+        if overrides is not None and j in overrides:
+            return overrides[j]
+        return self._graph.base.distance(self._i, j)
+
+    def __len__(self):
+        return self._graph.degree(self._graph.vertices[self._i])
+
+    def __iter__(self):
+        for _, dist in self.items():
+            yield dist
+
+    def items(self):
+        """Yields neighbor, distance pairs as tuples"""
+        for j, vert in enumerate(self._graph.vertices):
+            d = self._graph.distance(self._i, j)
+            if j != self._i and d is not None:
+                yield vert, d
+
+
+class CondensedGraph(Generic[T]):
+    """
+    Complete, undirected graph backed by a CondensedMatrix
+
+    Each distance is stored once, in the upper triangle of a flat array, at the chosen Precision.
+    Vertices are mapped to their row index once, so graph[a][b] is two index lookups and an O(1) offset.
+    """
+
+    def __init__(self, precision: Precision = Precision.Float64):
+        self._vertices: list[T] = []
+        self._index: HashTable[T, int] = HashTable()
+        self._matrix = CondensedMatrix(0, precision)
+
+    def __getitem__(self, item: T) -> _Row[T]:
+        i = self._index[item]
+        if i is None:
+            return None
+        return _Row(self, i)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def __iter__(self):
+        for i in range(len(self._vertices)):
+            yield _Row(self, i)
+
+    def __repr__(self):
+        return f'CondensedGraph(vertices={len(self._vertices)}, {self._matrix})'
+
+    @classmethod
+    def from_matrix(cls, vertices: list[T], distances, precision: Precision = Precision.Float64) -> CondensedGraph[T]:
+        """
+        Builds the graph in one step from a square distance matrix, such as the one from Ruler.compute_matrix()
+
+        Args:
+            vertices: list[T], in the same order as the matrix rows
+            distances: array-like of shape (n, n)
+            precision: Precision
+
+        Returns: CondensedGraph[T]
+
+        """
+        graph = cls(precision)
+        for vert in vertices:
+            if graph._index[vert] is None:
+                graph._index[vert] = len(graph._vertices)
+                graph._vertices.append(vert)
+        graph._matrix = CondensedMatrix.from_square(distances, precision)
+        return graph
+
+    @classmethod
+    def from_upper_blocks(cls, vertices: list[T], blocks, precision: Precision = Precision.Float64) \
+            -> CondensedGraph[T]:
+        """
+        Builds the graph one block of rows at a time, such as from Ruler.compute_row_blocks(upper=True),
+        so the full square matrix never has to exist
+
+        Args:
+            vertices: list[T], in the same order as the matrix rows, without duplicates
+            blocks: Iterable[tuple[int, array-like]], each block's first row, and its rows from that column onwards
+            precision: Precision
+
+        Returns: CondensedGraph[T]
+
+        """
+        graph = cls(precision)
+        for vert in vertices:
+            if graph._index[vert] is not None:
+                raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+            graph._index[vert] = len(graph._vertices)
+            graph._vertices.append(vert)
+        graph._matrix = CondensedMatrix(len(vertices), precision)
+        for start, block in blocks:
+            graph._matrix.set_upper_block(start, block)
+        return graph
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the distance storage"""
+        return self._matrix.nbytes
+
+    def add_vertex(self, vert: T) -> None:
+        """
+        Adds a vertex to the graph
+        Adding a vertex after edges exist reallocates the distance storage, so prefer adding all vertices first
+        """
+        if self._index[vert] is not None:
+            return
+        self._index[vert] = len(self._vertices)
+        self._vertices.append(vert)
+        self._matrix = self._matrix.resized(len(self._vertices))
+
+    def add_edge(self, vert_a: T, vert_b: T, dist: float, is_directed: bool = False) -> None:
+        """
+        Sets the distance between two vertices
+        Storage is symmetric, so directed edges are not supported
+        """
+        if is_directed:
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        self._matrix[self._index[vert_a], self._index[vert_b]] = dist
+
+    def degree(self, vert_a: T) -> int:
+        """
+        Every vertex neighbors every other vertex in a complete graph
+
+        Returns: int
+
+        """
+        return len(self._vertices) - 1
+
+    def vertex_sum(self) -> int:
+        return len(self._vertices)
+
+    def edge_sum(self) -> int:
+        """
+        Number of undirected edges in the complete graph
+
+        Returns: int
+
+        """
+        n = len(self._vertices)
+        return n * (n - 1) // 2
+
+
+class _Row(Generic[T]):
+    """A view of a single vertex's distances, so graph[a][b] reads straight from the backing storage"""
+    __slots__ = ('_graph', '_i')
+
+    def __init__(self, graph, i: int):
+        self._graph = graph
+        self._i = i
+
+    def __getitem__(self, item: T) -> float | None:
+        j = self._graph._index[item]
+        if j is None:
+            return None
+        return self._graph._matrix[self._i, j]
+
+    def __len__(self):
+        return self._graph.degree(None)
+
+    def __iter__(self):
+        for _, dist in self.items():
+            yield dist
+
+    def items(self):
+        """Yields neighbor, distance pairs as tuples"""
+        for j, vert in enumerate(self._graph._vertices):
+            if j != self._i:
+                yield vert, self._graph._matrix[self._i, j]
+
+
+class LazyGraph(Generic[T]):
+    """
+    Complete, undirected graph whose distances are computed on demand
+
+    Nothing is computed when vertices are added. The first time graph[a][b] is read, the whole row for a
+    is computed with the Ruler in one vectorized call, and kept in a least-recently-used cache of at most
+    max_rows rows. Since distances are symmetric, a cached row for b also answers graph[a][b].
+
+    Vertices must have a coordinate attribute, as an Address does.
+
+    Big-O Analysis:
+        add_vertex: O(1)
+        graph[a][b]: O(1) on a hit, O(n) to compute a row on a miss
+        Memory: O(max_rows • n), rather than O(n^2)
+    """
+
+    def __init__(self, ruler: Ruler, precision: int = 1, max_rows: int = 1024):
+        self._ruler = ruler
+        self._precision = precision
+        self._max_rows = max(1, max_rows)
+        self._vertices: list[T] = []
+        self._index: HashTable[T, int] = HashTable()
+        self._coordinates = None
+        self._rows: OrderedDict[int, object] = OrderedDict()
+
+        # cache counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getitem__(self, item: T) -> _LazyRow[T]:
+        i = self._index[item]
+        if i is None:
+            return None
+        return _LazyRow(self, i)
+
+    def __len__(self):
+        return len(self._vertices)
+
+    def __iter__(self):
+        for i in range(len(self._vertices)):
+            yield _LazyRow(self, i)
+
+    def __repr__(self):
+        return f'LazyGraph(vertices={len(self._vertices)}, rows cached={len(self._rows)}/{self._max_rows}, ' \
+               f'hits={self.hits}, misses={self.misses}, evictions={self.evictions})'
+
+    def add_vertex(self, vert: T) -> None:
+        """
+        Adds a vertex to the graph
+        Cached rows no longer cover every vertex afterwards, so they are dropped
+        """
+        if self._index[vert] is not None:
+            return
+        self._index[vert] = len(self._vertices)
+        self._vertices.append(vert)
+        self._coordinates = None
+        self._rows.clear()
+
+    def degree(self, vert_a: T) -> int:
+        """
+        Every vertex neighbors every other vertex in a complete graph
+
+        Returns: int
+
+        """
+        return len(self._vertices) - 1
+
+    def vertex_sum(self) -> int:
+        return len(self._vertices)
+
+    def edge_sum(self) -> int:
+        """
+        Number of undirected edges in the complete graph, computed or not
+
+        Returns: int
+
+        """
+        n = len(self._vertices)
+        return n * (n - 1) // 2
+
+    def cache_info(self) -> tuple[int, int, int, int]:
+        """
+        Cache counters, in the same spirit as functools.lru_cache
+
+        Returns: tuple of hits, misses, evictions, rows currently cached
+
+        """
+        return self.hits, self.misses, self.evictions, len(self._rows)
+
+    def clear_cache(self) -> None:
+        self._rows.clear()
+
+    def _distance(self, i: int, j: int) -> float:
+        """Reads a distance out of the row cache, computing row i on a miss"""
+        if i == j:
+            return 0.0
+        row = self._rows.get(i)
+        if row is not None:
+            self._rows.move_to_end(i)
+            self.hits += 1
+            return float(row[j])
+        row = self._rows.get(j)
+        if row is not None:
+            self._rows.move_to_end(j)
+            self.hits += 1
+            return float(row[i])
+        self.misses += 1
+        return float(self._compute_row(i)[j])
+
+    def _compute_row(self, i: int):
+        """Computes every distance from vertex i, and caches the row, evicting the least recently used"""
+        if self._coordinates is None:
+            self._coordinates = self._ruler._to_degrees([vert.coordinate for vert in self._vertices])
+        row = self._ruler.compute_matrix(self._coordinates[i:i + 1], self._coordinates, self._precision)[0]
+        self._rows[i] = row
+        if len(self._rows) > self._max_rows:
+            self._rows.popitem(last=False)
+            self.evictions += 1
+        return row
+
+
+class _LazyRow(Generic[T]):
+    """A view of a single vertex's distances in a LazyGraph, nothing is computed until it is indexed"""
+    __slots__ = ('_graph', '_i')
+
+    def __init__(self, graph: LazyGraph[T], i: int):
+        self._graph = graph
+        self._i = i
+
+    def __getitem__(self, item: T) -> float | None:
+        j = self._graph._index[item]
+        if j is None:
+            return None
+        return self._graph._distance(self._i, j)
+
+    def __len__(self):
+        return self._graph.degree(None)
+
+    def __iter__(self):
+        for _, dist in self.items():
+            yield dist
+
+    def items(self):
+        """Yields neighbor, distance pairs as tuples"""
+        for j, vert in enumerate(self._graph._vertices):
+            if j != self._i:
+                yield vert, self._graph._distance(self._i, j)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+# STL Imports
+import inspect
+import os
+import struct
+import zlib
+from pathlib import Path
+
+# Project Imports
+from ..util import debug
+
+# bump whenever the layout below changes, older files are rejected rather than misread
+GRAPH_FILE_VERSION = 1
+
+_MAGIC = b'WGPG'
+# magic, version, reserved, vertices, strings, string offsets at, vertex table at, distances at, file size, crc32
+_HEADER = struct.Struct('<4sHHQQQQQQI4x')
+_ALIGN = 64
+_ADDRESS_FIELDS = ('name', 'street', 'city', 'state', 'postal')
+
+
+def vertex_dtype():
+    import numpy as np
+    return np.dtype([(f, '<u4') for f in _ADDRESS_FIELDS] + [('_pad', '<u4'), ('lat', '<f8'), ('long', '<f8')])
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def pack_addresses(vertices: list):
+    """
+    Encodes addresses as plain arrays, interning their strings, cities, states and zip codes repeat across most of
+    the address book
+
+    Returns: tuple[numpy.ndarray, numpy.ndarray, bytes], the vertex table, the string offsets, and the string blob
+
+    """
+    import numpy as np
+
+    interned: dict[str, int] = {}
+    table = np.zeros(len(vertices), dtype=vertex_dtype())
+    for i, vert in enumerate(vertices):
+        for f in _ADDRESS_FIELDS:
+            table[f][i] = interned.setdefault(getattr(vert, f), len(interned))
+        table['lat'][i] = vert.coordinate.lat
+        table['long'][i] = vert.coordinate.long
+
+    encoded = [s.encode('utf-8') for s in interned]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return table, offsets, b''.join(encoded)
+
+
+def unpack_addresses(table, offsets, blob: bytes) -> list:
+    """
+    Decodes addresses encoded by pack_addresses(), checking every string id is in range
+
+    Returns: list[Address]
+
+    """
+    from WGUPS.models.address import Address, Coordinate
+
+    offsets = [int(o) for o in offsets]
+    if any(offsets[k] > offsets[k + 1] for k in range(len(offsets) - 1)) or (offsets and offsets[-1] > len(blob)):
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    text = [bytes(blob[offsets[k]:offsets[k + 1]]).decode('utf-8') for k in range(len(offsets) - 1)]
+    for f in _ADDRESS_FIELDS:
+        if len(table) and int(table[f].max()) >= len(text):
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    return [Address(*(text[record[f]] for f in _ADDRESS_FIELDS),
+                    coordinate=Coordinate(lat=float(record['lat']), long=float(record['long'])))
+            for record in table]
+
+
+def write_graph(path: Path | str, vertices: list, distances) -> None:
+    """
+    Writes addresses and their distances to a binary graph file
+
+    Layout, all little-endian:
+        header          64 bytes, see _HEADER, the crc32 covers every byte after the header
+        string offsets  uint64[strings + 1], into the string blob
+        string blob     utf-8, each distinct string stored once
+        vertex table    one record per vertex, string ids for each address field, then lat/long as float64
+        distances       float64[n, n], row-major, missing edges as infinity
+
+    The string offsets, vertex table and distances each start on a 64 byte boundary, so they can be mapped in place.
+
+    Args:
+        path: Path | str
+        vertices: list[Address], in the same order as the distance rows
+        distances: array-like of shape (n, n)
+
+    """
+    import numpy as np
+
+    n = len(vertices)
+    distances = np.ascontiguousarray(distances, dtype='<f8')
+    if distances.shape != (n, n):
+        # one distance per pair of vertices
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+
+    table, offsets, blob = pack_addresses(vertices)
+    strings = len(offsets) - 1
+
+    offsets_at = _aligned(_HEADER.size)
+    table_at = _aligned(offsets_at + offsets.nbytes + len(blob))
+    distances_at = _aligned(table_at + table.nbytes)
+    size = distances_at + distances.nbytes
+
+    # write to a temporary file first, so a partially written graph is never picked up,
+    # the header is filled in last, once the checksum of everything after it is known
+    path = Path(path)
+    temp = path.with_suffix(path.suffix + '.tmp')
+    crc = 0
+    with open(temp, 'wb') as file:
+        file.write(bytes(_HEADER.size))
+        for at, data in ((offsets_at, offsets.tobytes() + blob), (table_at, table.tobytes()),
+                         (distances_at, memoryview(distances).cast('B') if n else b'')):
+            padding = bytes(at - file.tell())
+            crc = zlib.crc32(data, zlib.crc32(padding, crc))
+            file.write(padding)
+            file.write(data)
+        file.seek(0)
+        file.write(_HEADER.pack(_MAGIC, GRAPH_FILE_VERSION, 0, n, strings,
+                                offsets_at, table_at, distances_at, size, crc))
+    os.replace(temp, path)
+
+
+def read_graph(path: Path | str, verify: bool = True):
+    """
+    Maps a binary graph file written by write_graph()
+
+    Only the vertex table is decoded into Address objects, the distances stay memory-mapped
+    and are paged in from disk as they are read.
+
+    Args:
+        path: Path | str
+        verify: bool, checks the crc32 of the whole file, which reads every page once
+
+    Returns: tuple[list[Address], numpy.ndarray], the distances are a read-only memory map of shape (n, n)
+
+    """
+    import numpy as np
+
+    mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    if mapped.size < _HEADER.size:
+        # truncated header
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    magic, version, _, n, strings, offsets_at, table_at, distances_at, size, crc = \
+        _HEADER.unpack(mapped[:_HEADER.size].tobytes())
+    if magic != _MAGIC:
+        # not a graph file
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    if version != GRAPH_FILE_VERSION:
+        # written by another version of the format
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    if mapped.size != size or distances_at + n * n * 8 != size:
+        # truncated, or the header's sizes disagree
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+    if verify and zlib.crc32(mapped[_HEADER.size:]) != crc:
+        # corrupted after it was written
+        raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+
+    offsets = mapped[offsets_at:offsets_at + (strings + 1) * 8].view('<u8')
+    blob_at = offsets_at + (strings + 1) * 8
+    dtype = vertex_dtype()
+    table = mapped[table_at:table_at + n * dtype.itemsize].view(dtype)
+    vertices = unpack_addresses(table, offsets, mapped[blob_at:table_at])
+
+    distances = mapped[distances_at:size].view('<f8').reshape(n, n)
+    return vertices, distances
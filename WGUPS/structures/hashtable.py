@@ -2,35 +2,129 @@ from __future__ import annotations
 
 # STL Imports
 import inspect
-from typing import Generic, Optional, TypeVar
+from typing import Generic, TypeVar
 
 # Project Imports
-from .linkedlist import LinkedList, Node
 from ..util import debug
 
 Key = TypeVar('Key')
 Value = TypeVar('Value')
 
+# markers in the slot index, for slots that have never been used, and for slots whose key was deleted
+_FREE = -1
+_TOMBSTONE = -2
+# marker in the entry arrays, for an entry whose key was deleted
+_DELETED = object()
+
+# the table grows once more than 2/3 of its slots hold a live key or a tombstone, and shrinks once at most 1/8 hold
+# a live key, either way it is resized to at most 1/2 full, so a resize never lands near the opposite threshold
+_GROW_LOAD = 2 / 3
+_SHRINK_LOAD = 1 / 8
+_TARGET_LOAD = 1 / 2
+_MIN_SLOTS = 8
+# fewest entries moved into the new table by each insert or delete, while a resize is in progress
+_MIN_STEP = 8
+
+
+class _Migration:
+    """The previous storage of a HashTable, kept searchable until every entry is moved into the new storage"""
+    __slots__ = ('keys', 'values', 'hashes', 'slots', 'mask', 'cursor', 'step')
+
+    def __init__(self, keys: list, values: list, hashes: list[int], slots: list[int], step: int):
+        self.keys = keys
+        self.values = values
+        self.hashes = hashes
+        self.slots = slots
+        self.mask = len(slots) - 1
+        self.cursor = 0     # entries before the cursor have been moved
+        self.step = step
+
+    def find(self, key, h: int) -> int:
+        """
+        Probes the old slot index, entries that were already moved count as tombstones
+
+        Returns: int, the slot pointing at the key's entry, -1 if it is not found
+
+        """
+        slots, keys, hashes, cursor = self.slots, self.keys, self.hashes, self.cursor
+        i = h & self.mask
+        while True:
+            e = slots[i]
+            if e == _FREE:
+                return -1
+            if e >= cursor and hashes[e] == h and (keys[e] is key or keys[e] == key):
+                return i
+            i = (i + 1) & self.mask
+
+    def append(self, key, value, h: int) -> None:
+        """Adds a new key behind the cursor, so it is moved after every older key, keeping insertion order"""
+        slots, cursor = self.slots, self.cursor
+        i = h & self.mask
+        while slots[i] != _TOMBSTONE and slots[i] >= cursor:
+            i = (i + 1) & self.mask
+        slots[i] = len(self.keys)
+        self.keys.append(key)
+        self.values.append(value)
+        self.hashes.append(h)
 
-class HashTable(Generic[Key, Value]):
-    _storage = list[LinkedList[tuple[Key, Value]]]
-    _buckets = int
-    _keys = int
 
-    def __init__(self, buckets=2):
-        self._keys: int = 0
-        self._buckets: int = buckets
-        self._storage: list[LinkedList[tuple[Key, Value]]] = [LinkedList() for _ in range(self._buckets)]
+class HashTable(Generic[Key, Value]):
+    """
+    Open-addressing HashTable, linear probing with tombstones
+
+    Entries are appended to three parallel lists, keys, values, and the cached hash of each key,
+    so the table iterates in insertion order. A separate slot index maps hashes to entries:
+    a lookup probes consecutive slots from the key's home slot, and only compares keys whose cached hash matches,
+    so keys are rarely hashed or compared more than once. Deleted keys leave a tombstone in the index,
+    which keeps later keys in the same probe run reachable, and is reused by the next insert.
+
+    Resizing is incremental. The old storage stays searchable alongside the new storage,
+    and each insert or delete moves a bounded number of entries across, until the old storage is empty.
+    No single operation pays for rehashing the whole table.
+
+    Big-O for Operations:
+    --------------------------------------
+    | Access | Search | Insert | Delete |
+    | O(1)*  | O(1)*  | O(1)*  | O(1)*  |
+    --------------------------------------
+    * on average, the slot index is at most 2/3 full, and a resize moves O(1) entries per operation
+    """
+    _slots: list[int]       # slot -> entry, or _FREE/_TOMBSTONE
+    _entry_keys: list
+    _entry_values: list
+    _entry_hashes: list[int]
+    _buckets: int           # number of slots, always a power of 2
+    _keys: int              # number of live keys, across the old and new storage
+    _used: int              # number of slots holding a live key or a tombstone
+    _old: _Migration | None
+
+    def __init__(self, buckets: int = 2, expected: int = 0):
+        """
+        Args:
+            buckets: int, the minimum number of slots to start with
+            expected: int, the number of keys the table should hold without resizing
+        """
+        self._keys = 0
+        self._old = None
+        self._allocate(self._slots_for(max(buckets, int(expected / _GROW_LOAD) + 1)))
 
     def __getitem__(self, key: Key) -> Value | None:
         """
         Implements retrieving an item when provided a key
-        ex: hashtable[key] returns value
+        ex: hashtable[key] returns value, or None if the key is not found
         """
         if key is None:
             raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
-        b = self._hash(key)
-        return self._search_bucket(b, key)
+        h = hash(key)
+        slot = self._find(key, h)
+        if slot >= 0:
+            return self._entry_values[self._slots[slot]]
+        old = self._old
+        if old is not None:
+            slot = old.find(key, h)
+            if slot >= 0:
+                return old.values[old.slots[slot]]
+        return None
 
     def __setitem__(self, key: Key, value: Value):
         """
@@ -43,32 +137,59 @@ class HashTable(Generic[Key, Value]):
         if key is None:
             raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
 
-        # check if a resize is required
-        if self._keys >= (8 * self._buckets):
-            self._resize(2 * self._buckets)
-
-        # locate appropriate bucket
-        b = self._hash(key)
-
-        #
-        #   Note: Bad bug was here, the next block resolves it.
-        #         Prior to the check below, items were having multiple inserts
-        #         We have to check if a key exists before adding the same one willy-nilly
-        #
+        h = hash(key)
+        old = self._old
+        if old is not None:
+            self._migrate()
+            old = self._old
+        if old is not None:
+            # mid-resize, the key may live in either storage, and a new key joins the old storage behind the cursor
+            slot = self._find(key, h)
+            if slot >= 0:
+                self._entry_values[self._slots[slot]] = value
+                return
+            slot = old.find(key, h)
+            if slot >= 0:
+                old.values[old.slots[slot]] = value
+                return
+            old.append(key, value, h)
+            self._keys += 1
+            return
 
-        # walk the chain in the table to see if an item containing the key exists
-        chain = self._storage[b].head
-        while chain.next:
-            if chain.data[0] == key:
+        slots, keys, hashes = self._slots, self._entry_keys, self._entry_hashes
+        mask = self._buckets - 1
+        i = h & mask
+        reusable = -1
+
+        # walk the probe run, the key may already exist past a tombstone, so stop only at a free slot
+        while True:
+            e = slots[i]
+            if e == _FREE:
+                break
+            if e == _TOMBSTONE:
+                if reusable < 0:
+                    reusable = i
+            elif hashes[e] == h and (keys[e] is key or keys[e] == key):
                 # item was found to exist, update it and return
-                chain.data = (key, value)
+                self._entry_values[e] = value
                 return
-            chain = chain.next
-
-        # this is a new item, add and increment # of keys
-        self._storage[b].prepend((key, value))
+            i = (i + 1) & mask
+
+        # this is a new item, reuse the first tombstone passed over, otherwise take the free slot
+        if reusable >= 0:
+            i = reusable
+        else:
+            self._used += 1
+        slots[i] = len(keys)
+        keys.append(key)
+        self._entry_values.append(value)
+        hashes.append(h)
         self._keys += 1
 
+        # check if a resize is required, either too few free slots, or too many deleted entries
+        if self._used > _GROW_LOAD * self._buckets or len(keys) > 2 * self._buckets:
+            self._resize(self._slots_for(int(self._keys / _TARGET_LOAD) + 1))
+
     def __delitem__(self, key):
         """
         Implements deleting an item with the del keyword
@@ -77,109 +198,155 @@ class HashTable(Generic[Key, Value]):
         if key is None:
             raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
 
-        b = self._hash(key)
-        value: Value = self._search_bucket(b, key)
-        is_removed = self._storage[b].remove((key, value))
-        try:
-            assert is_removed is True
-            self._keys -= 1
-
-            if self._buckets > 4 and self._keys <= (2 * self._buckets):
-                self._resize(int(0.5 * self._buckets))
-        except AssertionError:
-            # TODO: Implement error logging properly with logger
-            debug.debug_msg(debug.Error.INDEX, inspect.currentframe())
-            return
+        h = hash(key)
+        if self._old is not None:
+            self._migrate()
+        slot = self._find(key, h)
+        if slot >= 0:
+            e = self._slots[slot]
+            self._slots[slot] = _TOMBSTONE
+            self._entry_keys[e] = _DELETED
+            self._entry_values[e] = None
+        else:
+            old = self._old
+            slot = old.find(key, h) if old is not None else -1
+            if slot < 0:
+                # TODO: Implement error logging properly with logger
+                debug.debug_msg(debug.Error.INDEX, inspect.currentframe())
+                return
+            e = old.slots[slot]
+            old.slots[slot] = _TOMBSTONE
+            old.keys[e] = _DELETED
+            old.values[e] = None
+        self._keys -= 1
+
+        # shrink once mostly empty
+        if self._old is None and self._buckets > _MIN_SLOTS and self._keys <= _SHRINK_LOAD * self._buckets:
+            self._resize(self._slots_for(int(self._keys / _TARGET_LOAD) + 1))
 
     def __len__(self):
         return self._keys
 
     def __iter__(self):
         """
-        Allows iterating through items in the hashtable
-        Yields key, value pairs as tuples
+        Allows iterating through items in the hashtable, in insertion order
+        Yields values
         """
-        for bucket in self._storage:
-            for node in bucket:
-                data: tuple[Key, Value] = node.data
-                key, value = data[0], data[1]
-                yield value
+        for _, value in self.items():
+            yield value
 
     def __next__(self):
         pass
 
     def __repr__(self):
-        return 'HashTable('.join([''.join(f'{bucket})\n') for bucket in self._storage]) + ')'
+        return 'HashTable(' + ', '.join(f'{key}: {value}' for key, value in self.items()) + ')'
 
     def __str__(self):
-        return 'HashTable('.join([''.join(f'{bucket})\n') for bucket in self._storage]) + ')'
+        return 'HashTable(' + ', '.join(f'{key}: {value}' for key, value in self.items()) + ')'
 
     def search(self, key: Key) -> bool:
+        """Checks whether the key is in the table, regardless of its value"""
         if key is None:
             raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
-
-        b = self._hash(key)
-        if self._search_bucket(b, key):
-            return True
-        return False
+        h = hash(key)
+        return self._find(key, h) >= 0 or (self._old is not None and self._old.find(key, h) >= 0)
 
     def clear(self) -> None:
         self._keys = 0
-        for bucket in self._storage:
-            bucket.clear()
-        self._resize(new_size=2)
+        self._old = None
+        self._allocate(_MIN_SLOTS)
 
     def items(self):
         """
-        Allows iterating through items in the hashtable
+        Allows iterating through items in the hashtable, in insertion order
         Yields key, value pairs as tuples
         """
-        for bucket in self._storage:
-            for node in bucket:
-                data: tuple[Key, Value] = node.data
-                key, value = data[0], data[1]
+        for key, value in zip(self._entry_keys, self._entry_values):
+            if key is not _DELETED:
                 yield key, value
+        # mid-resize, entries that have not been moved yet are all newer than those that have
+        old = self._old
+        if old is not None:
+            for e in range(old.cursor, len(old.keys)):
+                if old.keys[e] is not _DELETED:
+                    yield old.keys[e], old.values[e]
+
+    def _find(self, key: Key, h: int) -> int:
+        """
+        Probes for a key from its home slot
 
-    def _hash(self, key: Key) -> int:
-        if type(key) is int:
-            return key % self._buckets
-        return hash(key) % self._buckets
+        Returns: int, the slot pointing at the key's entry, -1 if it is not found
 
-    def _resize(self, new_size: int) -> None:
-        # new/old sizes
-        old_size = len(self._storage)
-        self._buckets = new_size
+        """
+        slots, keys, hashes = self._slots, self._entry_keys, self._entry_hashes
+        mask = self._buckets - 1
+        i = h & mask
+        while True:
+            e = slots[i]
+            if e == _FREE:
+                return -1
+            if e != _TOMBSTONE and hashes[e] == h and (keys[e] is key or keys[e] == key):
+                return i
+            i = (i + 1) & mask
+
+    def _allocate(self, size: int) -> None:
+        """Replaces the storage with empty entries and free slots"""
+        self._buckets = size
+        self._used = 0
+        self._slots = [_FREE] * size
+        self._entry_keys, self._entry_values, self._entry_hashes = [], [], []
 
-        # if the table is already empty, ensure no excess storage remains
-        if self._is_empty():
-            del self._storage[new_size:]
+    def _resize(self, new_size: int) -> None:
+        """
+        Starts moving every live entry into new storage of new_size slots, dropping deleted entries and tombstones.
+        The first batch is moved straight away, the rest by later inserts and deletes.
+        """
+        if self._old is not None:
             return
-
-        # add new buckets, if the table is growing
-        if new_size > old_size:
-            self._storage.extend([LinkedList[tuple[Key, Value]]() for _ in range(new_size - old_size)])
-
-        # iterate previous buckets
-        for i in range(old_size):
-
-            # rehash every item stored
-            for node in self._storage[i]:
-                if node is not Node[None]:
-                    key, value = tuple(node.data)[0], tuple(node.data)[1]
-                    b = self._hash(key)
-                    self._storage[i].remove(node)
-                    self._storage[b].prepend((key, value))
-
-        # remove empty buckets, if the table is shrinking
-        if new_size < old_size:
-            del self._storage[new_size:]
+        # enough entries are moved per operation to finish before the keys added meanwhile could fill either index
+        step = max(_MIN_STEP, -(-8 * len(self._entry_keys) // new_size))
+        self._old = _Migration(self._entry_keys, self._entry_values, self._entry_hashes, self._slots, step)
+        self._allocate(new_size)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Moves the next batch of entries from the old storage, releasing it once empty"""
+        old = self._old
+        old_keys, old_values, old_hashes = old.keys, old.values, old.hashes
+        keys, values, hashes = self._entry_keys, self._entry_values, self._entry_hashes
+        slots = self._slots
+        mask = self._buckets - 1
+        e, end = old.cursor, min(old.cursor + old.step, len(old_keys))
+        n, used = len(keys), self._used
+        while e < end:
+            key = old_keys[e]
+            if key is not _DELETED:
+                # keys are distinct across the two storages, so the first free slot or tombstone will do
+                h = old_hashes[e]
+                i = h & mask
+                while slots[i] >= 0:
+                    i = (i + 1) & mask
+                if slots[i] == _FREE:
+                    used += 1
+                slots[i] = n
+                n += 1
+                keys.append(key)
+                values.append(old_values[e])
+                hashes.append(h)
+                old_values[e] = None
+            e += 1
+        self._used = used
+        old.cursor = end
+        if end == len(old_keys):
+            self._old = None
+
+    @staticmethod
+    def _slots_for(n: int) -> int:
+        """Rounds up to a power of 2, so a hash maps to its home slot with a mask"""
+        slots = _MIN_SLOTS
+        while slots < n:
+            slots *= 2
+        return slots
 
     def _is_empty(self) -> bool:
         return True if self._keys <= 0 else False
-
-    def _search_bucket(self, i: int, k: Key) -> Optional[Value]:
-        for node in self._storage[i]:
-            node_key, node_val = tuple(node.data)[0], tuple(node.data)[1]
-            if node_key == k:
-                return node_val
-        return None
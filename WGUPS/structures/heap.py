@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+# STL Imports
+import inspect
+from typing import Any, Callable, Generic, Iterator, TypeVar
+
+# Project Imports
+from ..util import debug
+
+T = TypeVar('T')
+
+
+class HeapHandle(Generic[T]):
+    """
+    An item's place in an IndexedHeap, returned by push, and used to update or remove the item later
+    A handle is spent once its item is popped or removed
+    """
+    __slots__ = ('item', 'priority', '_rank', '_index')
+
+    def __init__(self, item: T, priority: Any, order: int, index: int):
+        self.item = item
+        self.priority = priority
+        self._rank = (priority, order)  # ties between equal priorities go to the item pushed first
+        self._index = index             # position in the heap array, -1 once spent
+
+    def __repr__(self):
+        return f'HeapHandle({self.item}, {self.priority})'
+
+
+class IndexedHeap(Generic[T]):
+    """
+    Addressable binary min-heap, a priority queue whose items can be re-prioritized or removed after being pushed
+
+    Items are kept in an array ordered as a binary heap, every parent before both of its children.
+    Each item's handle tracks its position in the array, so an item is found in O(1) and sifted into its new place,
+    rather than the whole queue being re-sorted, or a stale copy being left behind for the consumer to skip.
+    Priorities come from the key function, unless given explicitly, and equal priorities pop first-in first-out.
+
+    Big-O for Operations:
+    ----------------------------------------------------------
+    | Peek | Push    | Pop     | Update  | Remove  | Heapify |
+    | O(1) | O(logn) | O(logn) | O(logn) | O(logn) | O(n)    |
+    ----------------------------------------------------------
+    """
+
+    def __init__(self, items: Iterator[T] = (), key: Callable[[T], Any] = None):
+        """
+        Args:
+            items: Iterator[T], the initial items, heapified in linear time
+            key: Callable[[T], Any], computes an item's priority, the item itself is the priority if not given
+        """
+        self._key = key
+        self._heap: list[HeapHandle[T]] = []
+        self._pushed = 0
+        for item in items:
+            self._heap.append(HeapHandle(item, self._priority(item), self._pushed, len(self._heap)))
+            self._pushed += 1
+        for i in range((len(self._heap) >> 1) - 1, -1, -1):
+            self._sift_down(i)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return len(self._heap) > 0
+
+    def __contains__(self, handle: HeapHandle[T]) -> bool:
+        i = handle._index
+        return 0 <= i < len(self._heap) and self._heap[i] is handle
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Allows iterating through items in heap order, which is not sorted order
+        Yields items
+        """
+        for handle in self._heap:
+            yield handle.item
+
+    def __repr__(self):
+        return f'IndexedHeap(size={len(self._heap)})'
+
+    def push(self, item: T, priority: Any = None) -> HeapHandle[T]:
+        """Adds an item, prioritized by the key function unless a priority is given"""
+        if priority is None:
+            priority = self._priority(item)
+        handle = HeapHandle(item, priority, self._pushed, len(self._heap))
+        self._pushed += 1
+        self._heap.append(handle)
+        self._sift_up(handle._index)
+        return handle
+
+    def peek(self) -> T:
+        """The item with the lowest priority, without removing it"""
+        self._check_not_empty()
+        return self._heap[0].item
+
+    def peek_handle(self) -> HeapHandle[T]:
+        self._check_not_empty()
+        return self._heap[0]
+
+    def pop(self) -> T:
+        """Removes and returns the item with the lowest priority"""
+        self._check_not_empty()
+        return self._take(0).item
+
+    def update(self, handle: HeapHandle[T], priority: Any = None) -> None:
+        """
+        Re-prioritizes an item, in either direction
+        Without a priority, the key function is applied to the item again, e.g. after the item was modified
+        """
+        self._check_handle(handle)
+        if priority is None:
+            priority = self._priority(handle.item)
+        rank = handle._rank
+        handle.priority = priority
+        handle._rank = (priority, rank[1])
+        if handle._rank < rank:
+            self._sift_up(handle._index)
+        else:
+            self._sift_down(handle._index)
+
+    def decrease_key(self, handle: HeapHandle[T], priority: Any) -> None:
+        """Lowers an item's priority, moving it towards the front of the queue"""
+        self._check_handle(handle)
+        if priority > handle.priority:
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        handle.priority = priority
+        handle._rank = (priority, handle._rank[1])
+        self._sift_up(handle._index)
+
+    def remove(self, handle: HeapHandle[T]) -> T:
+        """Removes an item from anywhere in the queue"""
+        self._check_handle(handle)
+        return self._take(handle._index).item
+
+    def clear(self) -> None:
+        for handle in self._heap:
+            handle._index = -1
+        self._heap.clear()
+
+    def _priority(self, item: T) -> Any:
+        return self._key(item) if self._key is not None else item
+
+    def _take(self, i: int) -> HeapHandle[T]:
+        """Swaps the last item into position i, then restores the heap order around it"""
+        heap = self._heap
+        handle = heap[i]
+        last = heap.pop()
+        if last is not handle:
+            heap[i] = last
+            last._index = i
+            if i > 0 and last._rank < heap[(i - 1) >> 1]._rank:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        handle._index = -1
+        return handle
+
+    def _sift_up(self, i: int) -> None:
+        heap = self._heap
+        handle = heap[i]
+        rank = handle._rank
+        while i > 0:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if not rank < above._rank:
+                break
+            heap[i] = above
+            above._index = i
+            i = parent
+        heap[i] = handle
+        handle._index = i
+
+    def _sift_down(self, i: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        handle = heap[i]
+        rank = handle._rank
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1]._rank < heap[child]._rank:
+                child += 1
+            below = heap[child]
+            if not below._rank < rank:
+                break
+            heap[i] = below
+            below._index = i
+            i = child
+        heap[i] = handle
+        handle._index = i
+
+    def _check_not_empty(self) -> None:
+        if not self._heap:
+            raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
+
+    def _check_handle(self, handle: HeapHandle[T]) -> None:
+        if handle not in self:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
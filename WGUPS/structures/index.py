@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+# STL Imports
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterator, TypeVar
+
+# Project Imports
+from .hashtable import HashTable
+
+Key = TypeVar('Key')
+
+
+class HashIndex(Generic[Key]):
+    """
+    Secondary index from an attribute value to the ids of every record holding it, e.g. city -> package ids
+
+    Each value keeps its ids in a sorted list, so matches come back in id order without sorting.
+
+    Big-O for Operations:
+    ---------------------------------
+    | Lookup | Add       | Discard  |
+    | O(1+k) | O(logk)*  | O(logk)* |
+    ---------------------------------
+    * plus shifting up to k ids in the value's list
+    """
+
+    def __init__(self, expected: int = 0):
+        self._ids: HashTable[Key, list[int]] = HashTable(expected=expected)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f'HashIndex(values={len(self._ids)})'
+
+    def add(self, key: Key, record_id: int) -> None:
+        ids = self._ids[key]
+        if ids is None:
+            self._ids[key] = [record_id]
+            return
+        i = bisect_left(ids, record_id)
+        if i == len(ids) or ids[i] != record_id:
+            ids.insert(i, record_id)
+
+    def discard(self, key: Key, record_id: int) -> None:
+        ids = self._ids[key]
+        if ids is None:
+            return
+        i = bisect_left(ids, record_id)
+        if i < len(ids) and ids[i] == record_id:
+            del ids[i]
+            if not ids:
+                del self._ids[key]
+
+    def lookup(self, key: Key) -> list[int]:
+        """
+        Finds the ids of every record with the key
+
+        Returns: list[int], in id order
+
+        """
+        ids = self._ids[key]
+        return list(ids) if ids is not None else []
+
+
+class SortedIndex(Generic[Key]):
+    """
+    Secondary index ordered by an attribute value, e.g. deadline -> package ids, for equality and range lookups
+
+    Entries are kept in one list of (value, id) tuples sorted by value then id,
+    so a lookup is two binary searches and a slice.
+
+    Big-O for Operations:
+    ------------------------------------
+    | Lookup    | Add      | Discard  |
+    | O(logn+k) | O(logn)* | O(logn)* |
+    ------------------------------------
+    * plus shifting up to n entries, a memmove
+    """
+
+    def __init__(self):
+        self._entries: list[tuple[Key, int]] = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'SortedIndex(entries={len(self._entries)})'
+
+    def __iter__(self) -> Iterator[int]:
+        for _, record_id in self._entries:
+            yield record_id
+
+    def add(self, key: Key, record_id: int) -> None:
+        entry = (key, record_id)
+        i = bisect_left(self._entries, entry)
+        if i == len(self._entries) or self._entries[i] != entry:
+            self._entries.insert(i, entry)
+
+    def discard(self, key: Key, record_id: int) -> None:
+        entry = (key, record_id)
+        i = bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def lookup(self, key: Key) -> list[int]:
+        """
+        Finds the ids of every record with the key
+
+        Returns: list[int], in id order
+
+        """
+        return self.between(key, key)
+
+    def between(self, low: Key, high: Key) -> list[int]:
+        """
+        Finds the ids of every record with a key in [low, high]
+
+        Returns: list[int], ordered by key, then id
+
+        """
+        start = bisect_left(self._entries, low, key=_first)
+        end = bisect_right(self._entries, high, lo=start, key=_first)
+        return [record_id for _, record_id in self._entries[start:end]]
+
+
+def _first(entry: tuple) -> object:
+    return entry[0]
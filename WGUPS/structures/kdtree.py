@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+# STL Imports
+import heapq
+import math
+from typing import Callable, Generic, TypeVar
+
+# Project Imports
+from .hashtable import HashTable
+
+T = TypeVar('T')
+
+
+def _to_unit_vector(lat: float, long: float) -> tuple[float, float, float]:
+    """Maps a lat/long in degrees onto the unit sphere"""
+    ϕ, λ = math.radians(lat), math.radians(long)
+    cos_ϕ = math.cos(ϕ)
+    return cos_ϕ * math.cos(λ), cos_ϕ * math.sin(λ), math.sin(ϕ)
+
+
+# noinspection NonAsciiCharacters
+class KDTree(Generic[T]):
+    """
+    Static k-d tree over items with GPS coordinates, for nearest neighbor searches.
+
+    Coordinates are mapped to 3D vectors on the unit sphere. The straight-line (chord) distance between two
+    vectors grows with the great-circle distance, so the nearest vectors are also the nearest points on Earth,
+    without any special handling of the poles or the antimeridian.
+
+    Items must be hashable, and are located with the locate function, by default item.coordinate as on an Address.
+
+    Big-O for Operations:
+    ------------------------------------------
+    | Build      | Nearest (k) | Memory      |
+    | O(nlog^2n) | O(k•logn)*  | O(n)        |
+    ------------------------------------------
+    * on average, for well spread points
+    """
+
+    def __init__(self, items: list[T], locate: Callable[[T], object] = None):
+        if locate is None:
+            locate = _locate_coordinate
+        self._items: list[T] = list(items)
+        self._index: HashTable[T, int] = HashTable(expected=len(self._items))
+        self._points: list[tuple[float, float, float]] = []
+        for i, item in enumerate(self._items):
+            coordinate = locate(item)
+            self._index[item] = i
+            self._points.append(_to_unit_vector(coordinate.lat, coordinate.long))
+
+        # the tree is kept in parallel lists, node i splits self._points[self._split[i]] on self._axis[i]
+        self._split: list[int] = []
+        self._axis: list[int] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._root = self._build(list(range(len(self._points))))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f'KDTree(items={len(self._items)})'
+
+    def nearest(self, lat: float, long: float, k: int = 1) -> list[T]:
+        """
+        Finds the k items nearest to a lat/long, closest first
+
+        Args:
+            lat: float, degrees
+            long: float, degrees
+            k: int
+
+        Returns: list[T]
+
+        """
+        return [self._items[i] for i in self._search(_to_unit_vector(lat, long), k)]
+
+    def neighbors(self, item: T, k: int = 1) -> list[T]:
+        """
+        Finds the k items nearest to an item in the tree, closest first, excluding the item itself.
+        Useful for limiting route heuristics to candidate moves between nearby stops.
+
+        Args:
+            item: T
+            k: int
+
+        Returns: list[T]
+
+        """
+        i = self._index[item]
+        if i is None:
+            return []
+        return [self._items[j] for j in self._search(self._points[i], k, exclude=i)]
+
+    def reverse_geocode(self, lat: float, long: float) -> T | None:
+        """
+        Finds the item nearest to an arbitrary lat/long
+
+        Returns: T | None, None only if the tree is empty
+
+        """
+        found = self.nearest(lat, long, k=1)
+        return found[0] if found else None
+
+    def _build(self, indices: list[int]) -> int:
+        """
+        Recursively splits the points on the median of their widest axis
+
+        Returns: int, the node id of the subtree, -1 if empty
+
+        """
+        if not indices:
+            return -1
+
+        # split on the axis with the largest spread
+        spreads = []
+        for axis in range(3):
+            values = [self._points[i][axis] for i in indices]
+            spreads.append(max(values) - min(values))
+        axis = spreads.index(max(spreads))
+
+        indices.sort(key=lambda i: self._points[i][axis])
+        median = len(indices) // 2
+
+        node = len(self._split)
+        self._split.append(indices[median])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+
+        self._left[node] = self._build(indices[:median])
+        self._right[node] = self._build(indices[median + 1:])
+        return node
+
+    def _search(self, target: tuple[float, float, float], k: int, exclude: int = -1) -> list[int]:
+        """
+        Standard k-d tree descent, keeping the k best in a bounded max-heap
+
+        Returns: list[int], indices of the nearest points, closest first
+
+        """
+        if k <= 0 or self._root < 0:
+            return []
+
+        best: list[tuple[float, int]] = []   # max-heap of (-squared distance, index)
+        stack = [(self._root, 0.0)]           # nodes to visit, with a lower bound on their squared distance
+        while stack:
+            node, bound = stack.pop()
+            # a subtree can only hold a closer point if its bounding planes are within the current worst distance
+            if node < 0 or (len(best) == k and bound >= -best[0][0]):
+                continue
+            i = self._split[node]
+            point = self._points[i]
+            d2 = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+            if i != exclude:
+                if len(best) < k:
+                    heapq.heappush(best, (-d2, i))
+                elif d2 < -best[0][0]:
+                    heapq.heapreplace(best, (-d2, i))
+
+            axis = self._axis[node]
+            diff = target[axis] - point[axis]
+            near, far = (self._left[node], self._right[node]) if diff < 0 else (self._right[node], self._left[node])
+
+            # visit the near side first, so the far side is usually pruned by the time it is popped
+            stack.append((far, max(bound, diff * diff)))
+            stack.append((near, bound))
+
+        return [i for _, i in sorted(best, key=lambda pair: -pair[0])]
+
+
+def _locate_coordinate(item) -> object:
+    return item.coordinate
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 # STL Imports
 import inspect
-from dataclasses import dataclass
 from functools import singledispatchmethod
 from typing import Generic, TypeVar
 
@@ -12,62 +11,89 @@ from WGUPS.util import debug
 T = TypeVar('T')
 
 
-@dataclass(eq=True, order=True, unsafe_hash=True)
 class Node(Generic[T]):
-    data: T
-    next: Node = None
-    prev: Node = None
+    """
+    A list node, compared and hashed by identity, so a node can be found and unlinked in constant time
+    A linked node knows the list it belongs to, so it can't be unlinked through another list
+    """
+    __slots__ = ('data', 'next', 'prev', 'owner')
+
+    def __init__(self, data: T = None, next: Node[T] = None, prev: Node[T] = None, owner: LinkedList[T] = None):
+        self.data = data
+        self.next = next
+        self.prev = prev
+        self.owner = owner
 
     def __repr__(self):
         return f'Node({self.data})'
 
 
+class NodePool(Generic[T]):
+    """
+    Free-list of unlinked nodes, reused by a LinkedList instead of allocating new ones.
+    Only share a pool with lists whose callers stop using a node once it is removed.
+    """
+    __slots__ = ('_free', '_max_size')
+
+    def __init__(self, max_size: int = 1024):
+        self._free: list[Node[T]] = []
+        self._max_size = max_size
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, data: T, next: Node[T], prev: Node[T], owner: LinkedList[T]) -> Node[T]:
+        if self._free:
+            node = self._free.pop()
+            node.data, node.next, node.prev, node.owner = data, next, prev, owner
+            return node
+        return Node(data, next, prev, owner)
+
+    def release(self, node: Node[T]) -> None:
+        node.data = node.next = node.prev = node.owner = None
+        if len(self._free) < self._max_size:
+            self._free.append(node)
+
+
 # noinspection DuplicatedCode
 class LinkedList(Generic[T]):
     """
     Doubly-Linked List Implementation
+
+    The list is bracketed by two sentinel nodes that never hold data, so linking and unlinking never special-case
+    an empty list or either end. Every node knows its neighbors, so a node already in hand is unlinked in O(1).
+
     Big-O for Operations:
-    -------------------------------------
-    | Access | Search | Insert | Delete |
-    | O(n)   | O(n)   | O(1)   | O(1)   |
-    -------------------------------------
+    --------------------------------------------------
+    | Access | Search | Insert | Delete | Unlink Node |
+    | O(n)   | O(n)   | O(1)   | O(n)   | O(1)        |
+    --------------------------------------------------
     """
     # Class vars
-    head: Node[T]
-    tail: Node[T]
     size: int
 
     #
     # Magic Methods
     #
-    def __init__(self) -> None:
-        self.head = Node[None]
-        self.tail = Node[None]
+    def __init__(self, pool: NodePool[T] = None) -> None:
+        self._head: Node[T] = Node(owner=self)    # sentinel before the first node
+        self._tail: Node[T] = Node(owner=self)    # sentinel after the last node
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._pool = pool
         self.size = 0
 
     def __len__(self) -> int:
         return self.size
 
     def __getitem__(self, i: int) -> Node[T]:
-        assert self._is_element_index(i)
-        count = 0
-        if i < (self.size >> 1):
-            for node in self:
-                if count == i:
-                    return node
-                i += 1
-        else:
-            i = self.size - i
-            for node in reversed(self):
-                if count == i:
-                    return node
-                i += 1
+        return self.node(i)
 
     def __iter__(self) -> AscendingLinkedListIterator:
-        return self.AscendingLinkedListIterator(self.head)
+        return self.AscendingLinkedListIterator(self._head.next, self._tail)
 
     def __reversed__(self) -> DescendingLinkedListIterator:
-        return self.DescendingLinkedListIterator(self.tail)
+        return self.DescendingLinkedListIterator(self._tail.prev, self._head)
 
     def __next__(self):
         pass
@@ -78,78 +104,87 @@ class LinkedList(Generic[T]):
     #
     # Public Methods
     #
+    @property
+    def head(self) -> Node[T] | None:
+        """The first node, None if the list is empty"""
+        return self._head.next if self.size else None
+
+    @property
+    def tail(self) -> Node[T] | None:
+        """The last node, None if the list is empty"""
+        return self._tail.prev if self.size else None
 
     #
     # Get Operations
     def get_first(self) -> Node[T]:
-        assert self.head is not None
-        return self.head
+        assert self.size > 0
+        return self._head.next
 
     def get_last(self) -> Node[T]:
-        assert self.tail is not None
-        return self.tail
+        assert self.size > 0
+        return self._tail.prev
 
     #
     # Insert Operations
-    def append(self, e: T) -> None:
-        self._link_last(e)
+    def append(self, e: T) -> Node[T]:
+        return self._link_before(e, self._tail)
 
-    def prepend(self, e: T) -> None:
-        self._link_first(e)
+    def prepend(self, e: T) -> Node[T]:
+        return self._link_before(e, self._head.next)
+
+    def insert_before(self, e: T, successor: Node[T]) -> Node[T]:
+        if successor is self._head:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        self._check_owner(successor)
+        return self._link_before(e, successor)
+
+    def insert_after(self, e: T, predecessor: Node[T]) -> Node[T]:
+        if predecessor is self._tail:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        self._check_owner(predecessor)
+        return self._link_before(e, predecessor.next)
 
     #
     # Remove Operations
     def clear(self) -> None:
-        for node in self:
-            node.data = None
-            node.next = None
-            node.prev = None
-        self.head = Node[None]
-        self.tail = self.head
+        node = self._head.next
+        while node is not self._tail:
+            following = node.next
+            self._release(node)
+            node = following
+        self._head.next = self._tail
+        self._tail.prev = self._head
         self.size = 0
 
     def remove_first(self) -> T:
-        h = self.head
-        assert h is not None
-        return self._unlink_first(h)
+        self._check_not_empty()
+        return self._unlink(self._head.next)
 
     def remove_last(self) -> T:
-        t = self.tail
-        assert t is not None
-        return self._unlink_last(t)
+        self._check_not_empty()
+        return self._unlink(self._tail.prev)
 
     @singledispatchmethod
     def remove(self, e: T) -> bool:
-        if e is None:
-            for node in self:
-                if node.data is None:
-                    self._unlink(node)
-                    return True
-        else:
-            for node in self:
-                if node.data is e:
-                    self._unlink(node)
-                    return True
+        """Removes the first node holding e, compared by identity"""
+        for node in self:
+            if node.data is e:
+                self._unlink(node)
+                return True
         return False
 
     @remove.register
-    def _(self, i: int) -> None:
-        self._check_element_index(i)
+    def _(self, i: int) -> T:
         return self._unlink(self.node(i))
 
     @remove.register
-    def _(self, n: Node) -> None:
-        for node in self:
-            if n is node:
-                return self._unlink(node)
+    def _(self, n: Node) -> T:
+        return self._unlink(n)
 
     #
     # Size Operations
-    def size(self) -> int:
-        return self.size
-
     def is_empty(self) -> bool:
-        return not self.head
+        return self.size == 0
 
     #
     # Conversion
@@ -159,47 +194,33 @@ class LinkedList(Generic[T]):
     #
     # Positional Operations
     def node(self, i: int) -> Node[T]:
-        assert self._is_element_index(i)
-        count = 0
+        """Finds the node at index i, walking from whichever end is closer"""
+        self._check_element_index(i)
         if i < (self.size >> 1):
-            for n in self:
-                if count == i:
-                    return n
-                i += 1
+            node = self._head.next
+            for _ in range(i):
+                node = node.next
         else:
-            i = self.size - i
-            for n in reversed(self):
-                if count == i:
-                    return n
-                i += 1
+            node = self._tail.prev
+            for _ in range(self.size - 1 - i):
+                node = node.prev
+        return node
 
     #
     # Search Operations
     def index_of(self, e: T) -> int:
-        i = 0
-        if e is None:
-            for node in self:
-                if node.data is None:
-                    return i
-                i += 1
-        else:
-            for node in self:
-                if node is e:
-                    return i
-                i += 1
+        for i, node in enumerate(self):
+            if node.data is e:
+                return i
+        return -1
 
     def last_index_of(self, e: T) -> int:
         i = self.size
-        if e is None:
-            for node in reversed(self):
-                i -= 1
-                if node.val is None:
-                    return i
-        else:
-            for node in reversed(self):
-                i -= 1
-                if node.val is e:
-                    return i
+        for node in reversed(self):
+            i -= 1
+            if node.data is e:
+                return i
+        return -1
 
     #
     # Private methods
@@ -208,99 +229,59 @@ class LinkedList(Generic[T]):
     #
     # Positional Operations
     def _is_element_index(self, i: int) -> bool:
-        return 0 <= i <= self.size
+        return 0 <= i < self.size
 
     def _is_position_index(self, i: int) -> bool:
         return 0 <= i <= self.size
 
     def _check_element_index(self, i) -> None:
-        if not self._is_position_index(i):
+        if not self._is_element_index(i):
             raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
 
     def _check_position_index(self, i) -> None:
         if not self._is_position_index(i):
             raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
 
-    #
-    # Linking/Unlinking Operations
-    def _link_first(self, e: T) -> None:
-        head = self.head
-        new_node = Node(data=e, next=head, prev=Node[None])
-        self.head = new_node
-        # pointer adjustments on old head
-        if head is None:
-            self.tail = new_node
-        else:
-            head.prev = new_node
-        self.size += 1
+    def _check_not_empty(self) -> None:
+        if not self.size:
+            raise IndexError(debug.debug_msg(debug.Error.INDEX, inspect.currentframe()))
 
-    def _link_last(self, e: T) -> None:
-        tail = self.tail
-        new_node = Node(data=e, next=Node[None], prev=tail)
-        self.tail = new_node
-        # pointer adjustments on old tail
-        if tail is None:
-            self.head = new_node
-        else:
-            tail.next = new_node
-        self.size += 1
+    def _check_owner(self, n: Node[T]) -> None:
+        """A node from another list, or one already removed, would corrupt both lists' links and sizes"""
+        if n.owner is not self:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
 
-    def _link_before(self, e: T, successor: Node[T]) -> None:
+    #
+    # Linking/Unlinking Operations
+    def _link_before(self, e: T, successor: Node[T]) -> Node[T]:
         predecessor = successor.prev
-        new_node = Node(data=e, next=successor, prev=predecessor)
-        successor.prev = new_node
-        if predecessor is None:
-            self.head = new_node
+        if self._pool is not None:
+            new_node = self._pool.acquire(e, successor, predecessor, self)
         else:
-            predecessor.next = new_node
+            new_node = Node(e, successor, predecessor, self)
+        predecessor.next = new_node
+        successor.prev = new_node
         self.size += 1
+        return new_node
 
-    def _unlink_first(self, head: Node[T]) -> T:
-        e = head.data
-        new_head = head.next
-        del head.data, head.next
-        self.head = new_head
-        # pointer adjustments
-        if new_head is None:
-            self.tail = Node[None]
-        else:
-            new_head.prev = Node[None]
-        self.size -= 1
-        return e
-
-    def _unlink_last(self, tail: Node[T]) -> T:
-        e = tail.data
-        new_tail = tail.prev
-        del tail.data, tail.prev
-        self.tail = new_tail
-        # pointer adjustments
-        if new_tail is None:
-            self.head = Node[None]
-        else:
-            new_tail.next = Node[None]
+    def _unlink(self, n: Node[T]) -> T:
+        """Splices a node out using its own pointers, no walk is needed to find its neighbors"""
+        if n is self._head or n is self._tail:
+            raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+        self._check_owner(n)
+        e = n.data
+        n.prev.next = n.next
+        n.next.prev = n.prev
         self.size -= 1
+        self._release(n)
         return e
 
-    def _unlink(self, n: Node[T]) -> T:
-        assert n is not None
-        if n is self.head:
-            return self._unlink_first(n)
-        if n is self.tail:
-            return self._unlink_last(n)
+    def _release(self, n: Node[T]) -> None:
+        """Detaches an unlinked node, so a stale reference to it can't reach back into the list"""
+        if self._pool is not None:
+            self._pool.release(n)
         else:
-            for node in self:
-                if node.next is n:
-                    e = node.next.data
-                    next_node = n.next
-                    prev_node = node
-                    # adjust pointers
-                    node.next = next_node
-                    next_node.prev = prev_node
-                    del n
-                    self.size -= 1
-                    return e
-            else:
-                raise LookupError(debug.debug_msg(debug.Error.LOOKUP, inspect.currentframe()))
+            n.data = n.next = n.prev = n.owner = None
 
     #
     # Member Classes
@@ -309,32 +290,35 @@ class LinkedList(Generic[T]):
     #
     # Iterators
     class AscendingLinkedListIterator:
-        def __init__(self, head: Node[T]):
-            self._node = head
+        def __init__(self, first: Node[T], end: Node[T]):
+            self._node = first
+            self._end = end
             self._index = 0
 
         def __iter__(self):
             return self
 
         def __next__(self):
-            if self._node is Node[None]:
+            if self._node is self._end or self._node is None:
                 raise StopIteration
             else:
                 self._index += 1
                 item = self._node
+                # advance before handing the node out, so the caller may unlink it
                 self._node = self._node.next
                 return item
 
     class DescendingLinkedListIterator:
-        def __init__(self, tail: Node[T]):
-            self._node = tail
+        def __init__(self, last: Node[T], end: Node[T]):
+            self._node = last
+            self._end = end
             self._index = 0
 
         def __iter__(self):
             return self
 
         def __next__(self):
-            if self._node is Node[None]:
+            if self._node is self._end or self._node is None:
                 raise StopIteration
             else:
                 self._index += 1
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+# STL Imports
+import inspect
+import random
+from typing import Generic, Iterator, TypeVar
+
+# Project Imports
+from ..util import debug
+
+Key = TypeVar('Key')
+Value = TypeVar('Value')
+
+_MAX_LEVEL = 32
+_P = 0.25   # chance a node is promoted to each next level, 1/4 keeps ~1.33 pointers per node
+
+
+class _SkipNode(Generic[Key, Value]):
+    __slots__ = ('key', 'value', 'forward')
+
+    def __init__(self, key: Key, value: Value, level: int):
+        self.key = key
+        self.value = value
+        self.forward: list[_SkipNode | None] = [None] * level
+
+
+class SkipList(Generic[Key, Value]):
+    """
+    Ordered map, implemented as a skip list
+
+    Keys are kept in ascending order in a linked list, with express lanes of randomly promoted nodes above it.
+    A search starts in the highest lane and drops a level whenever the next key would overshoot,
+    so every operation visits O(logn) nodes on average, and iteration is a walk along the bottom lane.
+    Keys must be mutually comparable, such as datetimes or (datetime, id) tuples.
+
+    Big-O for Operations:
+    ---------------------------------------------------------------
+    | Access   | Insert   | Delete   | Floor/Ceiling | Range      |
+    | O(logn)* | O(logn)* | O(logn)* | O(logn)*      | O(logn+k)* |
+    ---------------------------------------------------------------
+    * expected, levels are random
+    """
+
+    def __init__(self, seed: int = None):
+        # levels are drawn from a private generator, pass a seed so a list built from the same operations
+        # always has the same shape, left unseeded the shape differs from run to run, but the contents never do
+        self._random = random.Random(seed)
+        self._head: _SkipNode[Key, Value] = _SkipNode(None, None, _MAX_LEVEL)
+        self._level = 1
+        self._keys = 0
+
+    def __getitem__(self, key: Key) -> Value | None:
+        """
+        Implements retrieving an item when provided a key
+        ex: skiplist[key] returns value, or None if the key is not found
+        """
+        node = self._floor_node(key)
+        return node.value if node is not self._head and node.key == key else None
+
+    def __setitem__(self, key: Key, value: Value) -> None:
+        """
+        Implements adding an item, or updating it if the key is found
+        ex: skiplist[key] = value
+        """
+        if key is None:
+            raise ValueError(debug.debug_msg(debug.Error.VALUE, inspect.currentframe()))
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is not None and node.key == key:
+            node.value = value
+            return
+
+        level = self._random_level()
+        if level > self._level:
+            for i in range(self._level, level):
+                update[i] = self._head
+            self._level = level
+        node = _SkipNode(key, value, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+        self._keys += 1
+
+    def __delitem__(self, key: Key) -> None:
+        """
+        Implements deleting an item with the del keyword
+        ex: del skiplist[key]
+        """
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            # TODO: Implement error logging properly with logger
+            debug.debug_msg(debug.Error.INDEX, inspect.currentframe())
+            return
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self._level > 1 and self._head.forward[self._level - 1] is None:
+            self._level -= 1
+        self._keys -= 1
+
+    def __len__(self):
+        return self._keys
+
+    def __iter__(self) -> Iterator[Value]:
+        """
+        Allows iterating through items in key order
+        Yields values
+        """
+        for _, value in self.items():
+            yield value
+
+    def __repr__(self):
+        return 'SkipList(' + ', '.join(f'{key}: {value}' for key, value in self.items()) + ')'
+
+    def search(self, key: Key) -> bool:
+        """Checks whether the key is in the list, regardless of its value"""
+        node = self._floor_node(key)
+        return node is not self._head and node.key == key
+
+    def items(self) -> Iterator[tuple[Key, Value]]:
+        """
+        Allows iterating through items in key order
+        Yields key, value pairs as tuples
+        """
+        node = self._head.forward[0]
+        while node is not None:
+            yield node.key, node.value
+            node = node.forward[0]
+
+    def first(self) -> tuple[Key, Value] | None:
+        """The item with the smallest key, None if empty"""
+        node = self._head.forward[0]
+        return (node.key, node.value) if node is not None else None
+
+    def last(self) -> tuple[Key, Value] | None:
+        """The item with the largest key, None if empty"""
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            while node.forward[i] is not None:
+                node = node.forward[i]
+        return (node.key, node.value) if node is not self._head else None
+
+    def floor(self, key: Key) -> tuple[Key, Value] | None:
+        """The item with the largest key <= key, None if there is none"""
+        node = self._floor_node(key)
+        return (node.key, node.value) if node is not self._head else None
+
+    def ceiling(self, key: Key) -> tuple[Key, Value] | None:
+        """The item with the smallest key >= key, None if there is none"""
+        node = self._predecessors(key)[0].forward[0]
+        return (node.key, node.value) if node is not None else None
+
+    def range(self, low: Key = None, high: Key = None) -> Iterator[tuple[Key, Value]]:
+        """
+        Iterates items with low <= key <= high, in key order, either bound may be left open with None
+
+        Yields key, value pairs as tuples
+        """
+        node = self._head.forward[0] if low is None else self._predecessors(low)[0].forward[0]
+        while node is not None and (high is None or node.key <= high):
+            yield node.key, node.value
+            node = node.forward[0]
+
+    def clear(self) -> None:
+        self._head.forward = [None] * _MAX_LEVEL
+        self._level = 1
+        self._keys = 0
+
+    def _predecessors(self, key: Key) -> list[_SkipNode]:
+        """The last node before key on every level, the nodes whose pointers change on an insert or delete"""
+        update = [self._head] * _MAX_LEVEL
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.key < key:
+                node = following
+                following = node.forward[i]
+            update[i] = node
+        return update
+
+    def _floor_node(self, key: Key) -> _SkipNode:
+        """The last node with a key <= key, the head if there is none"""
+        node = self._head
+        for i in range(self._level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.key <= key:
+                node = following
+                following = node.forward[i]
+        return node
+
+    def _random_level(self) -> int:
+        level = 1
+        while level < _MAX_LEVEL and self._random.random() < _P:
+            level += 1
+        return level
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+# STL Imports
+import heapq
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterator
+
+# Project Imports
+from .hashtable import HashTable
+
+# length of the substrings kept in the inverted index, shorter queries match against each distinct text instead
+_GRAM = 3
+
+
+def normalize(text: str) -> str:
+    """Folds case and collapses runs of whitespace, so '410 s  State St' and '410 S State St' match"""
+    return ' '.join(text.casefold().split())
+
+
+class _TrieNode:
+    __slots__ = ('children', 'ids')
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.ids: list[int] = []    # sorted ids of the records whose whole text ends at this node
+
+
+class TextIndex:
+    """
+    Search index over one short text per record, e.g. package id -> street, for prefix and substring matches
+
+    Texts are normalized first, see normalize(). A trie over the texts answers prefix queries, and an inverted index
+    from every 3 character substring to the sorted ids containing it answers substring queries: the posting lists
+    of the query's substrings are intersected in id order, and each candidate is confirmed against its text.
+    Both searches are generators yielding ids in ascending order, so a limit stops them early.
+
+    Big-O for Operations:
+    ------------------------------------------------
+    | Prefix      | Substring     | Add / Discard  |
+    | O(m + t•k)  | O(s•logp)*    | O(m•logp)      |
+    ------------------------------------------------
+    for a query of length m, t matching texts, k ids per text, s ids in the shortest posting list,
+    and posting lists of length p
+    * queries under 3 characters scan the distinct texts instead
+    """
+
+    def __init__(self, expected: int = 0):
+        self._texts: HashTable[int, str] = HashTable(expected=expected)   # id -> normalized text
+        self._by_text: HashTable[str, list[int]] = HashTable()            # normalized text -> sorted ids
+        self._grams: HashTable[str, list[int]] = HashTable()              # substring -> sorted ids
+        self._ids: list[int] = []                                         # every id, sorted
+        self._root = _TrieNode()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return f'TextIndex(records={len(self._ids)}, texts={len(self._by_text)})'
+
+    def add(self, text: str, record_id: int) -> None:
+        """Indexes a record's text, replacing the text it was indexed under before"""
+        if self._texts.search(record_id):
+            self.discard(record_id)
+        text = normalize(text)
+        self._texts[record_id] = text
+        _insert(self._ids, record_id)
+
+        ids = self._by_text[text]
+        if ids is None:
+            self._by_text[text] = ids = []
+        _insert(ids, record_id)
+
+        node = self._root
+        for char in text:
+            child = node.children.get(char)
+            if child is None:
+                node.children[char] = child = _TrieNode()
+            node = child
+        _insert(node.ids, record_id)
+
+        for gram in set(_grams(text)):
+            postings = self._grams[gram]
+            if postings is None:
+                self._grams[gram] = postings = []
+            _insert(postings, record_id)
+
+    def discard(self, record_id: int) -> None:
+        """Removes a record from the index, if it is indexed"""
+        text = self._texts[record_id]
+        if text is None:
+            return
+        del self._texts[record_id]
+        _remove(self._ids, record_id)
+
+        ids = self._by_text[text]
+        _remove(ids, record_id)
+        if not ids:
+            del self._by_text[text]
+
+        # walk down to the record's node, then prune any branch left without records
+        path = [self._root]
+        for char in text:
+            path.append(path[-1].children[char])
+        _remove(path[-1].ids, record_id)
+        for depth in range(len(text), 0, -1):
+            node = path[depth]
+            if node.ids or node.children:
+                break
+            del path[depth - 1].children[text[depth - 1]]
+
+        for gram in set(_grams(text)):
+            postings = self._grams[gram]
+            _remove(postings, record_id)
+            if not postings:
+                del self._grams[gram]
+
+    def prefix(self, query: str, limit: int = None) -> Iterator[int]:
+        """
+        Streams the ids of records whose text starts with the query
+
+        Returns: Iterator[int], ascending ids, at most limit of them
+
+        """
+        node = self._root
+        for char in normalize(query):
+            node = node.children.get(char)
+            if node is None:
+                return iter(())
+
+        # gather the sorted id lists below the node, then merge them lazily
+        lists, stack = [], [node]
+        while stack:
+            node = stack.pop()
+            if node.ids:
+                lists.append(node.ids)
+            stack.extend(node.children.values())
+        return islice(heapq.merge(*lists), limit)
+
+    def contains(self, query: str, limit: int = None) -> Iterator[int]:
+        """
+        Streams the ids of records whose text contains the query
+
+        Returns: Iterator[int], ascending ids, at most limit of them
+
+        """
+        query = normalize(query)
+        if not query:
+            return islice(iter(self._ids), limit)
+        if len(query) < _GRAM:
+            return islice(heapq.merge(*(ids for text, ids in self._by_text.items() if query in text)), limit)
+        return islice(self._intersect(query), limit)
+
+    def _intersect(self, query: str) -> Iterator[int]:
+        """Walks the shortest posting list, keeping ids present in every other list whose text holds the query"""
+        postings = []
+        for gram in set(_grams(query)):
+            ids = self._grams[gram]
+            if ids is None:
+                return
+            postings.append(ids)
+        postings.sort(key=len)
+        shortest, others = postings[0], postings[1:]
+        for record_id in list(shortest):
+            if all(_has(ids, record_id) for ids in others) and query in self._texts[record_id]:
+                yield record_id
+
+
+def _grams(text: str) -> Iterator[str]:
+    for i in range(len(text) - _GRAM + 1):
+        yield text[i:i + _GRAM]
+
+
+def _insert(ids: list[int], record_id: int) -> None:
+    i = bisect_left(ids, record_id)
+    if i == len(ids) or ids[i] != record_id:
+        ids.insert(i, record_id)
+
+
+def _remove(ids: list[int], record_id: int) -> None:
+    i = bisect_left(ids, record_id)
+    if i < len(ids) and ids[i] == record_id:
+        del ids[i]
+
+
+def _has(ids: list[int], record_id: int) -> bool:
+    i = bisect_left(ids, record_id)
+    return i < len(ids) and ids[i] == record_id
@@ -20,22 +20,24 @@ def debug_msg(error: Enum, frame: FrameType) -> str:
     :return: str
     """
     module_name = frame.f_globals['__name__']
-    class_name = frame.f_locals['self'].__class__.__name__
+    # module-level functions have no class, and classmethods are bound to the class itself
+    owner = frame.f_locals.get('self', frame.f_locals.get('cls'))
+    class_name = None if owner is None else owner.__name__ if isinstance(owner, type) else owner.__class__.__name__
     function_name = frame.f_code.co_name
 
     msg = f'\n\tModule={repr(module_name)},' \
           f' Class={repr(class_name)},' \
           f' Func={repr(function_name)}:\n\t\t'
 
-    if error.value == Error.INDEX.VALUE:
+    if error is Error.INDEX:
         msg += index_err
-    if error.value == Error.KEY_VALUE.VALUE:
+    if error is Error.KEY_VALUE:
         msg += key_value_err
-    if error.value == Error.LOOKUP.VALUE:
+    if error is Error.LOOKUP:
         msg += lookup_err
-    if error.value == Error.TYPE.VALUE:
+    if error is Error.TYPE:
         msg += type_err
-    if error.value == Error.VALUE.VALUE:
+    if error is Error.VALUE:
         msg += value_err
 
     return msg
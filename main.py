@@ -62,6 +62,7 @@ def main():
     #   - Edges are created between each Address (Vertex) and every other (excluding itself)
     #   - Distance for each Edge is computed using a Ruler object from core.ruler
     #       + Ruler calculates distance using Haversine distance formula by default, but Vincenty can be used, as well
+    #   - Distances are cached beside the GPS file, so an unchanged file skips the distance math on later runs
     graph, addresses = io.build_graph(path=gps_data_path)
 
     # Preliminary data processing for packages, given the user's file selection
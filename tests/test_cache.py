@@ -0,0 +1,87 @@
+# STL Imports
+import builtins
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Project Imports
+import WGUPS.cli.io as io
+from WGUPS.core.cache import DistanceCache
+from WGUPS.core.ruler import Ruler
+from WGUPS.models.address import Coordinate
+from WGUPS.structures.condensed import Precision
+
+_GPS = Path(__file__).parent.parent / 'data' / 'gps' / 'gps_coords.csv'
+
+
+def _coordinates(n: int = 40) -> list[Coordinate]:
+    rng = np.random.default_rng(8)
+    lats, longs = rng.uniform(40, 41, n), rng.uniform(-112, -111, n)
+    return [Coordinate(float(lat), float(long)) for lat, long in zip(lats, longs)]
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_miss_then_hit_match_compute_matrix(tmp_path, workers: int):
+    ruler = Ruler(calc_method=Ruler.Method.Vincenty, unit=Ruler.Units.Miles)
+    coords = _coordinates()
+    cache = DistanceCache(tmp_path)
+    computed = cache.matrix(coords, ruler, workers=workers, block_rows=7)
+    cached = cache.matrix(coords, ruler)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.array_equal(computed, ruler.compute_matrix(coords))
+    assert np.array_equal(cached, computed)
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == ['.npy', '.sha256']
+
+
+def test_a_changed_ruler_replaces_the_stale_file(tmp_path):
+    coords = _coordinates()
+    cache = DistanceCache(tmp_path)
+    cache.matrix(coords, Ruler(unit=Ruler.Units.Miles))
+    cache.matrix(coords, Ruler(unit=Ruler.Units.Kilometers))
+    assert cache.misses == 2 and len(list(tmp_path.glob('*.npy'))) == 1 and len(list(tmp_path.glob('*.sha256'))) == 1
+
+
+@pytest.mark.parametrize('damage', ['flip', 'digest', 'sidecar'])
+def test_damaged_files_are_a_miss(tmp_path, damage: str):
+    ruler = Ruler(unit=Ruler.Units.Miles)
+    coords = _coordinates()
+    cache = DistanceCache(tmp_path)
+    expected = np.array(cache.matrix(coords, ruler))
+    matrix_file, sidecar = next(tmp_path.glob('*.npy')), next(tmp_path.glob('*.sha256'))
+    if damage == 'flip':
+        data = bytearray(matrix_file.read_bytes())
+        data[-100] ^= 0x01
+        matrix_file.write_bytes(bytes(data))
+    elif damage == 'digest':
+        sidecar.write_text('0' * 64, encoding='ascii')
+    else:
+        sidecar.unlink()
+    assert np.array_equal(cache.matrix(coords, ruler), expected)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@pytest.fixture
+def gps_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(builtins, 'input', lambda *_, **__: '')
+    monkeypatch.setattr(io, 'cls', lambda: None)
+    path = tmp_path / 'gps.csv'
+    shutil.copy(_GPS, path)
+    return path
+
+
+@pytest.mark.parametrize('precision', list(Precision))
+def test_condensed_builds_fill_and_reuse_the_cache(gps_copy, capsys, precision: Precision):
+    dense, addresses = io.build_graph(gps_copy, use_cache=False)
+    condensed, _ = io.build_graph(gps_copy, precision=precision)
+    assert list((gps_copy.parent / '.cache').glob('gps-*.npy'))
+    assert 'Loaded cached distances' not in capsys.readouterr().out
+    reused, _ = io.build_graph(gps_copy, precision=precision)
+    assert 'Loaded cached distances' in capsys.readouterr().out
+    uncached, _ = io.build_graph(gps_copy, use_cache=False, precision=precision)
+    tolerance = 1e-6 if precision is Precision.Float32 else 0.0
+    for graph in (condensed, reused, uncached):
+        for a in addresses:
+            for b in addresses:
+                assert graph[a][b] == pytest.approx(dense[a][b], abs=tolerance)
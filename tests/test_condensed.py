@@ -0,0 +1,54 @@
+# STL Imports
+import math
+
+import numpy as np
+import pytest
+
+# Project Imports
+from WGUPS.structures.condensed import CondensedMatrix, Precision
+
+
+def _symmetric(n: int):
+    rng = np.random.default_rng(2)
+    square = rng.uniform(0, 50, (n, n)).round(1)
+    square = np.triu(square, 1)
+    return square + square.T
+
+
+@pytest.mark.parametrize('precision', list(Precision))
+def test_round_trips_the_upper_triangle(precision: Precision):
+    square = _symmetric(9)
+    condensed = CondensedMatrix.from_square(square, precision)
+    tolerance = 1e-5 if precision is Precision.Float32 else 1e-12
+    assert np.allclose(condensed.to_square(), square, atol=tolerance)
+    assert condensed[3, 7] == condensed[7, 3] == pytest.approx(square[3, 7], abs=tolerance)
+    assert condensed[4, 4] == 0.0 and len(condensed) == 9
+
+
+def test_upper_blocks_match_from_square():
+    square = _symmetric(11)
+    condensed = CondensedMatrix(11)
+    for start in range(0, 11, 4):
+        condensed.set_upper_block(start, square[start:start + 4, start:])
+    assert np.array_equal(condensed.to_square(), square)
+    with pytest.raises(IndexError):
+        condensed.set_upper_block(2, square[2:4])
+
+
+def test_resized_keeps_positions():
+    condensed = CondensedMatrix.from_square(_symmetric(5), Precision.Tenths)
+    grown = condensed.resized(8)
+    assert all(grown[i, j] == condensed[i, j] for i in range(5) for j in range(5))
+    assert grown[2, 7] == 0.0
+
+
+@pytest.mark.parametrize('value', [math.nan, math.inf, -math.inf, -0.1, 6553.6])
+def test_tenths_reject_values_they_cannot_store(value: float):
+    condensed = CondensedMatrix(3, Precision.Tenths)
+    with pytest.raises(ValueError):
+        condensed[0, 1] = value
+    square = np.zeros((3, 3))
+    square[0, 2] = square[2, 0] = value
+    with pytest.raises(ValueError):
+        CondensedMatrix.from_square(square, Precision.Tenths)
+    assert condensed[0, 1] == 0.0
@@ -0,0 +1,64 @@
+# STL Imports
+import random
+
+import pytest
+
+# Project Imports
+from WGUPS.structures.disjointset import DisjointSet
+
+
+def test_matches_naive_partition_under_random_unions():
+    rng = random.Random(9)
+    sets: DisjointSet[int] = DisjointSet()
+    label = {i: i for i in range(200)}      # naive partition, every element labelled with its set
+    for i in range(200):
+        sets.add(i)
+    for _ in range(150):
+        a, b = rng.randrange(200), rng.randrange(200)
+        root = sets.union(a, b)
+        assert root == sets.find(a) == sets.find(b)
+        old, new = label[b], label[a]
+        for element, current in label.items():
+            if current == old:
+                label[element] = new
+    assert sets.sets == len(set(label.values()))
+    for _ in range(500):
+        a, b = rng.randrange(200), rng.randrange(200)
+        assert sets.connected(a, b) == (label[a] == label[b])
+
+
+def test_groups_follow_insertion_order():
+    sets: DisjointSet[str] = DisjointSet()
+    for element in 'abcdef':
+        sets.add(element)
+    sets.union('e', 'a')
+    sets.union('c', 'f')
+    sets.union('f', 'a')
+    assert sets.groups() == [['a', 'c', 'e', 'f'], ['b'], ['d']]
+    assert list(sets) == list('abcdef') and len(sets) == 6 and sets.sets == 3
+
+
+def test_union_adds_missing_elements():
+    sets: DisjointSet[int] = DisjointSet()
+    sets.union(1, 2)
+    assert 1 in sets and 2 in sets and sets.connected(1, 2) and sets.sets == 1
+    sets.add(1)
+    assert sets.sets == 1 and len(sets) == 2
+
+
+def test_unknown_elements():
+    sets: DisjointSet[int] = DisjointSet()
+    sets.add(1)
+    assert not sets.connected(1, 2)
+    with pytest.raises(LookupError):
+        sets.find(2)
+
+
+def test_paths_are_compressed():
+    sets: DisjointSet[int] = DisjointSet()
+    for i in range(1, 64):
+        sets.union(0, i)
+    root = sets.find(0)
+    for i in range(64):
+        sets.find(i)
+        assert sets._parent[i] == root
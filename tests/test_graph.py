@@ -0,0 +1,60 @@
+# STL Imports
+import pytest
+
+# Project Imports
+from WGUPS.structures.graph import DenseGraph, GraphOverlay
+
+
+def _pair(distance: float) -> DenseGraph:
+    graph = DenseGraph()
+    graph.add_vertex('a')
+    graph.add_vertex('b')
+    graph.add_edge('a', 'b', distance)
+    return graph
+
+
+def test_row_view_follows_copy_on_write():
+    graph = _pair(1.0)
+    row = graph['a']
+    store = graph.freeze()
+    graph.add_edge('a', 'b', 5.0)
+    assert row['b'] == 5.0
+    assert dict(row.items()) == {'b': 5.0}
+    assert store['a']['b'] == 1.0
+
+
+def test_row_view_follows_growth():
+    graph = _pair(1.0)
+    row = graph['a']
+    for i in range(40):
+        graph.add_vertex(i)
+    graph.add_edge('a', 39, 2.0)
+    assert row['b'] == 1.0
+    assert row[39] == 2.0
+    assert len(row) == 2
+
+
+def test_unknown_vertices_raise_the_same_lookup_error():
+    graph = _pair(1.0)
+    store = graph.freeze()
+    overlay = GraphOverlay(store)
+    calls = [lambda: graph.add_edge('a', 'z', 1.0), lambda: graph.remove_edge('z', 'a'), lambda: graph.degree('z'),
+             lambda: store.degree('z'), lambda: overlay.add_edge('a', 'z', 1.0), lambda: overlay.remove_edge('z', 'a')]
+    messages = set()
+    for call in calls:
+        with pytest.raises(LookupError) as raised:
+            call()
+        messages.add(str(raised.value).rsplit('\t', 1)[-1])
+    assert messages == {"Msg='Object was not found'"}
+
+
+def test_overlay_row_view_follows_overrides_and_reset():
+    store = _pair(1.0).freeze()
+    overlay = GraphOverlay(store)
+    row = overlay['a']
+    overlay.add_edge('a', 'b', 3.0)
+    assert row['b'] == 3.0 and dict(row.items()) == {'b': 3.0}
+    overlay.remove_edge('a', 'b')
+    assert row['b'] is None and len(row) == 0
+    overlay.reset()
+    assert row['b'] == 1.0 and store['a']['b'] == 1.0
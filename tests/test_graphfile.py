@@ -0,0 +1,92 @@
+# STL Imports
+import struct
+
+import numpy as np
+import pytest
+
+# Project Imports
+from WGUPS.models.address import Address, Coordinate
+from WGUPS.structures.graph import DenseGraph
+from WGUPS.structures.graphfile import GRAPH_FILE_VERSION, read_graph, write_graph
+
+
+def _addresses(n: int) -> list[Address]:
+    # cities, states and zip codes repeat, so the string table is interned
+    return [Address(f'Stop {i}', f'{i} Main St', ['Salt Lake City', 'Holladay'][i % 2], 'UT', f'841{i % 3:02}',
+                    Coordinate(40.5 + i / 1000, -111.9 - i / 1000)) for i in range(n)]
+
+
+def _distances(n: int):
+    rng = np.random.default_rng(3)
+    distances = rng.uniform(0.5, 20.0, (n, n)).round(1)
+    distances[1, 2] = np.inf    # a missing edge
+    np.fill_diagonal(distances, 0.0)
+    return distances
+
+
+def test_round_trip(tmp_path):
+    vertices, distances = _addresses(30), _distances(30)
+    path = tmp_path / 'graph.bin'
+    write_graph(path, vertices, distances)
+    read_vertices, read_distances = read_graph(path)
+    assert read_vertices == vertices
+    assert np.array_equal(read_distances, distances)
+    assert not read_distances.flags.writeable
+    assert not (tmp_path / 'graph.bin.tmp').exists()
+
+
+def test_empty_graph_round_trip(tmp_path):
+    path = tmp_path / 'graph.bin'
+    write_graph(path, [], np.zeros((0, 0)))
+    vertices, distances = read_graph(path)
+    assert vertices == [] and distances.shape == (0, 0)
+
+
+def test_dense_graph_save_and_load(tmp_path):
+    vertices = _addresses(12)
+    graph = DenseGraph.from_matrix(vertices, _distances(12))
+    path = tmp_path / 'graph.bin'
+    graph.save(path)
+    loaded = DenseGraph.load(path)
+    assert loaded.vertices == vertices
+    assert all(loaded[a][b] == graph[a][b] for a in vertices for b in vertices)
+    # the mapping is read-only, so the first edit copies it
+    loaded.add_edge(vertices[0], vertices[1], 99.0)
+    assert loaded[vertices[0]][vertices[1]] == 99.0
+    assert DenseGraph.load(path)[vertices[0]][vertices[1]] == graph[vertices[0]][vertices[1]]
+
+
+def test_write_rejects_mismatched_distances(tmp_path):
+    with pytest.raises(ValueError):
+        write_graph(tmp_path / 'graph.bin', _addresses(3), np.zeros((3, 4)))
+
+
+def _written(tmp_path) -> tuple:
+    path = tmp_path / 'graph.bin'
+    write_graph(path, _addresses(8), _distances(8))
+    return path, bytearray(path.read_bytes())
+
+
+def test_read_rejects_corruption(tmp_path):
+    path, data = _written(tmp_path)
+    data[-3] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        read_graph(path)
+    # the checksum is only skipped on request
+    vertices, distances = read_graph(path, verify=False)
+    assert len(vertices) == 8
+
+
+@pytest.mark.parametrize('tamper', [
+    lambda data: data[:20],                                     # truncated header
+    lambda data: b'NOPE' + data[4:],                            # not a graph file
+    lambda data: data[:4] + struct.pack('<H', GRAPH_FILE_VERSION + 1) + data[6:],
+    lambda data: data[:-8],                                     # truncated distances
+    lambda data: data + bytes(8),                               # trailing bytes
+], ids=['header', 'magic', 'version', 'truncated', 'trailing'])
+def test_read_rejects_malformed_files(tmp_path, tamper):
+    path, data = _written(tmp_path)
+    path.write_bytes(tamper(bytes(data)))
+    with pytest.raises(ValueError):
+        read_graph(path)
@@ -0,0 +1,105 @@
+# STL Imports
+import random
+
+# Project Imports
+from WGUPS.structures.hashtable import HashTable
+
+
+class _Colliding:
+    """A key whose hash only has a handful of values, so probe runs are long and full of tombstones"""
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 5
+
+    def __eq__(self, other):
+        return isinstance(other, _Colliding) and other.value == self.value
+
+    def __repr__(self):
+        return f'_Colliding({self.value})'
+
+
+def _assert_matches(table: HashTable, expected: dict, universe) -> None:
+    assert len(table) == len(expected)
+    assert list(table.items()) == list(expected.items())
+    assert list(table) == list(expected.values())
+    for key in universe:
+        assert table.search(key) == (key in expected)
+        assert table[key] == expected.get(key)
+
+
+def _churn(make_key, seed: int, operations: int = 4000, universe: int = 300) -> None:
+    rng = random.Random(seed)
+    keys = [make_key(i) for i in range(universe)]
+    table: HashTable = HashTable()
+    expected: dict = {}
+    migrating = 0
+    for step in range(operations):
+        key = rng.choice(keys)
+        roll = rng.random()
+        # phases of mostly inserts and mostly deletes, so the table both grows and shrinks
+        inserting = (step // 500) % 2 == 0
+        if roll < (0.7 if inserting else 0.3):
+            table[key] = expected[key] = step
+        elif key in expected:
+            del table[key]
+            del expected[key]
+        else:
+            del table[key]  # deleting a missing key is a no-op
+        migrating += table._old is not None
+        if step % 97 == 0:
+            _assert_matches(table, expected, keys)
+    _assert_matches(table, expected, keys)
+    assert migrating, 'no operation landed mid-resize'
+
+
+def test_matches_dict_with_int_keys():
+    _churn(lambda i: i, seed=1)
+
+
+def test_matches_dict_with_str_keys():
+    _churn(lambda i: f'key-{i}', seed=2)
+
+
+def test_matches_dict_with_colliding_keys():
+    _churn(_Colliding, seed=3, operations=2000, universe=120)
+
+
+def test_deletes_and_updates_mid_migration():
+    table: HashTable[int, int] = HashTable()
+    expected: dict[int, int] = {}
+    for i in range(64):
+        table[i] = expected[i] = i
+    # keep inserting until a resize starts, then delete and update keys on both sides of the cursor
+    i = 64
+    while table._old is None:
+        table[i] = expected[i] = i
+        i += 1
+    assert table._old is not None
+    for key in (0, i - 1, 1, 33):
+        del table[key]
+        del expected[key]
+        _assert_matches(table, expected, range(i + 1))
+    for key in (2, i - 2):
+        table[key] = expected[key] = -key
+    table[0] = expected[0] = 100
+    _assert_matches(table, expected, range(i + 1))
+    while table._old is not None:
+        table[i] = expected[i] = i
+        i += 1
+    _assert_matches(table, expected, range(i + 1))
+
+
+def test_clear_and_expected_size():
+    table: HashTable[str, int] = HashTable(expected=100)
+    slots = table._buckets
+    for i in range(100):
+        table[str(i)] = i
+    assert table._buckets == slots and table._old is None
+    table.clear()
+    assert len(table) == 0 and list(table.items()) == []
+    table['a'] = 1
+    assert table['a'] == 1
@@ -0,0 +1,107 @@
+# STL Imports
+import random
+
+import pytest
+
+# Project Imports
+from WGUPS.structures.heap import IndexedHeap
+
+
+def _drain(heap: IndexedHeap) -> list:
+    return [heap.pop() for _ in range(len(heap))]
+
+
+def test_heapify_and_pop_in_priority_order():
+    rng = random.Random(7)
+    items = [rng.randrange(100) for _ in range(200)]
+    heap = IndexedHeap(items)
+    assert len(heap) == 200 and heap.peek() == min(items)
+    assert _drain(heap) == sorted(items)
+    assert not heap
+
+
+def test_equal_priorities_pop_first_in_first_out():
+    heap: IndexedHeap[str] = IndexedHeap(key=len)
+    for word in ('bb', 'a', 'cc', 'd', 'ee', 'f'):
+        heap.push(word)
+    assert _drain(heap) == ['a', 'd', 'f', 'bb', 'cc', 'ee']
+
+    # explicit priorities tie the same way, including items heapified at construction
+    heap = IndexedHeap(['x', 'y'], key=lambda _: 0)
+    heap.push('z', 0)
+    assert _drain(heap) == ['x', 'y', 'z']
+
+
+def test_update_keeps_an_items_place_among_equal_priorities():
+    heap: IndexedHeap[str] = IndexedHeap()
+    a, b, c = heap.push('a', 5), heap.push('b', 1), heap.push('c', 5)
+    heap.update(b, 5)
+    # b was pushed between a and c, so it still pops between them once its priority matches theirs
+    assert _drain(heap) == ['a', 'b', 'c']
+
+
+def test_update_in_either_direction():
+    heap: IndexedHeap[int] = IndexedHeap()
+    handles = {i: heap.push(i, i) for i in range(10)}
+    heap.update(handles[9], -1)
+    heap.update(handles[0], 100)
+    assert heap.peek() == 9
+    assert _drain(heap) == [9, 1, 2, 3, 4, 5, 6, 7, 8, 0]
+
+
+def test_update_reapplies_the_key():
+    boxes = [[3], [1], [2]]
+    heap = IndexedHeap(key=lambda box: box[0])
+    handles = [heap.push(box) for box in boxes]
+    boxes[0][0] = 0
+    heap.update(handles[0])
+    assert heap.peek() is boxes[0] and handles[0].priority == 0
+
+
+def test_decrease_key():
+    heap: IndexedHeap[str] = IndexedHeap()
+    heap.push('a', 1)
+    b = heap.push('b', 5)
+    heap.decrease_key(b, 0)
+    assert heap.peek() == 'b'
+    with pytest.raises(ValueError):
+        heap.decrease_key(b, 3)
+
+
+def test_remove_from_anywhere():
+    rng = random.Random(11)
+    heap: IndexedHeap[int] = IndexedHeap()
+    handles = [heap.push(i, rng.randrange(50)) for i in range(100)]
+    removed = set(rng.sample(range(100), 40))
+    for i in removed:
+        assert heap.remove(handles[i]) == i
+        assert handles[i] not in heap
+    expected = sorted((h.priority, h.item) for h in handles if h.item not in removed)
+    assert _drain(heap) == [item for _, item in expected]
+
+
+def test_spent_and_foreign_handles_are_rejected():
+    heap: IndexedHeap[str] = IndexedHeap()
+    other: IndexedHeap[str] = IndexedHeap()
+    a = heap.push('a', 1)
+    foreign = other.push('x', 1)
+    assert foreign not in heap
+    for call in (heap.update, heap.remove):
+        with pytest.raises(LookupError):
+            call(foreign)
+    with pytest.raises(LookupError):
+        heap.decrease_key(foreign, 0)
+    heap.pop()
+    assert a not in heap
+    with pytest.raises(LookupError):
+        heap.update(a, 0)
+    cleared = other.push('y', 2)
+    other.clear()
+    assert cleared not in other and foreign not in other
+
+
+def test_empty_heap_raises():
+    heap: IndexedHeap[int] = IndexedHeap()
+    for call in (heap.pop, heap.peek, heap.peek_handle):
+        with pytest.raises(IndexError):
+            call()
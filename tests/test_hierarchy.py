@@ -0,0 +1,99 @@
+# STL Imports
+import random
+
+import numpy as np
+import pytest
+
+# Project Imports
+from WGUPS.core.hierarchy import ContractionHierarchy
+from WGUPS.core.paths import dijkstra
+from WGUPS.models.address import Address, Coordinate
+from WGUPS.structures.graph import Graph
+
+
+def _random_network(vertices: list, seed: int, edges: int) -> Graph:
+    """A sparse network, mostly two-way streets with some one-way ones, not necessarily connected"""
+    rng = random.Random(seed)
+    graph = Graph()
+    for vertex in vertices:
+        graph.add_vertex(vertex)
+    for _ in range(edges):
+        a, b = rng.sample(vertices, 2)
+        graph.add_edge(a, b, float(rng.randint(1, 20)), is_directed=rng.random() < 0.3)
+    return graph
+
+
+def _assert_matches_dijkstra(hierarchy: ContractionHierarchy, graph: Graph, vertices: list) -> None:
+    for source in vertices:
+        expected = dijkstra(graph, source)
+        for target in vertices:
+            distance = expected.distance_to(target)
+            assert hierarchy.distance(source, target) == pytest.approx(distance) if distance is not None \
+                else hierarchy.distance(source, target) is None
+            path = hierarchy.path(source, target)
+            if distance is None:
+                assert path is None
+                continue
+            # the unpacked path walks real network edges, and adds up to the shortest distance
+            assert path[0] == source and path[-1] == target
+            assert sum(graph[a][b] for a, b in zip(path, path[1:])) == pytest.approx(distance)
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_queries_match_dijkstra(seed: int):
+    vertices = list(range(40))
+    graph = _random_network(vertices, seed, edges=80)
+    _assert_matches_dijkstra(ContractionHierarchy.build(graph), graph, vertices)
+
+
+def test_small_settle_limit_only_adds_shortcuts():
+    vertices = list(range(30))
+    graph = _random_network(vertices, seed=4, edges=70)
+    _assert_matches_dijkstra(ContractionHierarchy.build(graph, settle_limit=1), graph, vertices)
+
+
+def _address(i: int) -> Address:
+    return Address(f'Stop {i}', f'{i} Main St', 'Salt Lake City', 'UT', '84101', Coordinate(40.0 + i / 100, -111.9))
+
+
+@pytest.mark.parametrize('vertices', [list(range(25)), [f'v{i}' for i in range(25)], [_address(i) for i in range(25)]],
+                         ids=['int', 'str', 'address'])
+def test_save_and_load_round_trip(tmp_path, vertices: list):
+    graph = _random_network(vertices, seed=5, edges=60)
+    hierarchy = ContractionHierarchy.build(graph)
+    path = tmp_path / 'hierarchy.npz'
+    hierarchy.save(path)
+    loaded = ContractionHierarchy.load(path)
+    assert loaded._vertices == vertices and type(loaded._vertices[0]) is type(vertices[0])
+    for source in vertices[:8]:
+        for target in vertices:
+            assert loaded.distance(source, target) == hierarchy.distance(source, target)
+            assert loaded.path(source, target) == hierarchy.path(source, target)
+
+
+def _tampered(tmp_path, **changes):
+    graph = _random_network(list(range(10)), seed=6, edges=20)
+    path = tmp_path / 'hierarchy.npz'
+    ContractionHierarchy.build(graph).save(path)
+    with np.load(path) as data:
+        arrays = dict(data)
+    for name, change in changes.items():
+        arrays[name] = change(arrays[name])
+    np.savez(path, **arrays)
+    return path
+
+
+@pytest.mark.parametrize('changes', [
+    {'version': lambda a: a + 1},
+    {'rank': lambda a: np.zeros_like(a)},
+    {'out_targets': lambda a: a + 100},
+    {'in_middles': lambda a: a - 5},
+    {'out_offsets': lambda a: a[:-1]},
+    {'out_weights': lambda a: a.astype(np.float32)},
+    {'vertex_ids': lambda a: np.array([object()] * len(a), dtype=object)},
+    {'vertex_ids': lambda a: a[:-1]},
+], ids=['version', 'rank', 'targets', 'middles', 'offsets', 'dtype', 'pickled', 'vertices'])
+def test_load_rejects_tampered_files(tmp_path, changes):
+    path = _tampered(tmp_path, **changes)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(path)
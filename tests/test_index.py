@@ -0,0 +1,64 @@
+# STL Imports
+import random
+
+# Project Imports
+from WGUPS.structures.index import HashIndex, SortedIndex
+
+
+def _random_records(seed: int, count: int = 300, keys: int = 12) -> list[tuple[int, int]]:
+    """(key, id) pairs, with repeated keys, and some repeated pairs"""
+    rng = random.Random(seed)
+    return [(rng.randrange(keys), rng.randrange(count)) for _ in range(count)]
+
+
+def test_hash_index_matches_brute_force():
+    index: HashIndex[int] = HashIndex()
+    live: set[tuple[int, int]] = set()
+    rng = random.Random(1)
+    for key, record_id in _random_records(seed=1):
+        if rng.random() < 0.7:
+            index.add(key, record_id)
+            live.add((key, record_id))
+        else:
+            index.discard(key, record_id)
+            live.discard((key, record_id))
+    for key in range(-1, 13):
+        assert index.lookup(key) == sorted(record_id for k, record_id in live if k == key)
+    assert len(index) == len({key for key, _ in live})
+
+
+def test_hash_index_forgets_emptied_keys():
+    index: HashIndex[str] = HashIndex()
+    index.add('Salt Lake City', 3)
+    index.add('Salt Lake City', 3)
+    assert index.lookup('Salt Lake City') == [3]
+    index.discard('Salt Lake City', 3)
+    index.discard('Holladay', 1)
+    assert index.lookup('Salt Lake City') == [] and len(index) == 0
+
+
+def test_hash_index_lookup_is_a_copy():
+    index: HashIndex[str] = HashIndex()
+    index.add('84115', 1)
+    index.lookup('84115').append(99)
+    assert index.lookup('84115') == [1]
+
+
+def test_sorted_index_matches_brute_force():
+    index: SortedIndex[int] = SortedIndex()
+    live: set[tuple[int, int]] = set()
+    rng = random.Random(2)
+    for key, record_id in _random_records(seed=2):
+        if rng.random() < 0.7:
+            index.add(key, record_id)
+            live.add((key, record_id))
+        else:
+            index.discard(key, record_id)
+            live.discard((key, record_id))
+    assert list(index) == [record_id for _, record_id in sorted(live)]
+    assert len(index) == len(live)
+    for key in range(-1, 13):
+        assert index.lookup(key) == sorted(record_id for k, record_id in live if k == key)
+    for low in range(-1, 13):
+        for high in range(low - 1, 14):
+            assert index.between(low, high) == [record_id for k, record_id in sorted(live) if low <= k <= high]
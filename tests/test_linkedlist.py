@@ -0,0 +1,77 @@
+# STL Imports
+import pytest
+
+# Project Imports
+from WGUPS.structures.linkedlist import LinkedList, NodePool
+
+
+def _filled(*items, pool: NodePool = None) -> LinkedList:
+    linked = LinkedList(pool=pool)
+    for item in items:
+        linked.append(item)
+    return linked
+
+
+def test_append_prepend_and_insert_keep_order():
+    linked = _filled('b', 'd')
+    linked.prepend('a')
+    linked.insert_before('c', linked.node(2))
+    linked.insert_after('e', linked.tail)
+    assert linked.to_list() == ['a', 'b', 'c', 'd', 'e']
+    assert [node.data for node in reversed(linked)] == ['e', 'd', 'c', 'b', 'a']
+    assert len(linked) == 5 and linked.head.data == 'a' and linked.tail.data == 'e'
+
+
+def test_remove_by_node_index_and_item():
+    c = object()
+    linked = _filled('a', 'b', c, 'd')
+    middle = linked.node(1)
+    assert linked.remove(middle) == 'b'
+    assert linked.remove(0) == 'a'
+    assert linked.remove(c) is True
+    assert linked.remove(c) is False
+    assert linked.to_list() == ['d'] and len(linked) == 1
+    assert linked.remove_last() == 'd'
+    assert linked.is_empty() and linked.head is None and linked.tail is None
+
+
+def test_removing_a_node_of_another_list_is_rejected():
+    x, y = _filled('x'), _filled('y')
+    node = x.head
+    with pytest.raises(LookupError):
+        y.remove(node)
+    with pytest.raises(LookupError):
+        y.insert_after('z', node)
+    assert x.to_list() == ['x'] and len(x) == 1
+    assert y.to_list() == ['y'] and len(y) == 1
+
+
+def test_removing_a_node_twice_is_rejected():
+    linked = _filled('a', 'b')
+    node = linked.head
+    linked.remove(node)
+    with pytest.raises(LookupError):
+        linked.remove(node)
+    assert linked.to_list() == ['b'] and len(linked) == 1
+
+
+def test_pooled_nodes_are_reused_and_released():
+    pool = NodePool()
+    x = _filled('a', 'b', pool=pool)
+    removed = x.head
+    x.remove(removed)
+    assert len(pool) == 1 and removed.owner is None
+    y = _filled('c', pool=pool)
+    assert y.head is removed and len(pool) == 0
+    with pytest.raises(LookupError):
+        x.remove(y.head)
+    x.clear()
+    assert len(pool) == 1 and x.is_empty() and y.to_list() == ['c']
+
+
+def test_empty_list_and_bad_index_raise():
+    linked = LinkedList()
+    with pytest.raises(IndexError):
+        linked.remove_first()
+    with pytest.raises(IndexError):
+        linked.node(0)
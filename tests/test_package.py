@@ -0,0 +1,27 @@
+# STL Imports
+import datetime
+
+# Project Imports
+from WGUPS.models.address import Address, Coordinate
+from WGUPS.models.package import Package, PackageConstraints, PackageStatus, parse_notes
+
+
+def _package(package_id: int, constraints: PackageConstraints = None) -> Package:
+    address = Address('hub', '4001 South 700 East', 'Salt Lake City', 'UT', '84107', Coordinate(40.685, -111.870))
+    deadline = datetime.datetime(2026, 1, 1, 17, 0)
+    return Package(package_id, address, 1.0, '', PackageStatus.Hub, deadline, None, constraints=constraints)
+
+
+def test_constraints_are_left_out_of_comparisons():
+    """PackageConstraints has no ordering, so two packages alike in every other field must still compare"""
+    a = _package(1, PackageConstraints(truck=1))
+    b = _package(1, PackageConstraints(truck=2))
+    assert a == b
+    assert not a < b and a <= b
+    assert sorted([b, a]) == [b, a]
+
+
+def test_constraints_are_parsed_and_hidden_from_repr():
+    package = _package(2)
+    assert package.constraints == parse_notes('', package._deadline)
+    assert 'constraints' not in repr(package)
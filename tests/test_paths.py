@@ -0,0 +1,66 @@
+# STL Imports
+import itertools
+
+# Project Imports
+from WGUPS.core.paths import astar, dijkstra, haversine_heuristic
+from WGUPS.core.ruler import Ruler
+from WGUPS.models.address import Address, Coordinate
+from WGUPS.structures.graph import Graph
+
+# north-south legs along the equator are where the ellipsoid is flattest, and Haversine overshoots the most
+_LATITUDES = [-5.0, -2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 2.0, 5.0]
+_LONGITUDES = [0.0, 0.25]
+
+
+def _address(lat: float, long: float) -> Address:
+    name = f'{lat},{long}'
+    return Address(name, name, '', '', '', Coordinate(lat, long))
+
+
+def _vincenty(a: Address, b: Address) -> float:
+    return Ruler._vincenty(a.coordinate, b.coordinate)
+
+
+def _ladder() -> tuple[Graph, list[Address]]:
+    """Two meridians, joined only at their ends, so the shortest paths run along the north-south legs"""
+    graph = Graph()
+    rails = [[_address(lat, long) for lat in _LATITUDES] for long in _LONGITUDES]
+    for rail in rails:
+        for vertex in rail:
+            graph.add_vertex(vertex)
+        for a, b in zip(rail, rail[1:]):
+            graph.add_edge(a, b, _vincenty(a, b))
+    for i in (0, -1):
+        a, b = rails[0][i], rails[1][i]
+        graph.add_edge(a, b, _vincenty(a, b))
+    return graph, [vertex for rail in rails for vertex in rail]
+
+
+def test_heuristic_never_exceeds_vincenty_on_equatorial_legs():
+    heuristic = haversine_heuristic(Ruler.Units.Meters)
+    for lat_a, lat_b in itertools.combinations(_LATITUDES, 2):
+        a, b = _address(lat_a, 0.0), _address(lat_b, 0.0)
+        assert heuristic(a, b) <= _vincenty(a, b)
+
+
+def test_astar_matches_dijkstra_on_equatorial_legs():
+    graph, vertices = _ladder()
+    heuristic = haversine_heuristic(Ruler.Units.Meters)
+    for source, target in itertools.permutations(vertices, 2):
+        expected = dijkstra(graph, source).distance_to(target)
+        found = astar(graph, source, [target], heuristic=heuristic)
+        assert found.distance_to(target) == expected
+        assert found.path_to(target) == dijkstra(graph, source).path_to(target)
+
+
+def test_astar_takes_tuple_vertices_whole():
+    """A vertex that is itself a tuple, such as a (lat, long) pair, is one target, not one per component"""
+    graph = Graph()
+    a, b, c = (0.0, 0.0), (0.0, 1.0), (1.0, 1.0)
+    for vertex in (a, b, c):
+        graph.add_vertex(vertex)
+    graph.add_edge(a, b, 1.0)
+    graph.add_edge(b, c, 1.0)
+    found = astar(graph, a, [c], heuristic=lambda _u, _v: 0.0)
+    assert found.distance_to(c) == 2.0
+    assert found.path_to(c) == [a, b, c]
@@ -0,0 +1,88 @@
+# STL Imports
+import bisect
+import random
+
+# Project Imports
+from WGUPS.structures.skiplist import SkipList
+
+
+def _reference_floor(keys: list, key):
+    i = bisect.bisect_right(keys, key)
+    return keys[i - 1] if i else None
+
+
+def _reference_ceiling(keys: list, key):
+    i = bisect.bisect_left(keys, key)
+    return keys[i] if i < len(keys) else None
+
+
+def test_matches_sorted_dict_under_random_operations():
+    rng = random.Random(5)
+    skiplist: SkipList[int, int] = SkipList(seed=1)
+    expected: dict[int, int] = {}
+    for step in range(3000):
+        key = rng.randrange(0, 400, 2)     # even keys only, so odd probes always fall between keys
+        if rng.random() < 0.6:
+            skiplist[key] = expected[key] = step
+        else:
+            del skiplist[key]
+            expected.pop(key, None)
+    keys = sorted(expected)
+    assert len(skiplist) == len(expected)
+    assert list(skiplist.items()) == [(key, expected[key]) for key in keys]
+    assert list(skiplist) == [expected[key] for key in keys]
+    assert skiplist.first() == (keys[0], expected[keys[0]])
+    assert skiplist.last() == (keys[-1], expected[keys[-1]])
+    for probe in range(-1, 402):
+        assert skiplist.search(probe) == (probe in expected)
+        assert skiplist[probe] == expected.get(probe)
+        floor, ceiling = _reference_floor(keys, probe), _reference_ceiling(keys, probe)
+        assert skiplist.floor(probe) == (None if floor is None else (floor, expected[floor]))
+        assert skiplist.ceiling(probe) == (None if ceiling is None else (ceiling, expected[ceiling]))
+
+
+def test_range_bounds_are_inclusive_and_optional():
+    skiplist: SkipList[int, str] = SkipList(seed=2)
+    for key in (10, 20, 30, 40):
+        skiplist[key] = str(key)
+    assert [k for k, _ in skiplist.range(20, 30)] == [20, 30]
+    assert [k for k, _ in skiplist.range(15, 35)] == [20, 30]
+    assert [k for k, _ in skiplist.range(high=20)] == [10, 20]
+    assert [k for k, _ in skiplist.range(low=35)] == [40]
+    assert [k for k, _ in skiplist.range()] == [10, 20, 30, 40]
+    assert list(skiplist.range(41, 50)) == [] and list(skiplist.range(30, 20)) == []
+
+
+def test_tuple_keys_order_ties_by_their_second_element():
+    skiplist: SkipList[tuple[int, int], str] = SkipList(seed=3)
+    skiplist[(8, 1)] = 'b'
+    skiplist[(8, 0)] = 'a'
+    skiplist[(9, 0)] = 'c'
+    assert list(skiplist) == ['a', 'b', 'c']
+    assert [v for _, v in skiplist.range(high=(8, float('inf')))] == ['a', 'b']
+
+
+def test_empty_and_cleared_lists():
+    skiplist: SkipList[int, int] = SkipList()
+    assert skiplist.first() is None and skiplist.last() is None
+    assert skiplist.floor(1) is None and skiplist.ceiling(1) is None
+    for key in range(100):
+        skiplist[key] = key
+    skiplist.clear()
+    assert len(skiplist) == 0 and list(skiplist.items()) == []
+    skiplist[1] = 1
+    assert skiplist.floor(5) == (1, 1)
+
+
+def test_same_seed_builds_the_same_shape():
+    def shape(seed: int) -> list[int]:
+        skiplist: SkipList[int, int] = SkipList(seed=seed)
+        for key in range(200):
+            skiplist[key] = key
+        node, levels = skiplist._head.forward[0], []
+        while node is not None:
+            levels.append(len(node.forward))
+            node = node.forward[0]
+        return levels
+
+    assert shape(4) == shape(4)
@@ -0,0 +1,76 @@
+# STL Imports
+import random
+
+# Project Imports
+from WGUPS.structures.textindex import TextIndex, normalize
+
+_STREETS = [
+    '195 W Oakland Ave', '2530 S 500 E', '233 Canyon Rd', '380 W 2880 S', '410 S State St', '3060 Lester St',
+    '1330 2100 S', '300 State St', '600 E 900 South', '2600 Taylorsville Blvd', '3575 W Valley Central Station',
+    '2010 W 500 S', '4300 S 1300 E', '4580 S 2300 E', '3148 S 1100 W', '1488 4800 S', '177 W Price Ave',
+]
+_QUERIES = ['', 's', 'st', 'state', 'State St', '500', ' 500  e', 'w', 'ave', 'xyz', '2', '00 s', 'oakland ave']
+
+
+def _filled() -> TextIndex:
+    index = TextIndex()
+    for record_id, street in enumerate(_STREETS):
+        index.add(street, record_id)
+    return index
+
+
+def _brute_prefix(texts: dict[int, str], query: str) -> list[int]:
+    return sorted(i for i, text in texts.items() if normalize(text).startswith(normalize(query)))
+
+
+def _brute_contains(texts: dict[int, str], query: str) -> list[int]:
+    return sorted(i for i, text in texts.items() if normalize(query) in normalize(text))
+
+
+def test_prefix_and_contains_match_brute_force():
+    index = _filled()
+    texts = dict(enumerate(_STREETS))
+    for query in _QUERIES:
+        assert list(index.prefix(query)) == _brute_prefix(texts, query), query
+        assert list(index.contains(query)) == _brute_contains(texts, query), query
+
+
+def test_limit_stops_early():
+    index = _filled()
+    assert list(index.contains('s', limit=3)) == _brute_contains(dict(enumerate(_STREETS)), 's')[:3]
+    assert list(index.prefix('', limit=2)) == [0, 1]
+
+
+def test_normalize_folds_case_and_whitespace():
+    assert normalize('  410 s\tState   St ') == '410 s state st'
+    index = TextIndex()
+    index.add('410 S State St', 9)
+    assert list(index.prefix('410 S STATE')) == [9]
+    assert list(index.contains('s  state')) == [9]
+
+
+def test_readding_and_discarding_matches_brute_force():
+    rng = random.Random(4)
+    index = TextIndex()
+    texts: dict[int, str] = {}
+    for _ in range(400):
+        record_id = rng.randrange(30)
+        if rng.random() < 0.6:
+            # re-adding a record moves it to its new text
+            texts[record_id] = rng.choice(_STREETS)
+            index.add(texts[record_id], record_id)
+        else:
+            texts.pop(record_id, None)
+            index.discard(record_id)
+    assert len(index) == len(texts)
+    for query in _QUERIES:
+        assert list(index.prefix(query)) == _brute_prefix(texts, query), query
+        assert list(index.contains(query)) == _brute_contains(texts, query), query
+
+
+def test_discarding_every_record_prunes_the_index():
+    index = _filled()
+    for record_id in range(len(_STREETS)):
+        index.discard(record_id)
+    assert len(index) == 0 and not index._root.children and len(index._grams) == 0
+    assert list(index.contains('state')) == [] and list(index.prefix('4')) == []